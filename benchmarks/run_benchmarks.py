@@ -0,0 +1,385 @@
+"""
+Benchmarks every registered calculator in single, batch and cached modes.
+
+Modes:
+    single  One scalar call per row. Network-backed calculators go to the (stubbed)
+            source on every call: an uncached YFinanceProvider and a RateStore with ttl=0.
+    batch   One call to the columnar batch implementation (calculators with a batch path).
+    cached  Scalar calls against warm caches: CachedProvider for stock_beta_calculator,
+            a long-lived RateStore for currency_converter, and memoize() for the pure
+            calculators, with rows drawn from CACHED_DISTINCT_ROWS distinct inputs.
+
+yfinance and forex-python are replaced by the stubs in stubs.py, so the suite runs
+offline and deterministically. Throughput is measured with perf_counter (best of
+--repeat runs); peak memory is measured in a separate tracemalloc pass (for scalar
+modes, over one chunk of up to 1,000 calls). Single and
+cached runs stop after --budget seconds, in which case the throughput is computed
+over the rows actually processed and the result is marked as truncated.
+
+Results are written as JSON to --output (benchmarks/results.json by default). When a
+baseline file exists (--baseline, benchmarks/baseline.json by default), every case is
+compared with it and cases whose rows/second dropped by more than --tolerance are
+reported as regressions (exit status 1).
+
+Throughput depends on the machine, so no baseline is shipped. Record one on the
+machine that runs the comparison, with the same options, before making changes:
+
+    python benchmarks/run_benchmarks.py --sizes 1,10000 --save-baseline   # writes benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --sizes 1,10000                   # compares against it
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1,10000 --modes batch --save-baseline
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# stubs.py sits next to this script and the package one level up, wherever it is run from.
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+import stubs  # noqa: E402
+from tradingcalculators import (  # noqa: E402
+    NETWORK_CALCULATORS, available_calculators, get_batch_calculator, get_calculator, has_batch,
+)
+from tradingcalculators.memoize import memoize  # noqa: E402
+DEFAULT_SIZES = (1, 10_000, 1_000_000)
+MODES = ("single", "batch", "cached")
+CHUNK_ROWS = 1_000
+MIN_ROWS_TIMED = 1_000
+CACHED_DISTINCT_ROWS = 1_000
+
+
+def _uniform(rng, rows, low, high):
+    return rng.uniform(low, high, rows).round(2)
+
+
+def _integers(rng, rows, low, high):
+    return rng.integers(low, high + 1, rows)
+
+
+def _allocations(rng, rows):
+    assets = ("Stocks", "Bonds", "Gold", "Cash")
+    current = rng.uniform(0, 10_000, (rows, len(assets))).round(2)
+    weights = rng.dirichlet(np.ones(len(assets)), rows)
+    weights = np.floor(weights * 100)
+    weights[:, 0] += 100 - weights.sum(axis=1)
+    current = np.array([dict(zip(assets, row)) for row in current.tolist()], dtype=object)
+    target = np.array([dict(zip(assets, row)) for row in weights.tolist()], dtype=object)
+    return current, target
+
+
+def make_columns(name, rows, rng):
+    """
+    Returns realistic input columns for ``name`` with ``rows`` rows.
+    """
+    u = lambda low, high: _uniform(rng, rows, low, high)  # noqa: E731
+    i = lambda low, high: _integers(rng, rows, low, high)  # noqa: E731
+    choice = lambda values: rng.choice(np.array(values), rows)  # noqa: E731
+
+    if name == "annualized_return_calculator":
+        return {"initial_investment": u(1_000, 100_000), "final_value": u(1_000, 300_000), "years": i(1, 30)}
+    if name == "capital_gains_tax_calculator":
+        return {"purchase_price": u(10, 500), "sale_price": u(10, 500), "quantity": i(1, 1_000),
+                "holding_period": i(0, 5)}
+    if name == "currency_converter":
+        return {"amount": u(1, 100_000), "base_currency": choice(stubs.CURRENCIES),
+                "target_currency": choice(stubs.CURRENCIES)}
+    if name == "debt_to_income_ratio_calculator":
+        return {"monthly_debt_payments": u(0, 5_000), "monthly_income": u(1_000, 20_000)}
+    if name == "dividend_yield_calculator":
+        return {"annual_dividend": u(0, 10), "stock_price": u(5, 500)}
+    if name == "expected_rate_of_return_calculator":
+        return {"initial_investment": u(1_000, 100_000), "future_value": u(1_000, 300_000), "years": i(1, 30)}
+    if name == "fixed_deposit_interest_calculator":
+        return {"principal": u(1_000, 1_000_000), "rate_of_interest": u(2, 9), "years": i(1, 10),
+                "compounds_per_year": choice((1, 4, 12))}
+    if name == "future_value_calculator":
+        return {"initial_investment": u(1_000, 100_000), "rate_of_return": u(0, 15), "years": i(0, 40)}
+    if name == "inflation_impact_calculator":
+        return {"current_amount": u(1_000, 100_000), "inflation_rate": u(0, 10), "years": i(0, 40)}
+    if name == "investment_return_calculator":
+        return {"initial_investment": u(1_000, 100_000), "annual_contribution": u(0, 20_000),
+                "rate_of_return": u(0, 15), "years": i(0, 40)}
+    if name == "loan_emi_calculator":
+        return {"loan_amount": u(10_000, 1_000_000), "interest_rate": u(0, 15), "loan_tenure": i(1, 30)}
+    if name == "portfolio_rebalancing_calculator":
+        current, target = _allocations(rng, rows)
+        return {"current_allocations": current, "target_allocations": target}
+    if name == "position_size_calculator":
+        entry = u(10, 500)
+        return {"account_size": u(1_000, 1_000_000), "risk_percentage": u(0.5, 3), "entry_price": entry,
+                "stop_loss_price": (entry * rng.uniform(0.85, 0.99, rows)).round(2)}
+    if name == "profit_loss_calculator":
+        return {"entry_price": u(10, 500), "exit_price": u(10, 500), "quantity": u(1, 1_000),
+                "side": choice(("long", "short"))}
+    if name == "real_estate_dcf":
+        return {"property_value": u(100_000, 2_000_000), "annual_rental_income": u(5_000, 150_000),
+                "annual_expenses": u(1_000, 50_000), "rent_growth": u(0, 5), "expense_growth": u(0, 4),
+                "vacancy_rate": u(0, 10), "appreciation_rate": u(0, 6), "holding_years": i(5, 15),
+                "down_payment": u(20, 40), "interest_rate": u(4, 9), "loan_tenure": choice((15, 20, 30)),
+                "closing_costs": u(1, 3), "selling_costs": u(4, 7)}
+    if name == "real_estate_investment_calculator":
+        return {"property_value": u(100_000, 2_000_000), "annual_rental_income": u(5_000, 150_000),
+                "annual_expenses": u(1_000, 50_000)}
+    if name == "roi_calculator":
+        return {"initial_investment": u(1_000, 100_000), "final_value": u(0, 300_000)}
+    if name == "sip_calculator":
+        return {"monthly_investment": u(500, 50_000), "rate_of_return": u(0, 15), "years": i(0, 40)}
+    if name == "stock_beta_calculator":
+        return {"stock_ticker": choice(stubs.TICKERS), "market_ticker": np.full(rows, stubs.MARKET_TICKER),
+                "period": np.full(rows, "1y")}
+    raise KeyError(f"No input generator for {name!r}")
+
+
+def _extra_inputs(name, mode, context):
+    if name == "currency_converter":
+        return {"rate_store": context["warm_store" if mode == "cached" else "cold_store"]}
+    if name == "stock_beta_calculator":
+        return {"provider": context["warm_provider" if mode == "cached" else "cold_provider"]}
+    return {}
+
+
+def _row_chunks(columns, rows, extra):
+    names = list(columns)
+    for start in range(0, rows, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, rows)
+        values = [columns[field][start:stop].tolist() for field in names]
+        chunk = [dict(zip(names, row)) for row in zip(*values)]
+        if extra:
+            for inputs in chunk:
+                inputs.update(extra)
+        yield chunk
+
+
+def _time_scalar(calculator, columns, rows, extra, budget):
+    """
+    Calls the scalar calculator once per row. Returns (seconds, rows processed).
+    """
+    elapsed = 0.0
+    done = 0
+    for chunk in _row_chunks(columns, rows, extra):
+        start = time.perf_counter()
+        _call_each(calculator, chunk)
+        elapsed += time.perf_counter() - start
+        done += len(chunk)
+        if elapsed > budget:
+            break
+    return elapsed, done
+
+
+def _call_each(calculator, chunk):
+    for inputs in chunk:
+        calculator(inputs)
+
+
+def _time_batch(batch, columns, extra):
+    start = time.perf_counter()
+    batch(columns, **extra)
+    return time.perf_counter() - start
+
+
+def _peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(name, mode, rows, context, options):
+    """
+    Runs one (calculator, mode, rows) case and returns its result record, or None
+    when the calculator does not support the mode.
+    """
+    if mode == "batch" and not has_batch(name):
+        return None
+    columns = make_columns(name, rows, np.random.default_rng(rows))
+    if mode == "cached" and name not in NETWORK_CALCULATORS:
+        # Repeat a pool of distinct rows, as repeated requests would.
+        columns = {field: np.resize(values[:CACHED_DISTINCT_ROWS], (rows,) + values.shape[1:])
+                   for field, values in columns.items()}
+    extra = _extra_inputs(name, mode, context)
+    # Tiny cases are repeated until about MIN_ROWS_TIMED rows have run, so their best-of is stable.
+    repeat = max(options.repeat, -(-MIN_ROWS_TIMED // rows))
+
+    if mode == "batch":
+        batch = get_batch_calculator(name)
+        extra = {"rate_store": extra["rate_store"]} if extra else {}
+        timings = [_time_batch(batch, columns, extra) for _ in range(repeat)]
+        seconds, processed, calls = min(timings), rows, 1
+        memory = None if options.no_memory else _peak_memory(lambda: batch(columns, **extra))
+    else:
+        calculator = get_calculator(name)
+        if mode == "cached" and name not in NETWORK_CALCULATORS:
+            calculator = memoize(calculator, maxsize=CACHED_DISTINCT_ROWS)
+        if mode == "cached":
+            # Warm the caches outside the timed runs.
+            _time_scalar(calculator, columns, min(rows, 1_000), extra, options.budget)
+        runs = []
+        spent = 0.0
+        for _ in range(repeat):
+            elapsed, processed = _time_scalar(calculator, columns, rows, extra, options.budget)
+            runs.append((elapsed / processed, processed))
+            spent += elapsed
+            if spent > options.budget:
+                break
+        per_row, processed = min(runs)
+        seconds, calls = per_row * processed, processed
+        memory = None
+        if not options.no_memory:
+            # Row dicts are built before tracing starts, so only the calls are measured.
+            chunk = next(_row_chunks(columns, min(processed, CHUNK_ROWS), extra))
+            memory = _peak_memory(lambda: _call_each(calculator, chunk))
+
+    return {
+        "calculator": name,
+        "mode": mode,
+        "rows": rows,
+        "rows_timed": processed,
+        "truncated": processed < rows,
+        "seconds": seconds,
+        "rows_per_second": processed / seconds if seconds else float("inf"),
+        "calls_per_second": calls / seconds if seconds else float("inf"),
+        "peak_memory_bytes": memory,
+    }
+
+
+def _context(cache_dir):
+    from tradingcalculators.price_history import CachedProvider, YFinanceProvider
+    from tradingcalculators.rate_store import ForexPythonSource, RateStore
+
+    return {
+        "cold_store": RateStore(ForexPythonSource(), ttl=0),
+        "warm_store": RateStore(ForexPythonSource()),
+        "cold_provider": YFinanceProvider(),
+        "warm_provider": CachedProvider(YFinanceProvider(), cache_dir=cache_dir),
+    }
+
+
+def _metadata():
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Returns the cases whose rows/second fell by more than ``tolerance`` (a fraction)
+    relative to the baseline.
+    """
+    previous = {(r["calculator"], r["mode"], r["rows"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        before = previous.get((result["calculator"], result["mode"], result["rows"]))
+        if before is None or not before["rows_per_second"]:
+            continue
+        change = result["rows_per_second"] / before["rows_per_second"] - 1
+        if change < -tolerance:
+            regressions.append(dict(result, baseline_rows_per_second=before["rows_per_second"], change=change))
+    return regressions
+
+
+def _format_memory(value):
+    if value is None:
+        return "-"
+    return f"{value / 1024 / 1024:.1f} MiB" if value >= 1024 * 1024 else f"{value / 1024:.1f} KiB"
+
+
+def _print_header():
+    print(f"{'calculator':<38} {'mode':<7} {'rows':>9} {'rows/s':>14} {'calls/s':>12} {'peak mem':>11}")
+
+
+def _print_row(r):
+    flag = " (truncated)" if r["truncated"] else ""
+    print(f"{r['calculator']:<38} {r['mode']:<7} {r['rows']:>9} {r['rows_per_second']:>14,.0f} "
+          f"{r['calls_per_second']:>12,.1f} {_format_memory(r['peak_memory_bytes']):>11}{flag}", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="Comma-separated row counts (default: 1,10000,1000000).")
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes to run.")
+    parser.add_argument("--calculators", default="", help="Comma-separated calculator names (default: all).")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is kept.")
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="Seconds after which single/cached runs stop early.")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Simulated network latency per stubbed request, in milliseconds.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--output", default=os.path.join(HERE, "results.json"))
+    parser.add_argument("--baseline", default=os.path.join(HERE, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed drop in rows/second before a case counts as a regression.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    stubs.install(latency=options.latency / 1000)
+    sizes = [int(size) for size in options.sizes.split(",") if size]
+    modes = [mode for mode in options.modes.split(",") if mode]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        raise SystemExit(f"Unknown modes: {', '.join(sorted(unknown))}")
+    names = [name for name in options.calculators.split(",") if name] or available_calculators()
+
+    results = []
+    _print_header()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        context = _context(cache_dir)
+        for name in names:
+            for mode in modes:
+                for rows in sizes:
+                    result = run_case(name, mode, rows, context, options)
+                    if result is not None:
+                        results.append(result)
+                        _print_row(result)
+
+    report = {"meta": _metadata(), "results": results}
+    with open(options.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {options.output}")
+
+    status = 0
+    if os.path.exists(options.baseline) and not options.save_baseline:
+        with open(options.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), options.tolerance)
+        if regressions:
+            status = 1
+            print(f"\n{len(regressions)} regression(s) against {options.baseline}:")
+            for r in regressions:
+                print(f"  {r['calculator']} {r['mode']} rows={r['rows']}: "
+                      f"{r['rows_per_second']:,.0f} rows/s vs {r['baseline_rows_per_second']:,.0f} "
+                      f"({r['change']:+.0%})")
+        else:
+            print(f"No regressions against {options.baseline} (tolerance {options.tolerance:.0%}).")
+    elif not options.save_baseline:
+        print(f"No baseline at {options.baseline}; run with --save-baseline to record one.")
+
+    if options.save_baseline:
+        with open(options.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {options.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
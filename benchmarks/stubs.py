@@ -0,0 +1,97 @@
+"""
+Offline stand-ins for yfinance and forex-python.
+
+install() registers fake ``yfinance`` and ``forex_python.converter`` modules in
+sys.modules, so the package's real adapters (price_history.YFinanceProvider and
+rate_store.ForexPythonSource) run unchanged against deterministic synthetic data.
+An optional latency emulates the network round trip of each request.
+"""
+import sys
+import time
+import types
+
+import numpy as np
+import pandas as pd
+
+MARKET_TICKER = "^GSPC"
+TICKERS = tuple(f"STK{i:03d}" for i in range(100))
+CURRENCIES = ("USD", "EUR", "GBP", "INR", "JPY", "AUD", "CAD", "CHF", "CNY", "SGD")
+
+_PERIOD_DAYS = {"1mo": 21, "3mo": 63, "6mo": 126, "1y": 252, "2y": 504, "5y": 1260}
+
+
+class _Stats:
+    latency = 0.0
+    downloads = 0
+    rate_requests = 0
+
+
+stats = _Stats()
+
+
+def _prices(period):
+    days = _PERIOD_DAYS.get(period, 252)
+    index = pd.bdate_range(end="2024-12-31", periods=days)
+    rng = np.random.default_rng(0)
+    market = rng.normal(0.0004, 0.01, days)
+    columns = {MARKET_TICKER: market}
+    betas = np.linspace(0.3, 2.0, len(TICKERS))
+    for ticker, beta in zip(TICKERS, betas):
+        columns[ticker] = beta * market + rng.normal(0, 0.012, days)
+    returns = pd.DataFrame(columns, index=index)
+    return 100 * (1 + returns).cumprod()
+
+
+_cache = {}
+
+
+def download(tickers, period="1y", progress=False, **kwargs):
+    """
+    yfinance.download() replacement returning a frame with a 'Close' column group.
+    """
+    stats.downloads += 1
+    if stats.latency:
+        time.sleep(stats.latency)
+    if period not in _cache:
+        _cache[period] = _prices(period)
+    tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+    closes = _cache[period][[ticker for ticker in tickers if ticker in _cache[period].columns]]
+    closes = closes.reindex(columns=tickers)
+    return pd.concat({"Close": closes}, axis=1)
+
+
+_RATES = {"USD": 1.0, "EUR": 0.92, "GBP": 0.79, "INR": 83.1, "JPY": 151.2,
+          "AUD": 1.52, "CAD": 1.36, "CHF": 0.88, "CNY": 7.23, "SGD": 1.34}
+
+
+class CurrencyRates:
+    def get_rates(self, base):
+        stats.rate_requests += 1
+        if stats.latency:
+            time.sleep(stats.latency)
+        pivot = _RATES[base]
+        return {code: rate / pivot for code, rate in _RATES.items() if code != base}
+
+
+class CurrencyCodes:
+    _symbols = {"USD": "$", "EUR": "€", "GBP": "£", "INR": "₹", "JPY": "¥"}
+
+    def get_symbol(self, code):
+        return self._symbols.get(code)
+
+
+def install(latency=0.0):
+    """
+    Registers the stub modules. ``latency`` (seconds) is added to every request.
+    """
+    stats.latency = latency
+    yfinance = types.ModuleType("yfinance")
+    yfinance.download = download
+    forex_python = types.ModuleType("forex_python")
+    converter = types.ModuleType("forex_python.converter")
+    converter.CurrencyRates = CurrencyRates
+    converter.CurrencyCodes = CurrencyCodes
+    forex_python.converter = converter
+    sys.modules["yfinance"] = yfinance
+    sys.modules["forex_python"] = forex_python
+    sys.modules["forex_python.converter"] = converter
@@ -0,0 +1,195 @@
+"""
+Trading and personal-finance calculators.
+
+Every calculator is a plain function that takes an ``inputs`` dict and returns a
+result dict (or ``{"error": ...}``). Calculators are registered by name and only
+imported on first use, so importing the package never pulls in heavy optional
+dependencies (numpy, yfinance, forex-python) or touches the network.
+
+Example:
+    from tradingcalculators import get_calculator
+
+    sip = get_calculator("sip_calculator")
+    sip({"monthly_investment": 2000, "rate_of_return": 12, "years": 10})
+
+Several calculators also have columnar batch versions (see ``batch``),
+looked up with ``get_batch_calculator`` under the same names. ``run_batch``
+returns their output as a column-backed ``results.RecordArray``.
+
+Call counts, phase latencies and error counts are collected while
+``instrumentation`` is enabled (see that module).
+"""
+import importlib
+import os
+import threading
+
+from . import instrumentation
+
+# Calculator name -> "module:attribute", resolved lazily by get_calculator().
+CALCULATORS = {
+    "annualized_return_calculator": "annualized_return_calculator:annualized_return_calculator",
+    "capital_gains_tax_calculator": "capital_gains_tax_calculator:capital_gains_tax_calculator",
+    "currency_converter": "currency_converter:currency_converter",
+    "debt_to_income_ratio_calculator": "debt_to_income_ratio_calculator:debt_to_income_ratio_calculator",
+    "dividend_yield_calculator": "dividend_yield_calculator:dividend_yield_calculator",
+    "expected_rate_of_return_calculator": "expected_rate_of_return_calculator:expected_rate_of_return_calculator",
+    "fixed_deposit_interest_calculator": "fixed_deposit_interest_calculator:fixed_deposit_interest_calculator",
+    "future_value_calculator": "future_value_calculator:future_value_calculator",
+    "inflation_impact_calculator": "inflation_impact_calculator:inflation_impact_calculator",
+    "investment_return_calculator": "investment_return_calculator:investment_return_calculator",
+    "loan_emi_calculator": "loan_emi_calculator:loan_emi_calculator",
+    "portfolio_rebalancing_calculator": "portfolio_rebalancing_calculator:portfolio_rebalancing_calculator",
+    "position_size_calculator": "position_size_calculator:position_size_calculator",
+    "profit_loss_calculator": "profit_loss_calculator:profit_loss_calculator",
+    "real_estate_dcf": "real_estate_dcf:real_estate_dcf",
+    "real_estate_investment_calculator": "real_estate_investment_calculator:real_estate_investment_calculator",
+    "roi_calculator": "roi_calculator:roi_calculator",
+    "sip_calculator": "sip_calculator:sip_calculator",
+    "stock_beta_calculator": "stock_beta_calculator:stock_beta_calculator",
+}
+
+# Calculator name -> columnar batch implementation (requires numpy).
+BATCH_CALCULATORS = {
+    "currency_converter": "batch:currency_converter_batch",
+    "fixed_deposit_interest_calculator": "batch:fixed_deposit_interest_batch",
+    "future_value_calculator": "batch:future_value_batch",
+    "inflation_impact_calculator": "batch:inflation_impact_batch",
+    "investment_return_calculator": "batch:investment_return_batch",
+    "loan_emi_calculator": "batch:loan_emi_batch",
+    "real_estate_dcf": "real_estate_dcf:real_estate_dcf_batch",
+    "sip_calculator": "batch:sip_batch",
+}
+
+# Calculators that fetch market data over the network; every other calculator is a
+# pure function of its inputs.
+NETWORK_CALCULATORS = frozenset({"currency_converter", "stock_beta_calculator"})
+
+_resolved = {}
+_lock = threading.Lock()
+
+
+def _resolve(target):
+    module_name, attribute = target.split(":")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, attribute)
+
+
+def _lookup(registry, name, kind):
+    target = registry.get(name)
+    if target is None:
+        raise KeyError(f"Unknown {kind}: {name!r}")
+
+    function = _resolved.get(target)
+    if function is not None:
+        return function
+
+    with _lock:
+        function = _resolved.get(target)
+        if function is None:
+            function = _resolve(target)
+            if instrumentation.is_enabled():
+                function = instrumentation.instrument(name if kind == "calculator" else f"{name}:batch", function)
+            _resolved[target] = function
+    return function
+
+
+def get_calculator(name):
+    """
+    Returns the calculator registered under ``name``, importing its module on first use.
+
+    Parameters:
+    name (str): Registered calculator name (e.g., 'sip_calculator').
+
+    Returns:
+    callable: The calculator function.
+
+    Raises:
+    KeyError: If no calculator is registered under ``name``.
+    """
+    return _lookup(CALCULATORS, name, "calculator")
+
+
+def get_batch_calculator(name):
+    """
+    Returns the columnar batch implementation of the calculator registered under ``name``.
+
+    Parameters:
+    name (str): Registered calculator name (e.g., 'sip_calculator').
+
+    Returns:
+    callable: Function taking a mapping of columns and returning a dict of arrays.
+
+    Raises:
+    KeyError: If the calculator has no batch implementation.
+    """
+    return _lookup(BATCH_CALCULATORS, name, "batch calculator")
+
+
+def available_calculators():
+    """
+    Returns the sorted list of registered calculator names without importing any of them.
+    """
+    return sorted(CALCULATORS)
+
+
+def has_batch(name):
+    """
+    Returns True if the calculator registered under ``name`` has a batch implementation.
+    """
+    return name in BATCH_CALCULATORS
+
+
+def run_calculator(name, inputs):
+    """
+    Resolves the calculator registered under ``name`` and calls it with ``inputs``.
+
+    Parameters:
+    name (str): Registered calculator name.
+    inputs (dict): Inputs passed through to the calculator.
+
+    Returns:
+    dict: The calculator result, or an error message for an unknown name.
+    """
+    try:
+        calculator = get_calculator(name)
+    except KeyError:
+        return {"error": f"Unknown calculator: {name}"}
+    return calculator(inputs)
+
+
+def run_batch(name, columns, **options):
+    """
+    Runs the batch implementation of ``name`` and wraps its output in a RecordArray.
+
+    Parameters:
+    name (str): Registered calculator name with a batch implementation.
+    columns (mapping): Input columns (see ``batch``).
+    options: Extra keyword arguments for the batch function (e.g., include_trajectory).
+
+    Returns:
+    results.RecordArray: One record per input row, stored as columns.
+
+    Raises:
+    KeyError: If the calculator has no batch implementation.
+    """
+    from .results import RecordArray
+
+    return RecordArray.from_batch(get_batch_calculator(name)(columns, **options))
+
+
+if os.environ.get("TRADINGCALCULATORS_INSTRUMENT", "").lower() in ("1", "true", "yes"):
+    instrumentation.enable()
+
+
+__all__ = [
+    "BATCH_CALCULATORS",
+    "CALCULATORS",
+    "NETWORK_CALCULATORS",
+    "available_calculators",
+    "get_batch_calculator",
+    "get_calculator",
+    "has_batch",
+    "instrumentation",
+    "run_batch",
+    "run_calculator",
+]
@@ -0,0 +1,231 @@
+"""
+Month-by-month loan amortization built on the loan_emi_calculator EMI formula.
+
+Schedules are returned as typed NumPy arrays rather than lists of dicts. Loans are
+amortized in chunks: every month of every loan in a chunk is advanced with one set
+of vectorized operations, so a portfolio costs O(max tenure) NumPy steps per chunk.
+portfolio_schedules() consumes any iterable of loan dicts lazily and yields one
+chunk at a time, so a whole loan book never has to sit in memory at once.
+
+Each loan dict uses the loan_emi_calculator keys plus two optional event maps:
+    - 'prepayments' (dict): month number (1-based) -> extra principal paid after that month's EMI.
+    - 'rate_resets' (dict): month number (1-based) -> new annual interest rate (percentage)
+      applied from that month onward; the EMI is recomputed over the remaining tenure.
+"""
+import itertools
+
+import numpy as np
+
+from .batch import monthly_emi
+from .schema import SPECS, parse_bool, validate_columns
+
+SCHEDULE_DTYPE = np.dtype([
+    ("month", np.int32),
+    ("payment", np.float64),
+    ("principal", np.float64),
+    ("interest", np.float64),
+    ("prepayment", np.float64),
+    ("balance", np.float64),
+])
+
+SCHEDULE_FIELDS = ("payment", "principal", "interest", "prepayment", "balance")
+
+# Balances below half a cent are treated as fully repaid.
+_BALANCE_EPSILON = 0.005
+
+
+def _parse_loans(loans):
+    # Validated against the loan_emi_calculator spec, so e.g. a fractional tenure is
+    # an error rather than being truncated.
+    fields = [field for field in SPECS["loan_emi_calculator"] if field.numeric]
+    columns = {field.name: [loan.get(field.name, field.default) for loan in loans] for field in fields}
+    values, error_mask, _ = validate_columns("loan_emi_calculator", columns)
+
+    loan_amount = np.where(error_mask, 0.0, values["loan_amount"])
+    interest_rate = np.where(error_mask, 0.0, values["interest_rate"])
+    tenure = np.where(error_mask, 0, values["loan_tenure"] * 12).astype(np.int64)
+    return loan_amount, interest_rate / 100 / 12, tenure, error_mask
+
+
+def _event_matrix(loans, key, months, fill, error_mask):
+    # A malformed event map flags its own loan in error_mask (leaving its row at
+    # ``fill``) instead of failing the whole chunk.
+    matrix = np.full((len(loans), months), fill)
+    for i, loan in enumerate(loans):
+        try:
+            for month, value in (loan.get(key) or {}).items():
+                month = int(month)
+                value = float(value)
+                # Negative prepayments would grow the balance; negative rates, the interest.
+                if not (np.isfinite(value) and value >= 0):
+                    raise ValueError(f"{key} values must be non-negative numbers.")
+                if 1 <= month <= months:
+                    if key == 'prepayments':
+                        matrix[i, month - 1] += value
+                    else:
+                        matrix[i, month - 1] = value / 100 / 12
+        except (AttributeError, TypeError, ValueError):
+            error_mask[i] = True
+            matrix[i] = fill
+    return matrix
+
+
+def _amortize(loans, reduce_emi_on_prepayment):
+    """
+    Amortizes a list of loan dicts together. Returns the per-loan EMI, months paid,
+    error mask and a dict of (loans x months) arrays for each schedule field.
+    """
+    balance, monthly_rate, tenure, error_mask = _parse_loans(loans)
+    months = int(tenure.max()) if tenure.size else 0
+    prepayments = _event_matrix(loans, 'prepayments', months, 0.0, error_mask)
+    rate_resets = _event_matrix(loans, 'rate_resets', months, np.nan, error_mask)
+    balance = np.where(error_mask, 0.0, balance)
+    tenure = np.where(error_mask, 0, tenure)
+
+    initial_emi = monthly_emi(balance, monthly_rate, tenure)
+    emi = initial_emi.copy()
+    schedule = {field: np.zeros((len(loans), months)) for field in SCHEDULE_FIELDS}
+    months_paid = np.zeros(len(loans), dtype=np.int32)
+
+    for m in range(months):
+        active = balance > _BALANCE_EPSILON
+        if not active.any():
+            break
+        remaining = tenure - m
+
+        reset = active & ~np.isnan(rate_resets[:, m])
+        if reset.any():
+            monthly_rate = np.where(reset, rate_resets[:, m], monthly_rate)
+            emi = np.where(reset, monthly_emi(balance, monthly_rate, remaining), emi)
+
+        interest = balance * monthly_rate
+        # The last scheduled installment (or an overpaying EMI) clears the balance exactly.
+        payment = np.where(remaining <= 1, balance + interest, np.minimum(emi, balance + interest))
+        payment = np.where(active, payment, 0.0)
+        interest = np.where(active, interest, 0.0)
+        principal = payment - interest
+        balance = balance - principal
+
+        prepayment = np.where(active, np.minimum(prepayments[:, m], balance), 0.0)
+        balance = balance - prepayment
+        balance[balance < _BALANCE_EPSILON] = 0.0
+        if reduce_emi_on_prepayment and (prepayment > 0).any():
+            emi = np.where(prepayment > 0, monthly_emi(balance, monthly_rate, remaining - 1), emi)
+
+        schedule["payment"][:, m] = payment
+        schedule["principal"][:, m] = principal
+        schedule["interest"][:, m] = interest
+        schedule["prepayment"][:, m] = prepayment
+        schedule["balance"][:, m] = balance
+        months_paid += active
+
+    return initial_emi, months_paid, error_mask, schedule
+
+
+def amortization_schedule(inputs):
+    """
+    Builds the full amortization schedule for a single loan.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'loan_amount' (float): Principal amount of the loan.
+        - 'interest_rate' (float): Annual interest rate (percentage).
+        - 'loan_tenure' (int): Loan tenure in years.
+        - 'prepayments' (dict, optional): Month number -> extra principal payment.
+        - 'rate_resets' (dict, optional): Month number -> new annual interest rate (percentage).
+        - 'reduce_emi_on_prepayment' (bool, optional): Recompute the EMI after a prepayment
+          instead of shortening the tenure. Defaults to False.
+
+    Returns:
+    dict: The initial EMI, totals and a structured NumPy array ('schedule') with one row per
+        month (month, payment, principal, interest, prepayment, balance), or an error message.
+    """
+    try:
+        reduce_emi_on_prepayment = parse_bool(inputs.get('reduce_emi_on_prepayment') or False)
+        if reduce_emi_on_prepayment is None:
+            return {"error": "reduce_emi_on_prepayment must be true or false."}
+        emi, months_paid, error_mask, schedule = _amortize(
+            [inputs], reduce_emi_on_prepayment
+        )
+        if error_mask[0]:
+            return {"error": "Loan amount and whole-year tenure must be positive, interest rate non-negative, "
+                             "and prepayments/rate_resets must map month numbers to non-negative numbers."}
+
+        length = int(months_paid[0])
+        rows = np.zeros(length, dtype=SCHEDULE_DTYPE)
+        rows["month"] = np.arange(1, length + 1)
+        for field in SCHEDULE_FIELDS:
+            rows[field] = schedule[field][0, :length]
+
+        return {
+            "loan_amount": float(inputs.get('loan_amount', 0)),
+            "interest_rate": inputs.get('interest_rate', 0),
+            "loan_tenure_years": inputs.get('loan_tenure', 0),
+            "monthly_emi": round(float(emi[0]), 2),
+            "months": length,
+            "total_interest": round(float(rows["interest"].sum()), 2),
+            "total_paid": round(float(rows["payment"].sum() + rows["prepayment"].sum()), 2),
+            "schedule": rows
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+def portfolio_schedules(loans, chunk_size=2048, reduce_emi_on_prepayment=False):
+    """
+    Streams amortization schedules for a portfolio of loans, one chunk at a time.
+
+    Parameters:
+    loans (iterable): Loan dicts (see amortization_schedule); consumed lazily.
+    chunk_size (int): Number of loans amortized together per yielded chunk.
+    reduce_emi_on_prepayment (bool): Recompute EMIs after prepayments instead of
+        shortening tenures.
+
+    Yields:
+    dict: For each chunk:
+        - 'loan_index' (int64 array): Position of each loan in the input stream.
+        - 'monthly_emi' (float64 array): Initial EMI per loan.
+        - 'months' (int32 array): Number of installments actually paid.
+        - 'error_mask' (bool array): Loans with invalid inputs, including malformed
+          'prepayments'/'rate_resets' maps (their rows are all zero).
+        - 'payment', 'principal', 'interest', 'prepayment', 'balance' (float64 arrays):
+          (loans x months) schedule matrices, zero after a loan is repaid.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+
+    iterator = iter(loans)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        emi, months_paid, error_mask, schedule = _amortize(chunk, reduce_emi_on_prepayment)
+        out = {
+            "loan_index": np.arange(start, start + len(chunk), dtype=np.int64),
+            "monthly_emi": np.round(emi, 2),
+            "months": months_paid,
+            "error_mask": error_mask,
+        }
+        out.update(schedule)
+        yield out
+        start += len(chunk)
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "loan_amount": 500000,
+        "interest_rate": 7.5,
+        "loan_tenure": 10,
+        "prepayments": {24: 50000},
+        "rate_resets": {60: 8.25}
+    }
+
+    result = amortization_schedule(inputs)
+    print({key: value for key, value in result.items() if key != "schedule"})
+    print(result["schedule"][:3])
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def annualized_return_calculator(inputs):
     """
     Calculates the annualized return on an investment.
@@ -6,18 +10,19 @@ def annualized_return_calculator(inputs):
     inputs (dict): A dictionary with the following keys:
         - 'initial_investment' (float): Initial amount invested.
         - 'final_value' (float): Final value of the investment.
-        - 'years' (int): Number of years the investment was held.
+        - 'years' (float): Number of years the investment was held (fractions allowed).
 
     Returns:
     dict: A dictionary with the calculated annualized return or an error message.
     """
     try:
-        initial_investment = float(inputs.get('initial_investment', 0))
-        final_value = float(inputs.get('final_value', 0))
-        years = int(inputs.get('years', 0))
+        values, errors = validate("annualized_return_calculator", inputs)
+        if errors:
+            return error_response(errors, "Initial investment, final value, and years must be positive.")
 
-        if initial_investment <= 0 or final_value < 0 or years <= 0:
-            return {"error": "Initial investment, final value, and years must be positive."}
+        initial_investment = values['initial_investment']
+        final_value = values['final_value']
+        years = values['years']
 
         annualized_return = ((final_value / initial_investment) ** (1 / years) - 1) * 100
 
@@ -31,14 +36,16 @@ def annualized_return_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "initial_investment": 10000,
-    "final_value": 15000,
-    "years": 3
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "initial_investment": 10000,
+        "final_value": 15000,
+        "years": 3
+    }
 
-result = annualized_return_calculator(inputs)
-print(result)
+    result = annualized_return_calculator(inputs)
+    print(result)
@@ -0,0 +1,412 @@
+"""
+Columnar batch versions of the calculators.
+
+Each batch function takes a mapping of column name -> array-like (a dict of lists
+or arrays, a pandas DataFrame, or a NumPy structured array) using the same field
+names and defaults as its scalar calculator. Scalars are broadcast against the
+other columns. Results come back as a dict of NumPy arrays plus an ``error_mask``
+boolean array: rows that the scalar calculator would reject (negative values,
+non-numeric input, ...) are flagged in the mask and carry NaN results. Row checks
+come from the same specs as the scalar calculators (schema.validate_columns).
+"""
+import numpy as np
+
+from .rate_store import RateNotAvailable, get_default_rate_store
+from .schema import validate_columns
+
+
+def has_field(columns, field):
+    """
+    Returns whether ``columns`` (a mapping, DataFrame or structured array) has ``field``.
+    """
+    names = getattr(getattr(columns, "dtype", None), "names", None)
+    if names is not None:
+        return field in names
+    return field in columns
+
+
+def as_float_column(values):
+    """
+    Converts one column to a float64 array. Values that cannot be parsed as numbers
+    become NaN instead of failing the whole column.
+    """
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    values = np.asarray(values, dtype=object)
+    out = np.empty(values.shape, dtype=np.float64)
+    flat_in = values.ravel()
+    flat_out = out.ravel()
+    for i, value in enumerate(flat_in):
+        try:
+            flat_out[i] = float(value)
+        except (TypeError, ValueError):
+            flat_out[i] = np.nan
+    return out
+
+
+def as_columns(columns, defaults):
+    """
+    Extracts the requested fields from ``columns`` as broadcast float64 arrays.
+
+    Parameters:
+    columns (mapping): Column name -> array-like or scalar.
+    defaults (dict): Field name -> default value used when the column is missing.
+
+    Returns:
+    tuple: (dict of field -> 1-D float64 array, boolean mask of rows with non-numeric input).
+    """
+    arrays = {}
+    for field, default in defaults.items():
+        values = columns[field] if has_field(columns, field) else default
+        arrays[field] = as_float_column(values)
+
+    broadcast = np.broadcast_arrays(*arrays.values())
+    size = broadcast[0].size if broadcast else 0
+    result = {}
+    invalid = np.zeros(size, dtype=bool)
+    for field, array in zip(arrays, broadcast):
+        array = np.reshape(array, size)
+        invalid |= ~np.isfinite(array)
+        result[field] = array
+    return result, invalid
+
+
+def finish_results(results, error_mask):
+    """
+    Rounds each result column to 2 decimals, sets NaN on error rows and adds
+    ``error_mask``: the common tail of every batch calculator.
+    """
+    out = {}
+    for name, values in results.items():
+        values = np.round(values, 2)
+        values[error_mask] = np.nan
+        out[name] = values
+    out["error_mask"] = error_mask
+    return out
+
+
+def monthly_emi(loan_amount, monthly_rate, months):
+    """
+    Vectorized EMI formula shared by the loan engines. A 0% rate spreads the
+    principal evenly; rows with no months left get an EMI of 0.
+
+    Parameters:
+    loan_amount (array-like): Outstanding principal.
+    monthly_rate (array-like): Monthly interest rate as a decimal.
+    months (array-like): Remaining number of monthly installments.
+
+    Returns:
+    numpy.ndarray: EMI per row.
+    """
+    loan_amount = np.asarray(loan_amount, dtype=np.float64)
+    monthly_rate = np.asarray(monthly_rate, dtype=np.float64)
+    months = np.asarray(months, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        growth = (1 + monthly_rate) ** months
+        emi = np.where(
+            monthly_rate == 0,
+            loan_amount / months,
+            (loan_amount * monthly_rate * growth) / (growth - 1),
+        )
+    return np.where(months > 0, emi, 0.0)
+
+
+def sip_future_value(monthly_investment, monthly_rate, months):
+    """
+    Vectorized SIP (annuity-due) future value, unrounded. A 0% rate returns the plain
+    sum of contributions.
+
+    Parameters:
+    monthly_investment (array-like): Contribution at the start of each month.
+    monthly_rate (array-like): Monthly rate of return as a decimal.
+    months (array-like): Number of contributions.
+
+    Returns:
+    numpy.ndarray: Future value per row.
+    """
+    monthly_investment = np.asarray(monthly_investment, dtype=np.float64)
+    monthly_rate = np.asarray(monthly_rate, dtype=np.float64)
+    months = np.asarray(months, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        # expm1/log1p keep the growth factor accurate for very small monthly rates.
+        growth = np.expm1(months * np.log1p(monthly_rate))
+        future_value = monthly_investment * (growth / monthly_rate) * (1 + monthly_rate)
+    return np.where(monthly_rate == 0, monthly_investment * months, future_value)
+
+
+def investment_future_value(initial_investment, annual_contribution, rate, years):
+    """
+    Vectorized terminal value of a lump sum plus year-end contributions, unrounded.
+
+    Parameters:
+    initial_investment (array-like): Amount invested at the start.
+    annual_contribution (array-like): Contribution at the end of each year.
+    rate (array-like): Annual rate of return as a decimal.
+    years (array-like): Investment horizon in years.
+
+    Returns:
+    numpy.ndarray: Future value per row.
+    """
+    initial_investment = np.asarray(initial_investment, dtype=np.float64)
+    annual_contribution = np.asarray(annual_contribution, dtype=np.float64)
+    rate = np.asarray(rate, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        growth = (1 + rate) ** years
+        annuity = np.where(rate == 0, years, (growth - 1) / rate)
+        return initial_investment * growth + annual_contribution * annuity
+
+
+def compound_value(principal, rate, years, compounds_per_year):
+    """
+    Vectorized compound-interest maturity value, unrounded.
+
+    Parameters:
+    principal (array-like): Amount deposited.
+    rate (array-like): Annual interest rate as a decimal.
+    years (array-like): Years the deposit is held.
+    compounds_per_year (array-like): Compounding periods per year.
+
+    Returns:
+    numpy.ndarray: Maturity value per row.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    rate = np.asarray(rate, dtype=np.float64)
+    compounds_per_year = np.asarray(compounds_per_year, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        return principal * (1 + rate / compounds_per_year) ** (compounds_per_year * np.asarray(years))
+
+
+def future_value_batch(columns):
+    """
+    Batch version of future_value_calculator.
+
+    Parameters:
+    columns (mapping): Columns 'initial_investment', 'rate_of_return' (percentage) and 'years'.
+
+    Returns:
+    dict: 'future_value' array and 'error_mask' array.
+    """
+    cols, error_mask, _ = validate_columns("future_value_calculator", columns)
+    initial_investment = cols["initial_investment"]
+    rate_of_return = cols["rate_of_return"] / 100
+    years = cols["years"]
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        future_value = initial_investment * (1 + rate_of_return) ** years
+
+    return finish_results({"future_value": future_value}, error_mask)
+
+
+def fixed_deposit_interest_batch(columns):
+    """
+    Batch version of fixed_deposit_interest_calculator.
+
+    Parameters:
+    columns (mapping): Columns 'principal', 'rate_of_interest' (percentage), 'years'
+        and 'compounds_per_year' (defaults to 1).
+
+    Returns:
+    dict: 'maturity_value' array and 'error_mask' array.
+    """
+    cols, error_mask, _ = validate_columns("fixed_deposit_interest_calculator", columns)
+    maturity_value = compound_value(
+        cols["principal"], cols["rate_of_interest"] / 100, cols["years"], cols["compounds_per_year"],
+    )
+
+    return finish_results({"maturity_value": maturity_value}, error_mask)
+
+
+def sip_batch(columns):
+    """
+    Batch version of sip_calculator (annuity-due, compounded monthly). A 0% rate
+    returns the plain sum of contributions.
+
+    Parameters:
+    columns (mapping): Columns 'monthly_investment', 'rate_of_return' (percentage) and 'years'.
+
+    Returns:
+    dict: 'future_value' array and 'error_mask' array.
+    """
+    cols, error_mask, _ = validate_columns("sip_calculator", columns)
+    future_value = sip_future_value(cols["monthly_investment"], cols["rate_of_return"] / 100 / 12, cols["years"] * 12)
+
+    return finish_results({"future_value": future_value}, error_mask)
+
+
+def inflation_impact_batch(columns):
+    """
+    Batch version of inflation_impact_calculator.
+
+    Parameters:
+    columns (mapping): Columns 'current_amount', 'inflation_rate' (percentage) and 'years'.
+
+    Returns:
+    dict: 'future_value_adjusted', 'purchasing_power_loss' and 'error_mask' arrays.
+    """
+    cols, error_mask, _ = validate_columns("inflation_impact_calculator", columns)
+    current_amount = cols["current_amount"]
+    inflation_rate = cols["inflation_rate"] / 100
+    years = cols["years"]
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        future_value = current_amount / (1 + inflation_rate) ** years
+    purchasing_power_loss = current_amount - future_value
+
+    return finish_results(
+        {"future_value_adjusted": future_value, "purchasing_power_loss": purchasing_power_loss},
+        error_mask,
+    )
+
+
+def investment_return_batch(columns, include_trajectory=False):
+    """
+    Batch version of investment_return_calculator using the closed-form annuity, so
+    the terminal value costs O(1) per row regardless of the horizon.
+
+    Parameters:
+    columns (mapping): Columns 'initial_investment', 'annual_contribution',
+        'rate_of_return' (percentage) and 'years'.
+    include_trajectory (bool): Also return 'yearly_values', a (rows, max_years + 1)
+        array of end-of-year values built from cumulative growth factors. Entries
+        past a row's own horizon are NaN.
+
+    Returns:
+    dict: 'future_value' array (plus 'yearly_values' if requested) and 'error_mask' array.
+    """
+    cols, error_mask, _ = validate_columns("investment_return_calculator", columns)
+    initial_investment = cols["initial_investment"]
+    annual_contribution = cols["annual_contribution"]
+    rate_of_return = cols["rate_of_return"] / 100
+    years = cols["years"]
+    zero_rate = rate_of_return == 0
+
+    future_value = investment_future_value(initial_investment, annual_contribution, rate_of_return, years)
+
+    out = finish_results({"future_value": future_value}, error_mask)
+    if not include_trajectory:
+        return out
+
+    valid_years = years[~error_mask]
+    horizon = int(valid_years.max()) if valid_years.size else 0
+    steps = np.arange(horizon + 1)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        factors = np.broadcast_to((1 + rate_of_return)[:, None], (rate_of_return.size, horizon))
+        growth_path = np.ones((rate_of_return.size, horizon + 1))
+        np.cumprod(factors, axis=1, out=growth_path[:, 1:])
+        annuity_path = np.where(zero_rate[:, None], steps, (growth_path - 1) / rate_of_return[:, None])
+        yearly_values = initial_investment[:, None] * growth_path + annual_contribution[:, None] * annuity_path
+
+    yearly_values = np.round(yearly_values, 2)
+    yearly_values[(steps > years[:, None]) | error_mask[:, None]] = np.nan
+    out["yearly_values"] = yearly_values
+    return out
+
+
+def loan_emi_batch(columns):
+    """
+    Batch version of loan_emi_calculator. A 0% rate spreads the principal evenly
+    over the tenure.
+
+    Parameters:
+    columns (mapping): Columns 'loan_amount', 'interest_rate' (annual percentage)
+        and 'loan_tenure' (years).
+
+    Returns:
+    dict: 'monthly_emi' array and 'error_mask' array.
+    """
+    cols, error_mask, _ = validate_columns("loan_emi_calculator", columns)
+    loan_amount = cols["loan_amount"]
+    monthly_rate = cols["interest_rate"] / 100 / 12
+    loan_tenure = cols["loan_tenure"] * 12
+
+    emi = monthly_emi(loan_amount, monthly_rate, loan_tenure)
+
+    return finish_results({"monthly_emi": emi}, error_mask)
+
+
+def _as_code_column(values, size):
+    codes = np.asarray(values, dtype=str)
+    if codes.ndim == 0:
+        codes = np.full(size, codes)
+    return np.char.upper(np.char.strip(codes.reshape(-1)))
+
+
+def currency_converter_batch(columns, rate_store=None):
+    """
+    Batch version of currency_converter. Each distinct currency's rate is looked up once
+    (through the store's pivot currency), so the cost is a few array operations plus one
+    dictionary lookup per currency, independent of the number of rows or pairs.
+
+    Parameters:
+    columns (mapping): Columns 'amount', 'base_currency' (default 'USD') and
+        'target_currency' (default 'INR').
+    rate_store (RateStore): Rate source; defaults to rate_store.get_default_rate_store().
+
+    Returns:
+    dict: 'converted_amount' and 'exchange_rate' arrays (unrounded) and 'error_mask' array.
+        Rows with negative/non-numeric amounts or currencies without a rate are flagged.
+    """
+    rate_store = rate_store or get_default_rate_store()
+    cols, error_mask, _ = validate_columns("currency_converter", columns)
+    amount = cols["amount"]
+    base_codes = columns["base_currency"] if has_field(columns, "base_currency") else "USD"
+    target_codes = columns["target_currency"] if has_field(columns, "target_currency") else "INR"
+    size = max(amount.size, np.size(base_codes), np.size(target_codes))
+    if amount.size == 1 and size > 1:
+        # A scalar amount is broadcast against the currency columns.
+        amount = np.repeat(amount, size)
+        error_mask = np.repeat(error_mask, size)
+
+    base = _as_code_column(base_codes, size)
+    target = _as_code_column(target_codes, size)
+    if base.size != size or target.size != size:
+        raise ValueError("Currency columns must have one value per amount.")
+
+    codes, inverse = np.unique(np.concatenate([base, target]), return_inverse=True)
+    pivot_rates = np.empty(codes.size)
+    for i, code in enumerate(codes):
+        try:
+            pivot_rates[i] = rate_store.pivot_rate(str(code))
+        except RateNotAvailable:
+            pivot_rates[i] = np.nan
+
+    inverse = inverse.reshape(-1)
+    exchange_rate = pivot_rates[inverse[size:]] / pivot_rates[inverse[:size]]
+    error_mask |= ~np.isfinite(exchange_rate)
+
+    converted_amount = amount * exchange_rate
+    converted_amount[error_mask] = np.nan
+    exchange_rate[error_mask] = np.nan
+    return {
+        "converted_amount": converted_amount,
+        "exchange_rate": exchange_rate,
+        "error_mask": error_mask,
+    }
+
+
+def format_amounts(amounts, currencies, decimals=2):
+    """
+    Formats amounts as "<symbol> <amount>" strings, as currency_converter does. Kept
+    separate from currency_converter_batch so numeric pipelines never pay for it.
+
+    Parameters:
+    amounts (array-like): Amounts to format (NaN formats as an empty string).
+    currencies (array-like or str): Currency code per amount, or one code for all.
+    decimals (int): Decimal places.
+
+    Returns:
+    list: Formatted strings.
+    """
+    from .currency_converter import currency_symbol
+
+    amounts = np.round(np.asarray(amounts, dtype=np.float64).reshape(-1), decimals)
+    codes = _as_code_column(currencies, amounts.size)
+    symbols = {code: currency_symbol(code) for code in np.unique(codes).tolist()}
+    return [
+        "" if np.isnan(value) else f"{symbols[code]} {value}"
+        for value, code in zip(amounts.tolist(), codes.tolist())
+    ]
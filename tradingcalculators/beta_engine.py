@@ -0,0 +1,188 @@
+"""
+Universe-level beta regression.
+
+universe_betas() regresses every column of a (dates x tickers) returns matrix on a
+market return series in one pass: all sums needed for beta, alpha, correlation and
+R² come out of a handful of matrix products, so thousands of tickers cost roughly
+as much as one. Missing observations (NaN) are handled pairwise: each ticker uses
+only the dates on which both it and the market have a return. Sample (ddof=1)
+moments are used throughout.
+"""
+import numpy as np
+import pandas as pd
+
+from .price_history import get_default_provider
+
+
+def returns_from_prices(prices):
+    """
+    Builds a date-aligned returns matrix from closing prices.
+
+    Parameters:
+    prices (dict or pandas.DataFrame): Ticker -> Series of closes indexed by date, or a
+        DataFrame with one column per ticker.
+
+    Returns:
+    pandas.DataFrame: Simple daily returns, one column per ticker, on the union of all
+        dates. A ticker with no price on a date has NaN returns around that gap.
+    """
+    frame = prices if isinstance(prices, pd.DataFrame) else pd.DataFrame(prices)
+    frame = frame.sort_index()
+    return frame.pct_change(fill_method=None).iloc[1:]
+
+
+def regress_on_market(returns, market_returns, min_observations=2):
+    """
+    Regresses each column of ``returns`` on ``market_returns``.
+
+    Parameters:
+    returns (numpy.ndarray): (dates x tickers) returns, NaN where missing.
+    market_returns (numpy.ndarray): Market returns for the same dates, NaN where missing.
+    min_observations (int): Tickers with fewer paired observations get NaN statistics.
+
+    Returns:
+    dict: 'beta', 'alpha', 'r_squared', 'correlation' (float arrays) and
+        'observations' (int array), one entry per ticker.
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    market_returns = np.asarray(market_returns, dtype=np.float64)
+    if returns.ndim == 1:
+        returns = returns[:, None]
+
+    mask = np.isfinite(returns) & np.isfinite(market_returns)[:, None]
+    weights = mask.astype(np.float64)
+    market = np.where(np.isfinite(market_returns), market_returns, 0.0)
+    stock = np.where(mask, returns, 0.0)
+
+    n = weights.sum(axis=0)
+    sum_x = market @ weights
+    sum_xx = (market * market) @ weights
+    sum_y = stock.sum(axis=0)
+    sum_yy = np.einsum("ij,ij->j", stock, stock)
+    sum_xy = market @ stock
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov_xy = (sum_xy - sum_x * sum_y / n) / (n - 1)
+        var_x = (sum_xx - sum_x * sum_x / n) / (n - 1)
+        var_y = (sum_yy - sum_y * sum_y / n) / (n - 1)
+        beta = cov_xy / var_x
+        alpha = sum_y / n - beta * sum_x / n
+        correlation = cov_xy / np.sqrt(var_x * var_y)
+
+    insufficient = (n < max(min_observations, 2)) | ~(var_x > 0)
+    for values in (beta, alpha, correlation):
+        values[insufficient] = np.nan
+
+    return {
+        "beta": beta,
+        "alpha": alpha,
+        "r_squared": correlation ** 2,
+        "correlation": correlation,
+        "observations": n.astype(np.int64),
+    }
+
+
+def universe_betas(inputs):
+    """
+    Calculates beta, alpha, R² and correlation for every ticker in a returns matrix.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'returns' (pandas.DataFrame or 2-D array): Returns, dates x tickers.
+        - 'market_returns' (pandas.Series or 1-D array, optional): Market returns. A Series is
+          aligned to the DataFrame by date; an array must match the rows of 'returns'.
+        - 'market_ticker' (str, optional): Column of 'returns' to use as the market instead.
+        - 'tickers' (list, optional): Column labels when 'returns' is a plain array.
+        - 'min_observations' (int, optional): Minimum paired observations per ticker (default 20).
+
+    Returns:
+    dict: 'tickers' plus one array per statistic (see regress_on_market), or an error message.
+    """
+    try:
+        returns = inputs.get('returns')
+        market_returns = inputs.get('market_returns')
+        market_ticker = inputs.get('market_ticker')
+        min_observations = int(inputs.get('min_observations', 20))
+
+        if returns is None:
+            return {"error": "A returns matrix must be provided."}
+
+        if isinstance(returns, pd.DataFrame):
+            if market_returns is None:
+                if market_ticker not in returns.columns:
+                    return {"error": "Provide market_returns or a market_ticker column in returns."}
+                market_returns = returns[market_ticker]
+                returns = returns.drop(columns=[market_ticker])
+            elif isinstance(market_returns, pd.Series):
+                returns, market_returns = returns.align(market_returns, join="inner", axis=0)
+            tickers = list(returns.columns)
+            returns = returns.to_numpy(dtype=np.float64)
+            market_returns = np.asarray(market_returns, dtype=np.float64)
+        else:
+            returns = np.asarray(returns, dtype=np.float64)
+            if returns.ndim == 1:
+                returns = returns[:, None]
+            if market_returns is None:
+                return {"error": "market_returns must be provided with an array of returns."}
+            market_returns = np.asarray(market_returns, dtype=np.float64)
+            tickers = list(inputs.get('tickers') or range(returns.shape[1]))
+
+        if market_returns.shape != (returns.shape[0],):
+            return {"error": "market_returns must have one value per row of returns."}
+        if len(tickers) != returns.shape[1]:
+            return {"error": "tickers must have one label per column of returns."}
+
+        result = {"tickers": tickers}
+        result.update(regress_on_market(returns, market_returns, min_observations))
+        return result
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all returns are numbers."}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+def universe_betas_for_tickers(inputs):
+    """
+    Fetches prices for a list of tickers plus the market in one provider call and
+    runs universe_betas() on the date-aligned returns.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'tickers' (list): Stock ticker symbols.
+        - 'market_ticker' (str): Market index ticker (e.g., '^GSPC').
+        - 'period' (str): Period for historical data (default '1y').
+        - 'provider' (PriceHistoryProvider, optional): Defaults to the shared cached provider.
+        - 'min_observations' (int, optional): See universe_betas().
+
+    Returns:
+    dict: As universe_betas(), plus 'missing' (tickers without price data), or an error message.
+    """
+    try:
+        tickers = list(inputs.get('tickers') or [])
+        market_ticker = inputs.get('market_ticker')
+        period = inputs.get('period', '1y')
+        provider = inputs.get('provider') or get_default_provider()
+
+        if not tickers or not market_ticker:
+            return {"error": "Both tickers and market_ticker must be provided."}
+
+        history = provider.fetch(tickers + [market_ticker], period)
+        if market_ticker not in history:
+            return {"error": "Could not fetch market data for calculation."}
+
+        available = [ticker for ticker in tickers if ticker in history and ticker != market_ticker]
+        prices = pd.DataFrame({ticker: history[ticker] for ticker in available + [market_ticker]})
+        returns = returns_from_prices(prices)
+
+        result = universe_betas({
+            "returns": returns,
+            "market_ticker": market_ticker,
+            "min_observations": inputs.get('min_observations', 20),
+        })
+        if "error" not in result:
+            result["missing"] = [ticker for ticker in tickers if ticker not in history]
+        return result
+
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
@@ -0,0 +1,295 @@
+"""
+Lot-level capital gains: matches sells against open buy lots and emits realized gains.
+
+LotMatcher keeps the open lots of every (account, symbol) in a structure suited to
+the matching method, so each match costs O(1) (FIFO/LIFO deque, specific-ID dict)
+or O(log n) (HIFO heap). Fills are processed one at a time and realized gains are
+returned as soon as a sell is matched, so a year of fills is a single streaming
+pass with memory proportional to the number of open lots.
+
+A fill is a dict with the following keys:
+    - 'account' (str): Account identifier (optional, defaults to '').
+    - 'symbol' (str): Instrument identifier.
+    - 'side' (str): 'buy' or 'sell'.
+    - 'quantity' (float): Units bought or sold (positive).
+    - 'price' (float): Price per unit.
+    - 'date' (date, datetime or ISO string): Trade date.
+    - 'fees' (float, optional): Commissions; added to the cost basis of buys and
+      deducted from the proceeds of sells.
+    - 'lot_id' (str, optional): Identifier of the lot opened by a buy, or, with the
+      'SPECIFIC' method, the lot(s) a sell closes ('lot_ids' list also accepted).
+      With 'SPECIFIC', a buy may not reuse the lot_id of a lot that is still open.
+"""
+import heapq
+import math
+from collections import deque, namedtuple
+from datetime import date, datetime
+
+METHODS = ("FIFO", "LIFO", "HIFO", "SPECIFIC")
+
+RealizedGain = namedtuple(
+    "RealizedGain",
+    ["account", "symbol", "lot_id", "quantity", "acquired", "sold",
+     "cost_basis", "proceeds", "gain", "long_term"],
+)
+
+_date_cache = {}
+
+
+def to_date(value):
+    """
+    Converts a date, datetime or ISO-8601 string into a date.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    parsed = _date_cache.get(value)
+    if parsed is None:
+        parsed = date.fromisoformat(str(value)[:10])
+        if len(_date_cache) < 100_000:
+            _date_cache[value] = parsed
+    return parsed
+
+
+def is_long_term(acquired, sold, years=1):
+    """
+    Returns True if an asset acquired on ``acquired`` and sold on ``sold`` was held
+    for more than ``years`` calendar years.
+    """
+    try:
+        anniversary = acquired.replace(year=acquired.year + years)
+    except ValueError:
+        # Acquired on 29 February; the anniversary falls on 28 February.
+        anniversary = acquired.replace(year=acquired.year + years, day=28)
+    return sold > anniversary
+
+
+class _Lot:
+    __slots__ = ("lot_id", "quantity", "unit_cost", "acquired", "sequence")
+
+    def __init__(self, lot_id, quantity, unit_cost, acquired, sequence):
+        self.lot_id = lot_id
+        self.quantity = quantity
+        self.unit_cost = unit_cost
+        self.acquired = acquired
+        self.sequence = sequence
+
+    def __lt__(self, other):
+        # Heap order for HIFO: highest unit cost first, then oldest.
+        return (-self.unit_cost, self.sequence) < (-other.unit_cost, other.sequence)
+
+
+class _OpenLots:
+    """
+    Open lots of one (account, symbol), stored according to the matching method.
+    """
+    __slots__ = ("method", "lots", "quantity")
+
+    def __init__(self, method):
+        self.method = method
+        self.lots = [] if method == "HIFO" else ({} if method == "SPECIFIC" else deque())
+        self.quantity = 0.0
+
+    def add(self, lot):
+        if self.method == "HIFO":
+            heapq.heappush(self.lots, lot)
+        elif self.method == "SPECIFIC":
+            self.lots[lot.lot_id] = lot
+        else:
+            self.lots.append(lot)
+        self.quantity += lot.quantity
+
+    def next_lot(self, lot_ids):
+        if self.method == "FIFO":
+            return self.lots[0]
+        if self.method == "LIFO":
+            return self.lots[-1]
+        if self.method == "HIFO":
+            return self.lots[0]
+        for lot_id in lot_ids:
+            lot = self.lots.get(lot_id)
+            if lot is not None:
+                return lot
+        raise ValueError(f"None of the requested lots are open: {list(lot_ids)}")
+
+    def remove(self, lot):
+        if self.method == "FIFO":
+            self.lots.popleft()
+        elif self.method == "LIFO":
+            self.lots.pop()
+        elif self.method == "HIFO":
+            heapq.heappop(self.lots)
+        else:
+            del self.lots[lot.lot_id]
+
+
+class LotMatcher:
+    """
+    Streaming lot matcher.
+
+    Parameters:
+    method (str): 'FIFO', 'LIFO', 'HIFO' (highest cost first) or 'SPECIFIC' (sells name their lots).
+    long_term_years (int): A lot held for more than this many calendar years is long-term.
+    """
+
+    # Quantities below this are treated as fully consumed.
+    EPSILON = 1e-9
+
+    def __init__(self, method="FIFO", long_term_years=1):
+        method = method.upper()
+        if method not in METHODS:
+            raise ValueError(f"Unknown matching method: {method!r}. Expected one of {METHODS}.")
+        self.method = method
+        self.long_term_years = long_term_years
+        self._open = {}
+        self._sequence = 0
+
+    def open_lots(self, account, symbol):
+        """
+        Returns the open quantity for an (account, symbol).
+        """
+        book = self._open.get((account, symbol))
+        return book.quantity if book is not None else 0.0
+
+    def process(self, fill):
+        """
+        Processes one fill.
+
+        Parameters:
+        fill (dict): See the module docstring.
+
+        Returns:
+        list: RealizedGain records for a sell (empty for a buy).
+
+        Raises:
+        ValueError: For malformed fills, sells exceeding the open quantity, or (with
+            'SPECIFIC') a buy reusing the lot_id of a lot that is still open.
+        """
+        account = fill.get('account', '')
+        symbol = fill['symbol']
+        side = str(fill['side']).lower()
+        quantity = float(fill['quantity'])
+        price = float(fill['price'])
+        fees = float(fill.get('fees', 0) or 0)
+        trade_date = to_date(fill['date'])
+
+        # Negated comparisons so that NaN fails them too.
+        finite = math.isfinite(quantity) and math.isfinite(price) and math.isfinite(fees)
+        if not (finite and quantity > 0 and price >= 0 and fees >= 0):
+            raise ValueError("Fill quantity must be positive and price/fees non-negative (all finite).")
+
+        key = (account, symbol)
+        book = self._open.get(key)
+        if side == "buy":
+            lot_id = fill.get('lot_id', self._sequence + 1)
+            if self.method == "SPECIFIC" and book is not None and lot_id in book.lots:
+                raise ValueError(f"Lot {lot_id!r} of {symbol} in account {account!r} is already open.")
+            if book is None:
+                book = self._open[key] = _OpenLots(self.method)
+            self._sequence += 1
+            book.add(_Lot(lot_id, quantity, price + fees / quantity, trade_date, self._sequence))
+            return []
+
+        if side != "sell":
+            raise ValueError(f"Unknown side: {fill['side']!r}")
+        if book is None or book.quantity < quantity - self.EPSILON:
+            raise ValueError(f"Sell of {quantity} {symbol} in account {account!r} exceeds the open quantity.")
+
+        lot_ids = fill.get('lot_ids')
+        if lot_ids is None:
+            lot_ids = [fill['lot_id']] if 'lot_id' in fill else []
+        elif isinstance(lot_ids, str):
+            lot_ids = [lot_ids]
+        # A repeated id must not count its lot twice towards the coverage check below,
+        # which has to pass before any lot is touched.
+        lot_ids = list(dict.fromkeys(lot_ids))
+
+        if self.method == "SPECIFIC":
+            available = sum(book.lots[lot_id].quantity for lot_id in lot_ids if lot_id in book.lots)
+            if available < quantity - self.EPSILON:
+                raise ValueError(f"Requested lots {list(lot_ids)} do not cover a sell of {quantity} {symbol}.")
+
+        unit_proceeds = price - fees / quantity
+        remaining = quantity
+        realized = []
+        while remaining > self.EPSILON:
+            lot = book.next_lot(lot_ids)
+            matched = min(lot.quantity, remaining)
+            cost_basis = matched * lot.unit_cost
+            proceeds = matched * unit_proceeds
+            realized.append(RealizedGain(
+                account, symbol, lot.lot_id, matched, lot.acquired, trade_date,
+                cost_basis, proceeds, proceeds - cost_basis,
+                is_long_term(lot.acquired, trade_date, self.long_term_years),
+            ))
+            lot.quantity -= matched
+            book.quantity -= matched
+            remaining -= matched
+            if lot.quantity <= self.EPSILON:
+                book.remove(lot)
+
+        if book.quantity <= self.EPSILON:
+            del self._open[key]
+        return realized
+
+
+def realize_gains(fills, method="FIFO", long_term_years=1):
+    """
+    Streams realized gains for an iterable of fills (in trade order).
+
+    Parameters:
+    fills (iterable): Fill dicts; consumed lazily.
+    method (str): Lot matching method (see LotMatcher).
+    long_term_years (int): Long-term holding threshold in years.
+
+    Yields:
+    RealizedGain: One record per (sell, lot) match.
+    """
+    matcher = LotMatcher(method, long_term_years)
+    for fill in fills:
+        yield from matcher.process(fill)
+
+
+def capital_gains_summary(gains, tax_rate_short=15, tax_rate_long=10):
+    """
+    Aggregates realized gains per account into short/long-term totals and tax due.
+    Losses offset gains of the same term; tax applies to positive net gains, as in
+    capital_gains_tax_calculator.
+
+    Parameters:
+    gains (iterable): RealizedGain records (consumed in one pass).
+    tax_rate_short (float): Short-term capital gains tax rate (percentage).
+    tax_rate_long (float): Long-term capital gains tax rate (percentage).
+
+    Returns:
+    dict: Account -> dict with 'short_term_gain', 'long_term_gain' and 'tax_due'.
+    """
+    totals = {}
+    for gain in gains:
+        account = totals.setdefault(gain.account, [0.0, 0.0])
+        account[1 if gain.long_term else 0] += gain.gain
+
+    summary = {}
+    for account, (short_term, long_term) in totals.items():
+        tax_due = max(short_term, 0) * tax_rate_short / 100 + max(long_term, 0) * tax_rate_long / 100
+        summary[account] = {
+            "short_term_gain": round(short_term, 2),
+            "long_term_gain": round(long_term, 2),
+            "tax_due": round(tax_due, 2),
+        }
+    return summary
+
+
+if __name__ == "__main__":
+    # Example usage
+    fills = [
+        {"symbol": "AAPL", "side": "buy", "quantity": 50, "price": 100, "date": "2023-01-10"},
+        {"symbol": "AAPL", "side": "buy", "quantity": 50, "price": 140, "date": "2024-03-01"},
+        {"symbol": "AAPL", "side": "sell", "quantity": 70, "price": 150, "date": "2024-06-15"},
+    ]
+
+    gains = list(realize_gains(fills, method="FIFO"))
+    for gain in gains:
+        print(gain)
+    print(capital_gains_summary(gains))
@@ -0,0 +1,72 @@
+from .capital_gains_lots import is_long_term, to_date
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
+def capital_gains_tax_calculator(inputs):
+    """
+    Calculates capital gains tax based on purchase and sale prices and holding period.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'purchase_price' (float): Price at which the asset was bought.
+        - 'sale_price' (float): Price at which the asset was sold.
+        - 'quantity' (int): Number of units sold.
+        - 'holding_period' (int): Holding period in years.
+        - 'purchase_date' / 'sale_date' (date or ISO string, optional): When both are given, the
+          long-term classification uses the actual dates (held more than one year) instead
+          of 'holding_period'.
+        - 'tax_rate_short' (float): Short-term capital gains tax rate (percentage).
+        - 'tax_rate_long' (float): Long-term capital gains tax rate (percentage).
+
+    Returns:
+    dict: A dictionary with calculated capital gain and applicable tax.
+    """
+    try:
+        values, errors = validate("capital_gains_tax_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be non-negative, and tax rates at most 100.")
+
+        purchase_price = values['purchase_price']
+        sale_price = values['sale_price']
+        quantity = values['quantity']
+        holding_period = values['holding_period']
+        tax_rate_short = values['tax_rate_short'] / 100
+        tax_rate_long = values['tax_rate_long'] / 100
+
+        capital_gain = (sale_price - purchase_price) * quantity
+        if inputs.get('purchase_date') and inputs.get('sale_date'):
+            long_term = is_long_term(to_date(inputs['purchase_date']), to_date(inputs['sale_date']))
+        else:
+            long_term = holding_period > 1
+        tax_rate = tax_rate_long if long_term else tax_rate_short
+        tax_due = capital_gain * tax_rate if capital_gain > 0 else 0
+
+        return {
+            "purchase_price": purchase_price,
+            "sale_price": sale_price,
+            "quantity": quantity,
+            "holding_period": holding_period,
+            "capital_gain": round(capital_gain, 2),
+            "tax_due": round(tax_due, 2)
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "purchase_price": 100,
+        "sale_price": 150,
+        "quantity": 50,
+        "holding_period": 2,
+        "tax_rate_short": 15,
+        "tax_rate_long": 10
+    }
+
+    result = capital_gains_tax_calculator(inputs)
+    print(result)
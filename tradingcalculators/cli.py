@@ -0,0 +1,397 @@
+"""
+Command-line runner for the calculators.
+
+    tradingcalculators list
+    tradingcalculators run sip_calculator --input plans.csv --output values.parquet
+    tradingcalculators run loan_emi_calculator --input loans.jsonl --output - --workers 4
+    tradingcalculators serve --port 8000
+
+Input (CSV, JSONL or Parquet) is read in chunks of --chunk-size rows, so memory stays
+bounded whatever the file size. Each chunk goes through the calculator's batch path
+when it has one (see ``BATCH_CALCULATORS``) and through the scalar calculator row by
+row otherwise. Results are appended to the output (CSV, JSONL or Parquet) as soon as
+each chunk is done, in input order. With --workers > 1, chunks are processed in a
+process pool with a bounded number of chunks in flight.
+
+Every output row has the same columns (see output_schema()): the calculator's spec
+inputs, parsed (numbers as numbers, defaults filled in), any other input columns, the
+result fields, then ``error_mask`` for batch results or ``error`` for scalar results.
+The columns are fixed up front, so they do not depend on which rows of the first chunk
+happened to fail.
+
+``run --stats`` prints call counts and phase latencies (see ``instrumentation``) to
+stderr when done, and ``run --profile PATH`` writes a cProfile of the run to PATH.
+"""
+import argparse
+import collections
+import contextlib
+import csv
+import itertools
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import available_calculators, get_batch_calculator, get_calculator, has_batch, instrumentation
+from .results import column_to_list
+from .schema import BATCH_RESULTS, RESULTS, SPECS, parse_bool
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def detect_format(path, explicit=None):
+    """
+    Returns the file format from ``explicit`` or the path's extension.
+    """
+    if explicit:
+        return explicit
+    lowered = path.lower()
+    for extension, file_format in ((".csv", "csv"), (".jsonl", "jsonl"), (".ndjson", "jsonl"),
+                                   (".json", "jsonl"), (".parquet", "parquet"), (".pq", "parquet")):
+        if lowered.endswith(extension):
+            return file_format
+    if path == "-":
+        return "csv"
+    raise ValueError(f"Cannot infer the format of {path!r}; pass --input-format/--output-format.")
+
+
+def _open_text(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def _rows_to_columns(rows):
+    names = list(dict.fromkeys(itertools.chain.from_iterable(rows)))
+    return {name: [row.get(name) for row in rows] for name in names}
+
+
+def read_chunks(path, file_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads an input file in chunks.
+
+    Yields:
+    dict: Column name -> list of values, up to chunk_size rows.
+    """
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pydict()
+        return
+
+    handle = _open_text(path, "r")
+    try:
+        if file_format == "csv":
+            rows = csv.DictReader(handle)
+        else:
+            rows = (json.loads(line) for line in handle if line.strip())
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield _rows_to_columns(chunk)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def output_schema(name, columns=()):
+    """
+    Returns the fixed output columns of ``name`` and their kinds.
+
+    Every chunk is written with the same columns: the calculator's spec inputs, any
+    other input columns (from ``columns``, normally the first chunk), the result fields
+    (schema.RESULTS, or schema.BATCH_RESULTS for the batch path) and finally ``error``
+    or ``error_mask``. Kinds are 'float', 'int', 'str', 'bool', 'mapping' or 'list';
+    extra input columns are passed through as 'str'.
+
+    Returns:
+    dict: Column name -> kind, in output order.
+    """
+    schema = {field.name: field.kind for field in SPECS.get(name, ())}
+    for column in columns:
+        schema.setdefault(column, "str")
+    if has_batch(name):
+        schema.update((field, "float") for field in BATCH_RESULTS[name])
+        schema["error_mask"] = "bool"
+    else:
+        schema.update(RESULTS[name])
+        schema["error"] = "str"
+    return schema
+
+
+def _parse_number(value, kind):
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    if value != value:
+        return None
+    if kind == "int" and value.is_integer():
+        return int(value)
+    return value
+
+
+def _parse_inputs(name, columns, size):
+    """
+    Spec input columns as written to the output: numbers parsed to float (int for whole
+    values of 'int' fields), flags parsed to bool, None when unparseable, and defaults
+    filled in for missing columns, whether or not the row itself was valid.
+    """
+    parsed = {}
+    for field in SPECS.get(name, ()):
+        values = columns.get(field.name)
+        if values is None:
+            parsed[field.name] = [field.default] * size
+        elif field.numeric:
+            parsed[field.name] = [_parse_number(value, field.kind) for value in values]
+        elif field.kind == "bool":
+            parsed[field.name] = [parse_bool(value) for value in values]
+        else:
+            parsed[field.name] = list(values)
+    return parsed
+
+
+def process_chunk(name, columns):
+    """
+    Runs the calculator over one chunk of input columns.
+
+    Returns:
+    dict: Output column name -> list of values (input columns first, then results).
+    """
+    size = len(next(iter(columns.values()))) if columns else 0
+    output = dict(columns)
+    output.update(_parse_inputs(name, columns, size))
+
+    if has_batch(name):
+        result = get_batch_calculator(name)(columns)
+        for field, values in result.items():
+            output[field] = column_to_list(values)
+        return output
+
+    calculator = get_calculator(name)
+    names = list(columns)
+    results = [calculator(dict(zip(names, row))) for row in zip(*columns.values())] if names else []
+    for field, _ in RESULTS[name] + (("error", "str"),):
+        output[field] = [result.get(field) for result in results]
+    return output
+
+
+def _cell(value):
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+
+def _text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return str(_cell(value))
+
+
+class _CsvWriter:
+    def __init__(self, path, schema):
+        self.handle = _open_text(path, "w")
+        self.writer = csv.writer(self.handle)
+        self.fields = list(schema)
+        self.writer.writerow(self.fields)
+
+    def write(self, columns):
+        rows = zip(*(columns.get(field, itertools.repeat(None)) for field in self.fields))
+        self.writer.writerows(["" if value is None else _cell(value) for value in row] for row in rows)
+
+    def close(self):
+        if self.handle is not sys.stdout:
+            self.handle.close()
+        else:
+            self.handle.flush()
+
+
+class _JsonlWriter:
+    def __init__(self, path, schema):
+        self.handle = _open_text(path, "w")
+        self.fields = list(schema)
+
+    def write(self, columns):
+        rows = zip(*(columns.get(field, itertools.repeat(None)) for field in self.fields))
+        for row in rows:
+            self.handle.write(json.dumps(dict(zip(self.fields, row)), default=str))
+            self.handle.write("\n")
+
+    def close(self):
+        if self.handle is not sys.stdout:
+            self.handle.close()
+        else:
+            self.handle.flush()
+
+
+class _ParquetWriter:
+    # Column kind -> pyarrow type name; mappings and lists are stored as JSON strings.
+    TYPES = {"float": "float64", "int": "int64", "bool": "bool_"}
+
+    def __init__(self, path, schema):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.kinds = schema
+        self.schema = pa.schema([(field, getattr(pa, self.TYPES.get(kind, "string"))()) for field, kind in schema.items()])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, columns):
+        import pyarrow as pa
+
+        size = len(next(iter(columns.values()))) if columns else 0
+        arrays = []
+        for field, kind in self.kinds.items():
+            values = columns.get(field, [None] * size)
+            if kind == "bool":
+                values = [parse_bool(value) for value in values]
+            elif kind in self.TYPES:
+                # A fractional value in an 'int' column is an invalid input: written as null.
+                values = [_parse_number(value, kind) for value in values]
+                if kind == "int":
+                    values = [value if isinstance(value, int) else None for value in values]
+            else:
+                values = [_text(value) for value in values]
+            arrays.append(pa.array(values, type=self.schema.field(field).type))
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def _count_errors(columns):
+    if "error_mask" in columns:
+        return sum(1 for flagged in columns["error_mask"] if flagged)
+    return sum(1 for message in columns.get("error", ()) if message)
+
+
+def run(name, input_path, output_path, input_format=None, output_format=None,
+        chunk_size=DEFAULT_CHUNK_SIZE, workers=1):
+    """
+    Streams ``input_path`` through a calculator into ``output_path``.
+
+    Returns:
+    dict: 'rows', 'errors' and 'seconds'.
+    """
+    get_calculator(name)  # Fail fast on unknown names.
+    input_format = detect_format(input_path, input_format)
+    output_format = detect_format(output_path, output_format)
+    if chunk_size <= 0 or workers <= 0:
+        raise ValueError("Chunk size and workers must be positive.")
+
+    start = time.perf_counter()
+    chunks = read_chunks(input_path, input_format, chunk_size)
+    first = next(chunks, {})
+    writer = WRITERS[output_format](output_path, output_schema(name, first))
+    chunks = itertools.chain([first] if first else [], chunks)
+    rows = errors = 0
+
+    def emit(columns):
+        nonlocal rows, errors
+        writer.write(columns)
+        rows += len(next(iter(columns.values()))) if columns else 0
+        errors += _count_errors(columns)
+
+    try:
+        if workers == 1:
+            for columns in chunks:
+                emit(process_chunk(name, columns))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = collections.deque()
+                for columns in chunks:
+                    pending.append(pool.submit(process_chunk, name, columns))
+                    # Keep at most two chunks per worker in flight, written in input order.
+                    while len(pending) >= 2 * workers:
+                        emit(pending.popleft().result())
+                while pending:
+                    emit(pending.popleft().result())
+    finally:
+        writer.close()
+
+    return {"rows": rows, "errors": errors, "seconds": round(time.perf_counter() - start, 3)}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="tradingcalculators", description="Run trading calculators over files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List the available calculators.")
+
+    run_parser = commands.add_parser("run", help="Run a calculator over an input file.")
+    run_parser.add_argument("calculator", help="Registered calculator name (see 'list').")
+    run_parser.add_argument("--input", required=True, help="Input file (.csv, .jsonl or .parquet; '-' for stdin).")
+    run_parser.add_argument("--output", required=True, help="Output file (.csv, .jsonl or .parquet; '-' for stdout).")
+    run_parser.add_argument("--input-format", choices=FORMATS)
+    run_parser.add_argument("--output-format", choices=FORMATS)
+    run_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk.")
+    run_parser.add_argument("--workers", type=int, default=1, help="Processes used for chunks (default 1).")
+    run_parser.add_argument("--stats", action="store_true",
+                            help="Print call counts and phase latencies to stderr (with --workers 1).")
+    run_parser.add_argument("--profile", metavar="PATH", help="Write a cProfile of the run to PATH.")
+
+    serve_parser = commands.add_parser("serve", help="Serve the calculators over HTTP (requires uvicorn).")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--cpu-workers", type=int, default=None, help="Processes for CPU-heavy requests.")
+    serve_parser.add_argument("--io-workers", type=int, default=16, help="Threads for network-backed calculators.")
+    serve_parser.add_argument("--cache-size", type=int, default=0,
+                              help="Results memoized per pure calculator (default 0: disabled).")
+    serve_parser.add_argument("--instrument", action="store_true", help="Collect metrics for /instrumentation.")
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point of the ``tradingcalculators`` command.
+    """
+    options = build_parser().parse_args(argv)
+
+    if options.command == "list":
+        for name in available_calculators():
+            print(f"{name}{' (batch)' if has_batch(name) else ''}")
+        return 0
+
+    if options.command == "serve":
+        from .service import serve
+
+        serve(options.host, options.port, cpu_workers=options.cpu_workers, io_workers=options.io_workers,
+              cache_size=options.cache_size, instrument=options.instrument)
+        return 0
+
+    if options.calculator not in available_calculators():
+        print(f"Unknown calculator: {options.calculator}", file=sys.stderr)
+        return 2
+
+    if options.stats:
+        instrumentation.enable()
+    profiler = instrumentation.profile() if options.profile else contextlib.nullcontext()
+    try:
+        with profiler:
+            summary = run(
+                options.calculator, options.input, options.output,
+                input_format=options.input_format, output_format=options.output_format,
+                chunk_size=options.chunk_size, workers=options.workers,
+            )
+    except ImportError as e:
+        print(f"Error: {e.name or e} is required for this file format (pip install {e.name or 'pyarrow'}).",
+              file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{summary['rows']} rows ({summary['errors']} with errors) in {summary['seconds']}s", file=sys.stderr)
+    if options.profile:
+        profiler.dump(options.profile)
+    if options.stats:
+        print(json.dumps(instrumentation.export("json"), indent=2), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import functools
+
+from .instrumentation import record_exception
+from .rate_store import RateNotAvailable, get_default_rate_store
+from .schema import error_response, validate
+
+
+@functools.lru_cache(maxsize=None)
+def currency_symbol(currency):
+    """
+    Returns the display symbol for a currency code (the code itself if unknown).
+    """
+    try:
+        from forex_python.converter import CurrencyCodes
+    except ImportError:
+        return currency
+    return CurrencyCodes().get_symbol(currency) or currency
+
+
+def currency_converter(inputs):
+    """
+    Converts an amount from one currency to another based on the live exchange rate using forex-python.
+    Rates come from a shared RateStore, so repeated conversions reuse one cached rate table.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'amount' (float): The amount of money to convert.
+        - 'base_currency' (str): Currency code for the base currency (e.g., 'USD').
+        - 'target_currency' (str): Currency code for the target currency (e.g., 'INR').
+        - 'rate_store' (RateStore, optional): Rate source. Defaults to rate_store.get_default_rate_store().
+
+    Returns:
+    dict: A dictionary with the converted amount, exchange rate, and currency symbols, or an error message.
+    """
+    try:
+        # Extract and validate inputs
+        values, errors = validate("currency_converter", inputs)
+        if errors:
+            if errors[0]['code'] == 'invalid_type':
+                return {"error": "Invalid input: Ensure amount is a number.", "errors": errors}
+            return error_response(errors, "Amount must be non-negative.")
+
+        amount = values['amount']
+        base_currency = values['base_currency']
+        target_currency = values['target_currency']
+        rate_store = inputs.get('rate_store') or get_default_rate_store()
+
+        # Get the exchange rate and convert the amount
+        exchange_rate = rate_store.get_rate(base_currency, target_currency)
+        converted_amount = amount * exchange_rate
+
+        # Get currency symbols
+        base_symbol = currency_symbol(base_currency)
+        target_symbol = currency_symbol(target_currency)
+
+        return {
+            "amount": f"{base_symbol} {amount}",
+            "base_currency": base_currency,
+            "target_currency": target_currency,
+            "exchange_rate": round(exchange_rate, 4),
+            "converted_amount": f"{target_symbol} {round(converted_amount, 2)}"
+        }
+
+    except RateNotAvailable as e:
+        return {"error": str(e)}
+    except ValueError:
+        return {"error": "Invalid input: Ensure amount is a number."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "amount": 100,
+        "base_currency": "USD",
+        "target_currency": "INR"
+    }
+
+    result = currency_converter(inputs)
+    print(result)
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def debt_to_income_ratio_calculator(inputs):
     """
     Calculates the debt-to-income (DTI) ratio.
@@ -11,11 +15,12 @@ def debt_to_income_ratio_calculator(inputs):
     dict: A dictionary with the calculated DTI ratio or an error message.
     """
     try:
-        monthly_debt_payments = float(inputs.get('monthly_debt_payments', 0))
-        monthly_income = float(inputs.get('monthly_income', 0))
+        values, errors = validate("debt_to_income_ratio_calculator", inputs)
+        if errors:
+            return error_response(errors, "Monthly income must be positive.")
 
-        if monthly_income <= 0:
-            return {"error": "Monthly income must be positive."}
+        monthly_debt_payments = values['monthly_debt_payments']
+        monthly_income = values['monthly_income']
 
         dti_ratio = (monthly_debt_payments / monthly_income) * 100
 
@@ -28,13 +33,15 @@ def debt_to_income_ratio_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "monthly_debt_payments": 500,
-    "monthly_income": 3000
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "monthly_debt_payments": 500,
+        "monthly_income": 3000
+    }
 
-result = debt_to_income_ratio_calculator(inputs)
-print(result)
+    result = debt_to_income_ratio_calculator(inputs)
+    print(result)
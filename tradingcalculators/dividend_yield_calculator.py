@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def dividend_yield_calculator(inputs):
     """
     Calculates the dividend yield of a stock based on its annual dividend and current price.
@@ -12,11 +16,12 @@ def dividend_yield_calculator(inputs):
     """
     try:
         # Extract values from inputs with validation
-        annual_dividend = float(inputs.get('annual_dividend', 0))
-        stock_price = float(inputs.get('stock_price', 0))
+        values, errors = validate("dividend_yield_calculator", inputs)
+        if errors:
+            return error_response(errors, "Annual dividend must be non-negative and stock price must be positive.")
 
-        if annual_dividend < 0 or stock_price <= 0:
-            return {"error": "Annual dividend must be non-negative and stock price must be positive."}
+        annual_dividend = values['annual_dividend']
+        stock_price = values['stock_price']
 
         # Calculate dividend yield
         dividend_yield = (annual_dividend / stock_price) * 100  # Yield in percentage
@@ -30,13 +35,15 @@ def dividend_yield_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "annual_dividend": 5,
-    "stock_price": 100
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "annual_dividend": 5,
+        "stock_price": 100
+    }
 
-result = dividend_yield_calculator(inputs)
-print(result)
+    result = dividend_yield_calculator(inputs)
+    print(result)
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def expected_rate_of_return_calculator(inputs):
     """
     Calculates the expected rate of return based on initial investment, future value, and investment duration.
@@ -6,18 +10,19 @@ def expected_rate_of_return_calculator(inputs):
     inputs (dict): A dictionary with the following keys:
         - 'initial_investment' (float): Initial amount invested.
         - 'future_value' (float): Future value of the investment.
-        - 'years' (int): Number of years the money was invested.
+        - 'years' (float): Number of years the money was invested (fractions allowed).
 
     Returns:
     dict: A dictionary with the calculated expected rate of return.
     """
     try:
-        initial_investment = float(inputs.get('initial_investment', 0))
-        future_value = float(inputs.get('future_value', 0))
-        years = int(inputs.get('years', 0))
+        values, errors = validate("expected_rate_of_return_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be positive.")
 
-        if initial_investment <= 0 or future_value <= 0 or years <= 0:
-            return {"error": "All input values must be positive."}
+        initial_investment = values['initial_investment']
+        future_value = values['future_value']
+        years = values['years']
 
         rate_of_return = ((future_value / initial_investment) ** (1 / years) - 1) * 100
 
@@ -31,14 +36,16 @@ def expected_rate_of_return_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "initial_investment": 10000,
-    "future_value": 20000,
-    "years": 5
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "initial_investment": 10000,
+        "future_value": 20000,
+        "years": 5
+    }
 
-result = expected_rate_of_return_calculator(inputs)
-print(result)
+    result = expected_rate_of_return_calculator(inputs)
+    print(result)
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def fixed_deposit_interest_calculator(inputs):
     """
     Calculates the maturity value of a fixed deposit with compounding interest.
@@ -13,19 +17,20 @@ def fixed_deposit_interest_calculator(inputs):
     dict: A dictionary with the maturity value or an error message.
     """
     try:
-        principal = float(inputs.get('principal', 0))
-        rate_of_interest = float(inputs.get('rate_of_interest', 0)) / 100
-        years = int(inputs.get('years', 0))
-        compounds_per_year = int(inputs.get('compounds_per_year', 1))
+        values, errors = validate("fixed_deposit_interest_calculator", inputs)
+        if errors:
+            return error_response(errors, "All inputs must be non-negative, and years/compounds must be positive.")
 
-        if principal < 0 or rate_of_interest < 0 or years <= 0 or compounds_per_year <= 0:
-            return {"error": "All inputs must be non-negative, and years/compounds must be positive."}
+        principal = values['principal']
+        rate_of_interest = values['rate_of_interest'] / 100
+        years = values['years']
+        compounds_per_year = values['compounds_per_year']
 
         maturity_value = principal * (1 + rate_of_interest / compounds_per_year) ** (compounds_per_year * years)
 
         return {
             "principal": principal,
-            "rate_of_interest": inputs.get('rate_of_interest', 0),
+            "rate_of_interest": values['rate_of_interest'],
             "years": years,
             "compounds_per_year": compounds_per_year,
             "maturity_value": round(maturity_value, 2)
@@ -34,15 +39,17 @@ def fixed_deposit_interest_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "principal": 50000,
-    "rate_of_interest": 6.5,
-    "years": 5,
-    "compounds_per_year": 4
-}
-
-result = fixed_deposit_interest_calculator(inputs)
-print(result)
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "principal": 50000,
+        "rate_of_interest": 6.5,
+        "years": 5,
+        "compounds_per_year": 4
+    }
+
+    result = fixed_deposit_interest_calculator(inputs)
+    print(result)
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def future_value_calculator(inputs):
     """
     Calculates the future value of a single investment based on the annual rate of return.
@@ -12,18 +16,19 @@ def future_value_calculator(inputs):
     dict: A dictionary with the calculated future value.
     """
     try:
-        initial_investment = float(inputs.get('initial_investment', 0))
-        rate_of_return = float(inputs.get('rate_of_return', 0)) / 100
-        years = int(inputs.get('years', 0))
+        values, errors = validate("future_value_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be non-negative.")
 
-        if initial_investment < 0 or rate_of_return < 0 or years < 0:
-            return {"error": "All input values must be non-negative."}
+        initial_investment = values['initial_investment']
+        rate_of_return = values['rate_of_return'] / 100
+        years = values['years']
 
         future_value = initial_investment * (1 + rate_of_return) ** years
 
         return {
             "initial_investment": initial_investment,
-            "rate_of_return": inputs.get('rate_of_return', 0),
+            "rate_of_return": values['rate_of_return'],
             "years": years,
             "future_value": round(future_value, 2)
         }
@@ -31,14 +36,16 @@ def future_value_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "initial_investment": 10000,
-    "rate_of_return": 7,
-    "years": 10
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "initial_investment": 10000,
+        "rate_of_return": 7,
+        "years": 10
+    }
 
-result = future_value_calculator(inputs)
-print(result)
+    result = future_value_calculator(inputs)
+    print(result)
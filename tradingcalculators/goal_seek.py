@@ -0,0 +1,417 @@
+"""
+Goal seek: solves a calculator backwards for one of its inputs.
+
+Given a target output (the SIP future value, a loan's monthly EMI, ...) and every
+other input, goal_seek_batch() finds the value of ``solve_for`` that produces it, for
+whole columns of targets at once:
+
+    sip_calculator                     future_value    monthly_investment, years, rate_of_return
+    loan_emi_calculator                monthly_emi     loan_amount, loan_tenure, interest_rate
+    investment_return_calculator       future_value    initial_investment, annual_contribution,
+                                                       years, rate_of_return
+    fixed_deposit_interest_calculator  maturity_value  principal, years, rate_of_interest
+
+Amounts and tenures are solved in closed form. Rates use closed forms where they
+exist (fixed deposits) and otherwise a vectorized Newton iteration on the log of the
+output, safeguarded by bisection (solve_monotone()), so 100k targets cost a few dozen
+array passes.
+Integer inputs (years, loan_tenure) are solved exactly and also returned as the
+smallest whole number that reaches the target ('<field>_whole'); other inputs are
+returned at their reporting precision, rounded towards reaching the target. "Reaching"
+means an output of at least the target, except for loans, where the target EMI is a
+budget and the achieved EMI is at most the target.
+"""
+import numpy as np
+
+from .batch import (
+    as_float_column, compound_value, has_field, investment_future_value, monthly_emi, sip_future_value,
+)
+from .instrumentation import record_exception
+from .schema import SPECS, error_response, validate, validate_columns
+
+MAX_RATE = 1_000.0  # Upper bound (annual %) when solving for a rate.
+AT_MOST = frozenset({"loan_emi_calculator"})  # Goals whose target is a ceiling, not a floor.
+
+
+def solve_monotone(function, target, low, high, guess=None, log=False, tolerance=1e-10, max_iterations=100):
+    """
+    Solves function(x, rows) = target row by row, for a function that is monotone in x
+    on [low, high]. Newton steps (with a finite-difference derivative) are taken while
+    they stay inside the bracket and at least halve it every other step; otherwise the
+    step bisects, so every bracketed row converges even where Newton alone would crawl.
+
+    Parameters:
+    function (callable): function(x, rows) -> values for the rows indexed by ``rows``.
+    target (array): Target value per row.
+    low, high (float): Bracket searched for the solution.
+    guess (float): Starting point (default: the middle of the bracket).
+    log (bool): Solve log(function) = log(target) instead, which makes exponential
+        growth curves close to linear (function and target must be positive).
+    tolerance (float): Convergence threshold, relative to the target.
+    max_iterations (int): Iterations before giving up on a row.
+
+    Returns:
+    numpy.ndarray: Solution per row (NaN where the bracket holds no solution).
+    """
+    target = np.asarray(target, dtype=np.float64)
+    size = target.size
+    rows = np.arange(size)
+    low = np.full(size, float(low))
+    high = np.full(size, float(high))
+    solution = np.full(size, np.nan)
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        if log:
+            goal = np.log(target)
+            scale = np.ones(size)
+
+            def residual(x, index):
+                return np.log(function(x, index)) - goal[index]
+        else:
+            scale = np.maximum(np.abs(target), 1.0)
+
+            def residual(x, index):
+                return function(x, index) - target[index]
+
+        f_low = residual(low, rows)
+        f_high = residual(high, rows)
+        active = ~np.isnan(f_low) & ~np.isnan(f_high) & ((np.sign(f_low) != np.sign(f_high)) | (f_low == 0))
+        x = np.clip(np.full(size, (low[0] + high[0]) / 2 if guess is None else float(guess)), low, high)
+        width = high - low
+
+        for _ in range(max_iterations):
+            index = np.flatnonzero(active)
+            if not index.size:
+                break
+            current = x[index]
+            value = residual(current, index)
+
+            below = np.sign(value) == np.sign(f_low[index])
+            low[index] = np.where(below, current, low[index])
+            f_low[index] = np.where(below, value, f_low[index])
+            high[index] = np.where(below, high[index], current)
+
+            step = 1e-7 * np.maximum(np.abs(current), 1e-3)
+            derivative = (residual(current + step, index) - value) / step
+            newton = current - value / derivative
+            new_width = high[index] - low[index]
+            # Bisect when Newton leaves the bracket or the bracket is not shrinking fast enough.
+            inside = np.isfinite(newton) & (newton > low[index]) & (newton < high[index])
+            inside &= new_width <= 0.5 * width[index]
+            width[index] = np.where(inside, width[index], new_width)
+            x[index] = np.where(inside, newton, (low[index] + high[index]) / 2)
+
+            done = (np.abs(value) <= tolerance * scale[index]) | (
+                new_width <= tolerance * np.maximum(np.abs(current), 1.0)
+            )
+            solution[index[done]] = current[done]
+            active[index[done]] = False
+    return solution
+
+
+def _rows(cols, rows):
+    return {field: values[rows] for field, values in cols.items()}
+
+
+def _solve_rate(value, field, cols, target, guess=10.0):
+    def function(rate, rows):
+        inputs = _rows(cols, rows)
+        inputs[field] = rate
+        return value(inputs)
+
+    return solve_monotone(function, target, 0.0, MAX_RATE, guess=guess, log=True)
+
+
+def _sip_value(cols):
+    return sip_future_value(cols["monthly_investment"], cols["rate_of_return"] / 1200, cols["years"] * 12)
+
+
+def _sip_solve(solve_for, cols, target):
+    monthly_rate = cols["rate_of_return"] / 1200
+    months = cols["years"] * 12
+    if solve_for == "monthly_investment":
+        return target / sip_future_value(1.0, monthly_rate, months)
+    if solve_for == "years":
+        monthly_investment = cols["monthly_investment"]
+        months = np.where(
+            monthly_rate == 0,
+            target / monthly_investment,
+            np.log1p(target * monthly_rate / (monthly_investment * (1 + monthly_rate))) / np.log1p(monthly_rate),
+        )
+        return months / 12
+    return _solve_rate(_sip_value, "rate_of_return", cols, target)
+
+
+def _loan_value(cols):
+    return monthly_emi(cols["loan_amount"], cols["interest_rate"] / 1200, cols["loan_tenure"] * 12)
+
+
+def _loan_solve(solve_for, cols, target):
+    monthly_rate = cols["interest_rate"] / 1200
+    if solve_for == "loan_amount":
+        return target / monthly_emi(1.0, monthly_rate, cols["loan_tenure"] * 12)
+    if solve_for == "loan_tenure":
+        loan_amount = cols["loan_amount"]
+        months = np.where(
+            monthly_rate == 0,
+            loan_amount / target,
+            -np.log1p(-loan_amount * monthly_rate / target) / np.log1p(monthly_rate),
+        )
+        return months / 12
+    return _solve_rate(_loan_value, "interest_rate", cols, target)
+
+
+def _investment_value(cols):
+    return investment_future_value(
+        cols["initial_investment"], cols["annual_contribution"], cols["rate_of_return"] / 100, cols["years"],
+    )
+
+
+def _investment_solve(solve_for, cols, target):
+    rate = cols["rate_of_return"] / 100
+    years = cols["years"]
+    initial_investment = cols["initial_investment"]
+    annual_contribution = cols["annual_contribution"]
+    growth = (1 + rate) ** years
+    annuity = np.where(rate == 0, years, (growth - 1) / rate)
+    if solve_for == "initial_investment":
+        return (target - annual_contribution * annuity) / growth
+    if solve_for == "annual_contribution":
+        return (target - initial_investment * growth) / annuity
+    if solve_for == "years":
+        # FV = (I + C/r) * (1 + r)^n - C/r, so n = log((FV + C/r) / (I + C/r)) / log(1 + r).
+        perpetuity = annual_contribution / rate
+        return np.where(
+            rate == 0,
+            (target - initial_investment) / annual_contribution,
+            np.log((target + perpetuity) / (initial_investment + perpetuity)) / np.log1p(rate),
+        )
+    return _solve_rate(_investment_value, "rate_of_return", cols, target)
+
+
+def _deposit_value(cols):
+    return compound_value(cols["principal"], cols["rate_of_interest"] / 100, cols["years"], cols["compounds_per_year"])
+
+
+def _deposit_solve(solve_for, cols, target):
+    compounds_per_year = cols["compounds_per_year"]
+    if solve_for == "principal":
+        return target / compound_value(1.0, cols["rate_of_interest"] / 100, cols["years"], compounds_per_year)
+    growth = target / cols["principal"]
+    if solve_for == "years":
+        period_rate = cols["rate_of_interest"] / 100 / compounds_per_year
+        return np.log(growth) / (compounds_per_year * np.log1p(period_rate))
+    periods = compounds_per_year * cols["years"]
+    return compounds_per_year * np.expm1(np.log(growth) / periods) * 100
+
+
+# Calculator -> (result field the target refers to, forward model, solver,
+#                solvable input -> decimals the solution is rounded to).
+GOALS = {
+    "sip_calculator": (
+        "future_value", _sip_value, _sip_solve,
+        {"monthly_investment": 2, "years": 4, "rate_of_return": 4},
+    ),
+    "loan_emi_calculator": (
+        "monthly_emi", _loan_value, _loan_solve,
+        {"loan_amount": 2, "loan_tenure": 4, "interest_rate": 4},
+    ),
+    "investment_return_calculator": (
+        "future_value", _investment_value, _investment_solve,
+        {"initial_investment": 2, "annual_contribution": 2, "years": 4, "rate_of_return": 4},
+    ),
+    "fixed_deposit_interest_calculator": (
+        "maturity_value", _deposit_value, _deposit_solve,
+        {"principal": 2, "years": 4, "rate_of_interest": 4},
+    ),
+}
+
+
+def _goal(calculator, solve_for):
+    if calculator not in GOALS:
+        raise KeyError(f"Goal seek is not available for {calculator!r}.")
+    solvable = GOALS[calculator][3]
+    if solve_for not in solvable:
+        raise ValueError(f"{calculator} can solve for one of: {', '.join(solvable)}.")
+    return GOALS[calculator]
+
+
+def _reaches(calculator, achieved, target):
+    # Loans are solved for an EMI budget (at most the target); the other goals for an
+    # output of at least the target. Both sides are compared at the cent, as results
+    # are reported: rounding only one would make sub-cent targets unreachable.
+    achieved = np.round(achieved, 2)
+    target = np.round(target, 2)
+    if calculator in AT_MOST:
+        return achieved <= target
+    return achieved >= target
+
+
+def goal_seek_batch(calculator, solve_for, columns):
+    """
+    Solves ``calculator`` for ``solve_for`` on every row of ``columns``.
+
+    Parameters:
+    calculator (str): One of the calculators in GOALS (e.g., 'sip_calculator').
+    solve_for (str): Input to solve for (e.g., 'monthly_investment').
+    columns (mapping): Column 'target' (the desired output, e.g. the future value) plus
+        the calculator's other inputs, with the same names and defaults as its batch
+        version. Scalars are broadcast.
+
+    Returns:
+    dict: ``solve_for`` array, '<solve_for>_whole' for integer inputs, 'achieved' (the
+        output at the reported value, whole for integer inputs; it always reaches the
+        target on valid rows), 'unreachable' (rows
+        with valid inputs but no solution in range) and 'error_mask' arrays.
+
+    Raises:
+    KeyError: If goal seek is not available for ``calculator``.
+    ValueError: If ``solve_for`` cannot be solved for.
+    """
+    output, value, solve, solvable = _goal(calculator, solve_for)
+    fields = [field for field in SPECS[calculator] if field.numeric]
+    field = next(field for field in fields if field.name == solve_for)
+
+    known = {item.name: columns[item.name] if has_field(columns, item.name) else item.default for item in fields}
+    known[solve_for] = 1  # Placeholder that passes the spec; its errors are ignored below.
+    cols, _, field_errors = validate_columns(calculator, known)
+    target = as_float_column(columns["target"] if has_field(columns, "target") else np.nan).ravel()
+
+    size = max(target.size, next(iter(cols.values())).size)
+    target = np.broadcast_to(target, size)
+    cols = {name: np.broadcast_to(values, size) for name, values in cols.items()}
+    error_mask = np.zeros(size, dtype=bool)
+    for name, masks in field_errors.items():
+        if name != solve_for:
+            for mask in masks.values():
+                error_mask |= np.broadcast_to(mask, size)
+    with np.errstate(invalid="ignore"):
+        error_mask |= ~(target > 0) | ~np.isfinite(target)
+
+    valid = np.flatnonzero(~error_mask)
+    solution = np.full(size, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        if valid.size:
+            solution[valid] = solve(solve_for, _rows(cols, valid), target[valid])
+        unreachable = ~error_mask & ~(np.isfinite(solution) & (solution >= 0))
+        error_mask = error_mask | unreachable
+
+        # Report the value nearest the exact solution at the field's precision (whole
+        # numbers for integer inputs) if it still reaches the target, else the next one
+        # that does. Rounding is applied to the unrounded solution, so a solution just
+        # past a whole number (10.00003 years) reports the next one (11).
+        decimals = 0 if field.kind == "int" else solvable[solve_for]
+        scale = 10.0 ** decimals
+        nearest = np.round(solution, decimals)
+        other = np.where(nearest * scale < solution * scale, np.ceil(solution * scale), np.floor(solution * scale)) / scale
+        if field.kind == "int" and field.gt is not None:
+            nearest = np.maximum(nearest, np.floor(field.gt) + 1)
+            other = np.maximum(other, np.floor(field.gt) + 1)
+        achieved = value(dict(cols, **{solve_for: nearest}))
+        reaches = _reaches(calculator, achieved, target)
+        reported = np.where(reaches, nearest, other)
+        achieved = np.where(reaches, achieved, value(dict(cols, **{solve_for: reported})))
+        # Defensive: a row whose reported value still misses the target has no solution.
+        unreachable |= ~error_mask & ~_reaches(calculator, achieved, target)
+        error_mask = error_mask | unreachable
+
+        if field.kind == "int":
+            out = {solve_for: np.round(solution, solvable[solve_for]), f"{solve_for}_whole": reported}
+        else:
+            out = {solve_for: reported}
+
+    out["achieved"] = np.round(achieved, 2)
+    for values in out.values():
+        values[error_mask] = np.nan
+    out["unreachable"] = unreachable
+    out["error_mask"] = error_mask
+    return out
+
+
+def goal_seek(inputs):
+    """
+    Solves a calculator backwards for one input.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'calculator' (str): One of 'sip_calculator', 'loan_emi_calculator',
+          'investment_return_calculator' or 'fixed_deposit_interest_calculator'.
+        - 'solve_for' (str): Input to solve for (e.g., 'monthly_investment').
+        - 'target' (float): Desired output (future value, monthly EMI or maturity value).
+        - Every other input of the calculator.
+
+    Returns:
+    dict: The solved input (plus its whole-number value for years/tenures) and the
+        output it achieves, or an error message.
+    """
+    try:
+        calculator = inputs.get('calculator')
+        solve_for = inputs.get('solve_for')
+        try:
+            output = _goal(calculator, solve_for)[0]
+        except KeyError as e:
+            return {"error": str(e.args[0])}
+
+        known = {key: value for key, value in inputs.items() if key not in ('calculator', 'solve_for', 'target')}
+        _, errors = validate(calculator, dict(known, **{solve_for: 1}))
+        errors = [error for error in errors if error['field'] != solve_for]
+        if errors:
+            return error_response(errors)
+        target = float(inputs.get('target'))
+        if not target > 0:
+            return {"error": "Target must be positive."}
+
+        result = goal_seek_batch(calculator, solve_for, dict(known, target=target))
+        if result["unreachable"][0]:
+            return {"error": f"No {solve_for} in range reaches a {output} of {target}."}
+
+        response = {"calculator": calculator, "solve_for": solve_for, "target": target}
+        for field, values in result.items():
+            if field not in ("unreachable", "error_mask"):
+                value = float(values[0])
+                response[field] = int(value) if field.endswith("_whole") else value
+        return response
+
+    except (TypeError, ValueError) as e:
+        return {"error": f"Invalid input: {e}"}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "calculator": "sip_calculator",
+        "solve_for": "monthly_investment",
+        "target": 1_000_000,
+        "rate_of_return": 12,
+        "years": 10,
+    }
+
+    result = goal_seek(inputs)
+    print(result)
+
+    # A target just past 10 whole years needs 11.
+    result = goal_seek({
+        "calculator": "sip_calculator",
+        "solve_for": "years",
+        "target": 232340.40,
+        "monthly_investment": 1000,
+        "rate_of_return": 12,
+    })
+    print(result)
+    assert result["years_whole"] == 11 and result["achieved"] >= result["target"]
+
+    # Targets produced by valid inputs (with sub-cent noise) are all reachable.
+    rng = np.random.default_rng(0)
+    rows = 10_000
+    loans = {
+        "loan_amount": rng.uniform(1e4, 1e6, rows),
+        "loan_tenure": rng.integers(1, 31, rows),
+        "interest_rate": rng.uniform(0.5, 25, rows),
+    }
+    target = _loan_value(validate_columns("loan_emi_calculator", loans)[0]) + rng.uniform(-0.005, 0.005, rows)
+    result = goal_seek_batch("loan_emi_calculator", "interest_rate", dict(loans, target=target))
+    print("unreachable loan rates:", int(result["unreachable"].sum()))
+    assert result["unreachable"].sum() == 0
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def inflation_impact_calculator(inputs):
     """
     Calculates the future value of money adjusted for inflation.
@@ -12,19 +16,20 @@ def inflation_impact_calculator(inputs):
     dict: A dictionary with the adjusted future value and the reduction in purchasing power or an error message.
     """
     try:
-        current_amount = float(inputs.get('current_amount', 0))
-        inflation_rate = float(inputs.get('inflation_rate', 0)) / 100
-        years = int(inputs.get('years', 0))
+        values, errors = validate("inflation_impact_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be non-negative.")
 
-        if current_amount < 0 or inflation_rate < 0 or years < 0:
-            return {"error": "All input values must be non-negative."}
+        current_amount = values['current_amount']
+        inflation_rate = values['inflation_rate'] / 100
+        years = values['years']
 
         future_value = current_amount / ((1 + inflation_rate) ** years)
         purchasing_power_loss = current_amount - future_value
 
         return {
             "current_amount": current_amount,
-            "inflation_rate": inputs.get('inflation_rate', 0),
+            "inflation_rate": values['inflation_rate'],
             "years": years,
             "future_value_adjusted": round(future_value, 2),
             "purchasing_power_loss": round(purchasing_power_loss, 2)
@@ -33,14 +38,16 @@ def inflation_impact_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "current_amount": 10000,
-    "inflation_rate": 3,
-    "years": 10
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "current_amount": 10000,
+        "inflation_rate": 3,
+        "years": 10
+    }
 
-result = inflation_impact_calculator(inputs)
-print(result)
+    result = inflation_impact_calculator(inputs)
+    print(result)
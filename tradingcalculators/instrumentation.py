@@ -0,0 +1,460 @@
+"""
+Opt-in instrumentation for the calculators.
+
+While enabled, every calculator resolved through get_calculator() or
+get_batch_calculator() is wrapped to record, per calculator:
+
+    - call counts;
+    - latency histograms for the 'validation', 'compute', 'io' and 'total' phases
+      (compute is the call time not spent validating inputs or waiting on I/O);
+    - error counts by type: the exception class for unexpected failures,
+      'validation:<code>' for rejected inputs (see schema.ERROR_CODES), 'ValueError'
+      for unparseable inputs and 'rejected' for any other error result.
+
+Network lookups (yf.download, forex-python rate tables) are also timed per source.
+
+Disabled (the default) it costs nothing on the hot path: get_calculator() returns the
+plain functions, the compiled validators are not wrapped, and the remaining hooks
+(io_phase(), record_exception()) return after one global check. Enable it before the
+calculators are resolved, e.g. at process start, or set TRADINGCALCULATORS_INSTRUMENT=1.
+Enabled, it adds a few microseconds per call (timers plus one locked histogram update).
+
+Exporters turn the collected data into a report: export("json") returns a snapshot
+dict, export("prometheus") the Prometheus text exposition format, and
+register_exporter() adds others. profile() captures a cProfile of any block of code
+on demand, and enable(trace=N) keeps the last N calls with their phase timings.
+
+Example:
+    from tradingcalculators import get_calculator, instrumentation
+
+    instrumentation.enable()
+    get_calculator("roi_calculator")({"initial_investment": 100, "final_value": 120})
+    print(instrumentation.export("prometheus"))
+"""
+import bisect
+import collections
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+
+# Histogram bucket upper bounds, in seconds (1 microsecond to 10 seconds).
+BUCKETS = (
+    1e-06, 2.5e-06, 5e-06, 1e-05, 2.5e-05, 5e-05, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+PHASES = ("validation", "compute", "io", "total")
+
+_collector = None
+_local = threading.local()
+_perf_counter = time.perf_counter
+_bisect_left = bisect.bisect_left
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram (Prometheus-style cumulative buckets on export).
+    """
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[_bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket holding the q-quantile (None if empty,
+        inf if it falls beyond the last bucket).
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def summary(self):
+        def ms(seconds):
+            return None if seconds is None else round(seconds * 1000, 4)
+
+        return {
+            "count": self.count,
+            "total_ms": ms(self.sum),
+            "mean_ms": ms(self.sum / self.count) if self.count else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p99_ms": ms(self.quantile(0.99)),
+        }
+
+
+class _Call:
+    __slots__ = ("validation", "io", "exception")
+
+    def __init__(self):
+        self.validation = 0.0
+        self.io = 0.0
+        self.exception = None
+
+
+class Collector:
+    """
+    Thread-safe store of call counts, phase histograms and error counts.
+
+    Parameters:
+    trace (int): Number of recent calls kept for recent_calls() (0 disables tracing).
+    """
+
+    def __init__(self, trace=0):
+        self.calls = collections.Counter()
+        self.errors = collections.defaultdict(collections.Counter)
+        self.phases = collections.defaultdict(lambda: {phase: Histogram() for phase in PHASES})
+        self.io_sources = collections.defaultdict(Histogram)
+        self.recent = collections.deque(maxlen=trace) if trace else None
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def record_call(self, name, total, validation, io_seconds, error=None):
+        compute = total - validation - io_seconds
+        if compute < 0.0:
+            compute = 0.0
+        with self._lock:
+            # Looked up (and created on first use) under the lock, so two threads
+            # cannot race on a calculator's first call or a concurrent snapshot().
+            phases = self.phases[name]
+            total_histogram, compute_histogram = phases["total"], phases["compute"]
+            self.calls[name] += 1
+            total_histogram.counts[_bisect_left(BUCKETS, total)] += 1
+            total_histogram.count += 1
+            total_histogram.sum += total
+            compute_histogram.counts[_bisect_left(BUCKETS, compute)] += 1
+            compute_histogram.count += 1
+            compute_histogram.sum += compute
+            if validation:
+                phases["validation"].observe(validation)
+            if io_seconds:
+                phases["io"].observe(io_seconds)
+            if error is not None:
+                self.errors[name][error] += 1
+            if self.recent is not None:
+                self.recent.append({
+                    "calculator": name,
+                    "at": time.time(),
+                    "total_ms": round(total * 1000, 4),
+                    "validation_ms": round(validation * 1000, 4),
+                    "io_ms": round(io_seconds * 1000, 4),
+                    "error": error,
+                })
+
+    def record_io(self, source, seconds):
+        with self._lock:
+            self.io_sources[source].observe(seconds)
+
+    def snapshot(self):
+        """
+        Returns the collected data as a JSON-friendly dict.
+        """
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "calculators": {
+                    name: {
+                        "calls": self.calls[name],
+                        "errors": dict(self.errors.get(name, {})),
+                        "phases": {phase: histogram.summary()
+                                   for phase, histogram in self.phases[name].items() if histogram.count},
+                    }
+                    for name in sorted(self.calls)
+                },
+                "io": {source: histogram.summary() for source, histogram in sorted(self.io_sources.items())},
+            }
+
+
+def _classify(result, call):
+    if call.exception is not None:
+        return type(call.exception).__name__
+    errors = result.get("errors")
+    if errors:
+        return f"validation:{errors[0].get('code', 'invalid')}"
+    if str(result["error"]).startswith("Invalid input"):
+        return "ValueError"
+    return "rejected"
+
+
+def instrument(name, function):
+    """
+    Wraps a calculator (or batch function) so its calls are recorded under ``name``.
+    """
+    @functools.wraps(function)
+    def instrumented(inputs, *args, **kwargs):
+        collector = _collector
+        if collector is None:
+            return function(inputs, *args, **kwargs)
+        outer = getattr(_local, "call", None)
+        call = _local.call = _Call()
+        start = _perf_counter()
+        try:
+            result = function(inputs, *args, **kwargs)
+        except BaseException as e:
+            collector.record_call(name, _perf_counter() - start, call.validation, call.io, type(e).__name__)
+            raise
+        finally:
+            _local.call = outer
+        total = _perf_counter() - start
+        error = _classify(result, call) if type(result) is dict and "error" in result else None
+        collector.record_call(name, total, call.validation, call.io, error)
+        if outer is not None:
+            # Nested calculators (e.g. grids of calls) keep the outer phase split exact.
+            outer.validation += call.validation
+            outer.io += call.io
+        return result
+
+    instrumented.__wrapped_calculator__ = function
+    return instrumented
+
+
+def _timed_validator(validator):
+    @functools.wraps(validator)
+    def timed(inputs):
+        start = _perf_counter()
+        try:
+            return validator(inputs)
+        finally:
+            call = getattr(_local, "call", None)
+            if call is not None:
+                call.validation += _perf_counter() - start
+
+    return timed
+
+
+class io_phase:
+    """
+    Context manager timing a network lookup against ``source`` (e.g. 'yfinance').
+    """
+    __slots__ = ("source", "start")
+
+    def __init__(self, source):
+        self.source = source
+
+    def __enter__(self):
+        self.start = _perf_counter() if _collector is not None else None
+        return self
+
+    def __exit__(self, *exc_info):
+        collector = _collector
+        if self.start is None or collector is None:
+            return False
+        elapsed = _perf_counter() - self.start
+        collector.record_io(self.source, elapsed)
+        call = getattr(_local, "call", None)
+        if call is not None:
+            call.io += elapsed
+        return False
+
+
+def record_exception(exception):
+    """
+    Notes the exception a calculator is about to turn into an error result, so the
+    error is counted under its type.
+    """
+    if _collector is None:
+        return
+    call = getattr(_local, "call", None)
+    if call is not None:
+        call.exception = exception
+
+
+def is_enabled():
+    return _collector is not None
+
+
+def enable(trace=0):
+    """
+    Starts collecting (a no-op if already enabled) and returns the Collector.
+
+    Parameters:
+    trace (int): Number of recent calls to keep for recent_calls().
+    """
+    global _collector
+    from . import _resolved, schema
+
+    if _collector is not None:
+        return _collector
+    for name, validator in list(schema.VALIDATORS.items()):
+        schema.VALIDATORS[name] = _timed_validator(validator)
+    _resolved.clear()  # get_calculator() hands out instrumented functions from now on.
+    _collector = Collector(trace)
+    return _collector
+
+
+def disable():
+    """
+    Stops collecting and restores the uninstrumented validators and calculators.
+    """
+    global _collector
+    from . import _resolved, schema
+
+    if _collector is None:
+        return
+    _collector = None
+    for name, validator in list(schema.VALIDATORS.items()):
+        schema.VALIDATORS[name] = getattr(validator, "__wrapped__", validator)
+    _resolved.clear()
+
+
+def reset():
+    """
+    Clears the collected data (keeps instrumentation enabled).
+    """
+    global _collector
+    if _collector is not None:
+        _collector = Collector(_collector.recent.maxlen if _collector.recent is not None else 0)
+
+
+def recent_calls():
+    """
+    Returns the traced recent calls, oldest first (empty unless enabled with trace > 0).
+    """
+    if _collector is None or _collector.recent is None:
+        return []
+    return list(_collector.recent)
+
+
+def snapshot():
+    """
+    Returns the collected data as a dict (empty sections when disabled).
+    """
+    if _collector is None:
+        return {"enabled": False, "calculators": {}, "io": {}}
+    return dict(_collector.snapshot(), enabled=True)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, labels, histogram):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(BUCKETS, histogram.counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{labels},le="{bound!r}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{metric}_sum{{{labels}}} {histogram.sum!r}")
+    lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def prometheus_text(collector=None):
+    """
+    Returns the collected data in the Prometheus text exposition format.
+    """
+    collector = collector or _collector
+    if collector is None:
+        return ""
+    with collector._lock:
+        lines = [
+            "# HELP tradingcalculators_calls_total Calculator calls.",
+            "# TYPE tradingcalculators_calls_total counter",
+        ]
+        for name in sorted(collector.calls):
+            lines.append(f'tradingcalculators_calls_total{{calculator="{_label(name)}"}} {collector.calls[name]}')
+
+        lines += [
+            "# HELP tradingcalculators_errors_total Calculator calls that returned an error, by type.",
+            "# TYPE tradingcalculators_errors_total counter",
+        ]
+        for name in sorted(collector.errors):
+            for kind, count in sorted(collector.errors[name].items()):
+                lines.append(
+                    f'tradingcalculators_errors_total{{calculator="{_label(name)}",type="{_label(kind)}"}} {count}'
+                )
+
+        lines += [
+            "# HELP tradingcalculators_phase_seconds Calculator latency by phase.",
+            "# TYPE tradingcalculators_phase_seconds histogram",
+        ]
+        for name in sorted(collector.phases):
+            for phase, histogram in collector.phases[name].items():
+                if histogram.count:
+                    labels = f'calculator="{_label(name)}",phase="{phase}"'
+                    lines += _histogram_lines("tradingcalculators_phase_seconds", labels, histogram)
+
+        lines += [
+            "# HELP tradingcalculators_io_seconds Latency of network lookups by source.",
+            "# TYPE tradingcalculators_io_seconds histogram",
+        ]
+        for source, histogram in sorted(collector.io_sources.items()):
+            lines += _histogram_lines("tradingcalculators_io_seconds", f'source="{_label(source)}"', histogram)
+    return "\n".join(lines) + "\n"
+
+
+EXPORTERS = {
+    "json": lambda collector: snapshot(),
+    "prometheus": prometheus_text,
+}
+
+
+def register_exporter(name, exporter):
+    """
+    Registers ``exporter(collector)`` under ``name`` for export(). The collector is None
+    while instrumentation is disabled.
+    """
+    EXPORTERS[name] = exporter
+
+
+def export(name="json"):
+    """
+    Runs the exporter registered under ``name`` ('json', 'prometheus' or a registered one).
+    """
+    try:
+        exporter = EXPORTERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown exporter: {name!r}") from None
+    return exporter(_collector)
+
+
+class profile:
+    """
+    Captures a cProfile of the enclosed block on demand.
+
+    Example:
+        with instrumentation.profile() as captured:
+            run_calculator("sip_calculator", inputs)
+        print(captured.report(limit=10))
+    """
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self):
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.disable()
+        return False
+
+    def report(self, sort="cumulative", limit=25):
+        """
+        Returns the pstats table of the capture as text.
+        """
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def dump(self, path):
+        """
+        Writes the raw profile (readable with pstats or snakeviz) to ``path``.
+        """
+        self.profiler.dump_stats(path)
+
@@ -0,0 +1,76 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
+def investment_return_calculator(inputs):
+    """
+    Calculates the future value of an investment with regular annual contributions and a specified return rate.
+    Error handling included for missing or invalid input values.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'initial_investment' (float): Initial amount invested.
+        - 'annual_contribution' (float): Amount added every year.
+        - 'rate_of_return' (float): Expected annual rate of return (in percentage).
+        - 'years' (int): Number of years the money is invested.
+        - 'include_trajectory' (bool, optional): Also return the value at the end of each year.
+
+    Returns:
+    dict: A dictionary with details of the investment including the final value or an error message.
+        When 'include_trajectory' is set, 'yearly_values' lists the value after years 0..years.
+    """
+    try:
+        # Extract values from inputs with validation
+        values, errors = validate("investment_return_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be non-negative.")
+
+        initial_investment = values['initial_investment']
+        annual_contribution = values['annual_contribution']
+        rate_of_return = values['rate_of_return'] / 100  # Convert percentage to decimal
+        years = values['years']
+
+        # Calculate future value: lump sum growth plus an ordinary annuity of
+        # end-of-year contributions, sum((1 + r) ** k for k in range(years)).
+        growth = (1 + rate_of_return) ** years
+        if rate_of_return == 0:
+            contributions_value = annual_contribution * years
+        else:
+            contributions_value = annual_contribution * (growth - 1) / rate_of_return
+        future_value = initial_investment * growth + contributions_value
+
+        result = {
+            "initial_investment": initial_investment,
+            "annual_contribution": annual_contribution,
+            "rate_of_return": values['rate_of_return'],
+            "years": years,
+            "future_value": round(future_value, 2)
+        }
+
+        if values['include_trajectory']:
+            value = initial_investment
+            yearly_values = [round(value, 2)]
+            for _ in range(years):
+                value = value * (1 + rate_of_return) + annual_contribution
+                yearly_values.append(round(value, 2))
+            result["yearly_values"] = yearly_values
+
+        return result
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "initial_investment": 10000,
+        "annual_contribution": 2000,
+        "rate_of_return": 7,
+        "years": 10
+    }
+
+    result = investment_return_calculator(inputs)
+    print(result)
@@ -0,0 +1,54 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
+def loan_emi_calculator(inputs):
+    """
+    Calculates the Equated Monthly Installment (EMI) for a loan.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'loan_amount' (float): Principal amount of the loan.
+        - 'interest_rate' (float): Annual interest rate (percentage).
+        - 'loan_tenure' (int): Loan tenure in years.
+
+    Returns:
+    dict: A dictionary with the calculated EMI amount or an error message.
+    """
+    try:
+        values, errors = validate("loan_emi_calculator", inputs)
+        if errors:
+            return error_response(errors, "Loan amount and tenure must be positive. Interest rate must be non-negative.")
+
+        loan_amount = values['loan_amount']
+        interest_rate = values['interest_rate'] / 100 / 12  # Monthly rate
+        loan_tenure = values['loan_tenure'] * 12  # Tenure in months
+
+        if interest_rate == 0:
+            emi = loan_amount / loan_tenure
+        else:
+            emi = (loan_amount * interest_rate * ((1 + interest_rate) ** loan_tenure)) / (((1 + interest_rate) ** loan_tenure) - 1)
+
+        return {
+            "loan_amount": loan_amount,
+            "interest_rate": values['interest_rate'],
+            "loan_tenure_years": values['loan_tenure'],
+            "monthly_emi": round(emi, 2)
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "loan_amount": 500000,
+        "interest_rate": 7.5,
+        "loan_tenure": 10
+    }
+
+    result = loan_emi_calculator(inputs)
+    print(result)
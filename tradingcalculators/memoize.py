@@ -0,0 +1,206 @@
+"""
+Opt-in memoization for calculators.
+
+memoize() wraps a calculator with a thread-safe LRU cache keyed on its normalized
+inputs: key order does not matter and numbers are compared by value, so
+{"years": 10} and {"years": 10.0} hit the same entry. A hit skips input parsing,
+validation and computation entirely and returns a copy of the cached result (a
+deep copy when it holds lists, dicts or arrays), so callers cannot alter the
+cache. The cache is bounded by maxsize (least recently used entries are evicted
+first) and, optionally, by a per-entry ttl. Error results are never cached, and
+inputs that cannot be hashed (e.g. nested unhashable objects) bypass the cache.
+
+Network-backed calculators (NETWORK_CALCULATORS) are not pure, so
+memoized_calculator() refuses them unless a time_bucket is given; the current
+bucket (time // time_bucket) is then part of the key, so a cached answer is reused
+for at most one bucket.
+"""
+import collections
+import copy
+import functools
+import threading
+import time
+
+from . import NETWORK_CALCULATORS, get_calculator
+
+_MISSING = object()
+# Immutable result values; a result holding anything else (lists, dicts, arrays) is
+# deep-copied on every hit.
+_SCALARS = (int, float, str, type(None))
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache with an optional time-to-live and hit/miss counters.
+
+    Parameters:
+    maxsize (int): Maximum number of entries.
+    ttl (float): Seconds an entry stays valid (None = no expiry).
+    """
+
+    def __init__(self, maxsize=4096, ttl=None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.uncacheable = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        """
+        Returns the cached value for ``key``, or ``default`` (_MISSING) when absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() > expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, ttl=None):
+        """
+        Stores ``value`` under ``key``; ``ttl`` overrides the cache's time-to-live.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def note_uncacheable(self):
+        with self._lock:
+            self.uncacheable += 1
+
+    def clear(self):
+        """
+        Drops every entry and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = self.uncacheable = 0
+
+    def stats(self):
+        """
+        Returns the cache counters, current size and hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "uncacheable": self.uncacheable,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)  # Raises TypeError for unhashable objects.
+    return value
+
+
+def normalize_key(inputs):
+    """
+    Returns a hashable key for an inputs dict (raises TypeError if a value is unhashable).
+    """
+    try:
+        # Flat dicts of numbers and strings, the common case.
+        return frozenset(inputs.items())
+    except TypeError:
+        return _freeze(inputs)
+
+
+def memoize(calculator, maxsize=4096, ttl=None, time_bucket=None):
+    """
+    Wraps a calculator with an LRU cache.
+
+    Parameters:
+    calculator (callable): Calculator taking an inputs dict and returning a result dict.
+    maxsize (int): Maximum cached results.
+    ttl (float): Seconds a cached result stays valid (None = until evicted).
+    time_bucket (float): If set, results are only reused within the same
+        time // time_bucket window.
+
+    Returns:
+    callable: The memoized calculator, with ``cache`` (the LRUCache), ``cache_info()``
+        and ``cache_clear()`` attributes.
+    """
+    cache = LRUCache(maxsize, ttl)
+
+    @functools.wraps(calculator)
+    def memoized(inputs):
+        try:
+            key = normalize_key(inputs)
+        except TypeError:
+            cache.note_uncacheable()
+            return calculator(inputs)
+        if time_bucket:
+            key = (int(time.time() // time_bucket), key)
+
+        entry = cache.get(key)
+        if entry is _MISSING:
+            result = calculator(inputs)
+            if "error" in result:
+                return result
+            entry = (result, not all(isinstance(value, _SCALARS) for value in result.values()))
+            cache.put(key, entry)
+        result, nested = entry
+        # Callers get their own copy; nested lists/dicts/arrays are copied too.
+        return copy.deepcopy(result) if nested else dict(result)
+
+    memoized.cache = cache
+    memoized.cache_info = cache.stats
+    memoized.cache_clear = cache.clear
+    return memoized
+
+
+def memoized_calculator(name, maxsize=4096, ttl=None, time_bucket=None):
+    """
+    Returns a memoized version of the calculator registered under ``name``.
+
+    Raises:
+    KeyError: For unknown calculators.
+    ValueError: For network-backed calculators without a time_bucket.
+    """
+    calculator = get_calculator(name)
+    if name in NETWORK_CALCULATORS and not time_bucket:
+        raise ValueError(f"{name} fetches market data; pass time_bucket to memoize it.")
+    return memoize(calculator, maxsize=maxsize, ttl=ttl, time_bucket=time_bucket)
+
+
+if __name__ == "__main__":
+    # Example usage
+    roi = memoized_calculator("roi_calculator", maxsize=1024)
+    for _ in range(3):
+        roi({"initial_investment": 10000, "final_value": 15000})
+    roi({"initial_investment": 10000.0, "final_value": 15000})
+    print(roi({"initial_investment": 10000, "final_value": 15000}))
+    print(roi.cache_info())
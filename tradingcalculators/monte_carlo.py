@@ -0,0 +1,169 @@
+"""
+Monte Carlo projections for the future value, SIP and investment return calculators.
+
+Instead of one deterministic 'rate_of_return', annual returns are drawn per path
+from a normal, lognormal or bootstrapped historical distribution. Paths are
+simulated in fixed-size chunks, so memory is bounded by chunk_size x years no matter
+how many paths are requested; chunks can be spread over a process pool. Every
+chunk gets its own child of one SeedSequence, so results for a given seed are the
+same whatever the number of workers.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DISTRIBUTIONS = ("normal", "lognormal", "bootstrap")
+CALCULATORS = ("future_value", "sip", "investment_return")
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def _draw_returns(rng, distribution, mean, volatility, history, shape):
+    if distribution == "normal":
+        return np.maximum(rng.normal(mean, volatility, shape), -1.0)
+    if distribution == "lognormal":
+        # Match the arithmetic mean and volatility of the simple annual return.
+        sigma2 = np.log1p(volatility ** 2 / (1 + mean) ** 2)
+        mu = np.log1p(mean) - sigma2 / 2
+        return np.expm1(rng.normal(mu, np.sqrt(sigma2), shape))
+    return rng.choice(history, size=shape, replace=True)
+
+
+def _simulate_chunk(task):
+    """
+    Simulates one chunk of paths and returns their terminal values.
+    """
+    (seed, paths, calculator, years, initial_investment, contribution,
+     distribution, mean, volatility, history) = task
+    rng = np.random.default_rng(seed)
+    returns = _draw_returns(rng, distribution, mean, volatility, history, (paths, years))
+
+    value = np.full(paths, initial_investment)
+    for year in range(years):
+        if calculator == "sip":
+            # Twelve start-of-month contributions compounded at rate / 12, as in sip_calculator.
+            monthly_rate = returns[:, year] / 12
+            monthly_growth = (1 + monthly_rate) ** 12
+            with np.errstate(invalid="ignore", divide="ignore"):
+                annuity = np.where(monthly_rate == 0, 12.0,
+                                   (monthly_growth - 1) / monthly_rate * (1 + monthly_rate))
+            value = value * monthly_growth + contribution * annuity
+        elif calculator == "investment_return":
+            # End-of-year contributions, as in investment_return_calculator.
+            value = value * (1 + returns[:, year]) + contribution
+        else:
+            value = value * (1 + returns[:, year])
+    return value
+
+
+def monte_carlo_projection(inputs):
+    """
+    Simulates the distribution of terminal values for a projection.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'calculator' (str): 'future_value' (lump sum), 'sip' (monthly contributions) or
+          'investment_return' (lump sum plus annual contributions).
+        - 'initial_investment' (float): Starting amount (ignored for 'sip').
+        - 'monthly_investment' (float): Monthly contribution for 'sip'.
+        - 'annual_contribution' (float): Yearly contribution for 'investment_return'.
+        - 'years' (int): Projection horizon in years.
+        - 'distribution' (str): 'normal', 'lognormal' or 'bootstrap'.
+        - 'mean_return' (float): Expected annual return (percentage), for normal/lognormal.
+        - 'volatility' (float): Annual volatility (percentage), for normal/lognormal.
+        - 'historical_returns' (list): Annual returns (percentages) resampled by 'bootstrap'.
+        - 'paths' (int): Number of simulated paths (default 10,000).
+        - 'seed' (int, optional): Seed for reproducible results.
+        - 'percentiles' (list, optional): Percentiles to report (default 5, 25, 50, 75, 95).
+        - 'chunk_size' (int, optional): Paths simulated together (default 100,000).
+        - 'workers' (int, optional): Processes to use (default 1, i.e. in-process).
+
+    Returns:
+    dict: 'percentiles' (percentile -> terminal value), 'mean', 'probability_of_loss'
+        (share of paths ending below the amount invested) and 'paths', or an error message.
+    """
+    try:
+        calculator = inputs.get('calculator', 'future_value')
+        distribution = inputs.get('distribution', 'lognormal')
+        years = int(inputs.get('years', 0))
+        paths = int(inputs.get('paths', 10_000))
+        chunk_size = int(inputs.get('chunk_size', 100_000))
+        workers = int(inputs.get('workers', 1))
+        mean = float(inputs.get('mean_return', 0)) / 100
+        volatility = float(inputs.get('volatility', 0)) / 100
+        percentiles = list(inputs.get('percentiles') or DEFAULT_PERCENTILES)
+
+        if calculator not in CALCULATORS:
+            return {"error": f"Calculator must be one of {', '.join(CALCULATORS)}."}
+        if distribution not in DISTRIBUTIONS:
+            return {"error": f"Distribution must be one of {', '.join(DISTRIBUTIONS)}."}
+        if years <= 0 or paths <= 0 or chunk_size <= 0 or workers <= 0:
+            return {"error": "Years, paths, chunk size and workers must be positive."}
+        if volatility < 0 or mean <= -1:
+            return {"error": "Volatility must be non-negative and mean return above -100%."}
+
+        history = None
+        if distribution == "bootstrap":
+            history = np.asarray(inputs.get('historical_returns') or [], dtype=np.float64) / 100
+            if history.size == 0:
+                return {"error": "Bootstrap requires historical_returns."}
+
+        if calculator == "sip":
+            initial_investment = 0.0
+            contribution = float(inputs.get('monthly_investment', 0))
+            invested = contribution * 12 * years
+        else:
+            initial_investment = float(inputs.get('initial_investment', 0))
+            contribution = float(inputs.get('annual_contribution', 0)) if calculator == "investment_return" else 0.0
+            invested = initial_investment + contribution * years
+        if initial_investment < 0 or contribution < 0:
+            return {"error": "Investment amounts must be non-negative."}
+
+        chunk_sizes = [chunk_size] * (paths // chunk_size)
+        if paths % chunk_size:
+            chunk_sizes.append(paths % chunk_size)
+        seeds = np.random.SeedSequence(inputs.get('seed')).spawn(len(chunk_sizes))
+        tasks = [
+            (seed, size, calculator, years, initial_investment, contribution,
+             distribution, mean, volatility, history)
+            for seed, size in zip(seeds, chunk_sizes)
+        ]
+
+        if workers == 1 or len(tasks) == 1:
+            results = [_simulate_chunk(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_simulate_chunk, tasks))
+        terminal = np.concatenate(results)
+
+        values = np.percentile(terminal, percentiles)
+        return {
+            "calculator": calculator,
+            "distribution": distribution,
+            "years": years,
+            "paths": paths,
+            "percentiles": {p: round(float(v), 2) for p, v in zip(percentiles, values)},
+            "mean": round(float(terminal.mean()), 2),
+            "probability_of_loss": round(float((terminal < invested).mean()), 4)
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "calculator": "sip",
+        "monthly_investment": 2000,
+        "years": 10,
+        "distribution": "lognormal",
+        "mean_return": 12,
+        "volatility": 18,
+        "paths": 100000,
+        "seed": 42
+    }
+
+    result = monte_carlo_projection(inputs)
+    print(result)
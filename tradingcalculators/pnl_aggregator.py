@@ -0,0 +1,204 @@
+"""
+Streaming trade-blotter P&L.
+
+PnLAggregator consumes trades one at a time and keeps a single small position
+record per (account, symbol): signed quantity, average cost and realized P&L.
+Long and short positions and fractional quantities are supported; a trade that
+crosses zero closes the old position and opens the remainder on the other side.
+Memory is constant per open position, independent of the number of trades.
+
+Trades can come from any iterable of dicts or from a CSV/Parquet file read in
+chunks (see iter_trade_chunks). A trade dict has the following keys:
+    - 'account' (str, optional): Account identifier (defaults to '').
+    - 'symbol' (str): Instrument identifier.
+    - 'side' (str): 'buy' or 'sell'.
+    - 'quantity' (float): Units traded (positive; fractional allowed).
+    - 'price' (float): Execution price.
+    - 'fees' (float, optional): Commissions, charged to realized P&L.
+"""
+import csv
+import itertools
+
+
+class Position:
+    """
+    Open position state for one (account, symbol).
+    """
+    __slots__ = ("quantity", "average_cost", "realized")
+
+    def __init__(self):
+        self.quantity = 0.0
+        self.average_cost = 0.0
+        self.realized = 0.0
+
+    def apply(self, signed_quantity, price, fees=0.0):
+        """
+        Applies a trade of ``signed_quantity`` units (positive buys, negative sells).
+        """
+        self.realized -= fees
+        quantity = self.quantity
+        if quantity == 0 or (quantity > 0) == (signed_quantity > 0):
+            total = abs(quantity) + abs(signed_quantity)
+            self.average_cost = (abs(quantity) * self.average_cost + abs(signed_quantity) * price) / total
+            self.quantity = quantity + signed_quantity
+            return
+
+        closed = min(abs(signed_quantity), abs(quantity))
+        direction = 1.0 if quantity > 0 else -1.0
+        self.realized += closed * (price - self.average_cost) * direction
+        self.quantity = quantity + signed_quantity
+        if abs(self.quantity) < 1e-12:
+            self.quantity = 0.0
+            self.average_cost = 0.0
+        elif (self.quantity > 0) != (quantity > 0):
+            # Crossed through zero: the remainder is a new position at this price.
+            self.average_cost = price
+
+    def unrealized(self, mark_price):
+        return self.quantity * (mark_price - self.average_cost)
+
+
+class PnLAggregator:
+    """
+    Maintains realized and unrealized P&L per symbol and per account from a trade stream.
+    """
+
+    def __init__(self):
+        self.positions = {}
+        self.trade_count = 0
+
+    def process(self, trade):
+        """
+        Applies one trade dict (see the module docstring).
+
+        Raises:
+        ValueError: For unknown sides or non-positive quantities/prices.
+        """
+        quantity = float(trade['quantity'])
+        price = float(trade['price'])
+        side = str(trade['side']).lower()
+        if quantity <= 0 or price <= 0:
+            raise ValueError("Trade quantity and price must be positive.")
+        if side == "sell":
+            quantity = -quantity
+        elif side != "buy":
+            raise ValueError(f"Unknown side: {trade['side']!r}")
+
+        key = (trade.get('account') or '', trade['symbol'])
+        position = self.positions.get(key)
+        if position is None:
+            position = self.positions[key] = Position()
+        position.apply(quantity, price, float(trade.get('fees') or 0))
+        self.trade_count += 1
+
+    def consume(self, trades):
+        """
+        Applies every trade from an iterable of dicts or of chunks (lists of dicts),
+        such as the output of iter_trade_chunks().
+
+        Returns:
+        PnLAggregator: self, for chaining.
+        """
+        for item in trades:
+            if isinstance(item, list):
+                for trade in item:
+                    self.process(trade)
+            else:
+                self.process(item)
+        return self
+
+    def by_symbol(self, marks=None):
+        """
+        Returns P&L per (account, symbol).
+
+        Parameters:
+        marks (dict): Symbol -> mark price for unrealized P&L. Positions without a mark
+            report unrealized P&L as None.
+
+        Returns:
+        dict: (account, symbol) -> dict with 'quantity', 'average_cost', 'realized', 'unrealized'.
+        """
+        marks = marks or {}
+        result = {}
+        for (account, symbol), position in self.positions.items():
+            mark = marks.get(symbol)
+            result[(account, symbol)] = {
+                "quantity": position.quantity,
+                "average_cost": round(position.average_cost, 6),
+                "realized": round(position.realized, 2),
+                "unrealized": None if mark is None else round(position.unrealized(mark), 2),
+            }
+        return result
+
+    def by_account(self, marks=None):
+        """
+        Returns realized and unrealized P&L totals per account. Unrealized P&L only
+        includes positions that have a mark.
+
+        Returns:
+        dict: Account -> dict with 'realized', 'unrealized' and 'open_positions'.
+        """
+        marks = marks or {}
+        totals = {}
+        for (account, symbol), position in self.positions.items():
+            entry = totals.setdefault(account, {"realized": 0.0, "unrealized": 0.0, "open_positions": 0})
+            entry["realized"] += position.realized
+            if position.quantity != 0:
+                entry["open_positions"] += 1
+                if symbol in marks:
+                    entry["unrealized"] += position.unrealized(marks[symbol])
+        for entry in totals.values():
+            entry["realized"] = round(entry["realized"], 2)
+            entry["unrealized"] = round(entry["unrealized"], 2)
+        return totals
+
+
+def iter_trade_chunks(source, chunk_size=100_000):
+    """
+    Reads trades in chunks without loading the whole blotter.
+
+    Parameters:
+    source (str or iterable): Path to a .csv or .parquet file (Parquet requires pyarrow),
+        or an iterable of trade dicts.
+    chunk_size (int): Trades per chunk.
+
+    Yields:
+    list: Up to chunk_size trade dicts.
+    """
+    if isinstance(source, str):
+        if source.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+                yield batch.to_pylist()
+            return
+
+        with open(source, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+        return
+
+    iterator = iter(source)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+if __name__ == "__main__":
+    # Example usage
+    trades = [
+        {"account": "A1", "symbol": "AAPL", "side": "buy", "quantity": 10, "price": 100},
+        {"account": "A1", "symbol": "AAPL", "side": "sell", "quantity": 4.5, "price": 110},
+        {"account": "A1", "symbol": "TSLA", "side": "sell", "quantity": 2, "price": 250},
+        {"account": "A1", "symbol": "TSLA", "side": "buy", "quantity": 1, "price": 240},
+    ]
+
+    aggregator = PnLAggregator().consume(iter_trade_chunks(trades))
+    print(aggregator.by_symbol({"AAPL": 105, "TSLA": 245}))
+    print(aggregator.by_account({"AAPL": 105, "TSLA": 245}))
@@ -0,0 +1,63 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
+def portfolio_rebalancing_calculator(inputs):
+    """
+    Calculates the amounts needed to rebalance a portfolio to match target allocations.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'current_allocations' (dict): Current allocations in each asset (e.g., {'Stocks': 5000, 'Bonds': 3000}).
+        - 'target_allocations' (dict): Target allocation percentages (e.g., {'Stocks': 60, 'Bonds': 40}).
+          Percentages must sum to 100. Held assets without a target are fully liquidated, and
+          targeted assets that are not held are bought.
+
+    Returns:
+    dict: A dictionary with suggested rebalancing adjustments for each asset or an error message.
+    """
+    try:
+        values, errors = validate("portfolio_rebalancing_calculator", inputs)
+        if errors:
+            return error_response(errors)
+
+        current_allocations = values['current_allocations']
+        target_allocations = values['target_allocations']
+
+        if not current_allocations or not target_allocations:
+            return {"error": "Both current and target allocations must be provided."}
+
+        if any(value < 0 for value in target_allocations.values()):
+            return {"error": "Target allocations cannot be negative."}
+        if abs(sum(target_allocations.values()) - 100) > 1e-6:
+            return {"error": "Target allocations must sum to 100."}
+
+        total_current_value = sum(current_allocations.values())
+
+        rebalance_adjustments = {}
+        for asset in list(current_allocations) + [a for a in target_allocations if a not in current_allocations]:
+            current_value = current_allocations.get(asset, 0)
+            target_percentage = target_allocations.get(asset, 0) / 100
+            target_value = total_current_value * target_percentage
+            adjustment = target_value - current_value
+            rebalance_adjustments[asset] = round(adjustment, 2)
+
+        return {
+            "current_allocations": current_allocations,
+            "target_allocations": target_allocations,
+            "rebalance_adjustments": rebalance_adjustments
+        }
+
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "current_allocations": {"Stocks": 7000, "Bonds": 3000},
+        "target_allocations": {"Stocks": 60, "Bonds": 40}
+    }
+
+    result = portfolio_rebalancing_calculator(inputs)
+    print(result)
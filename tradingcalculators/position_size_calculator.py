@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def position_size_calculator(inputs):
     """
     Calculates the optimal position size based on risk tolerance, account size, and stop loss level.
@@ -14,13 +18,14 @@ def position_size_calculator(inputs):
     """
     try:
         # Extract and validate inputs
-        account_size = float(inputs.get('account_size', 0))
-        risk_percentage = float(inputs.get('risk_percentage', 0)) / 100  # Convert to decimal
-        entry_price = float(inputs.get('entry_price', 0))
-        stop_loss_price = float(inputs.get('stop_loss_price', 0))
+        values, errors = validate("position_size_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be positive and non-zero.")
 
-        if account_size < 0 or risk_percentage < 0 or entry_price <= 0 or stop_loss_price <= 0:
-            return {"error": "All input values must be positive and non-zero."}
+        account_size = values['account_size']
+        risk_percentage = values['risk_percentage'] / 100  # Convert to decimal
+        entry_price = values['entry_price']
+        stop_loss_price = values['stop_loss_price']
 
         # Calculate risk per unit (difference between entry and stop loss)
         risk_per_unit = abs(entry_price - stop_loss_price)
@@ -31,7 +36,7 @@ def position_size_calculator(inputs):
 
         return {
             "account_size": account_size,
-            "risk_percentage": inputs.get('risk_percentage', 0),
+            "risk_percentage": values['risk_percentage'],
             "entry_price": entry_price,
             "stop_loss_price": stop_loss_price,
             "dollar_risk": round(dollar_risk, 2),
@@ -41,15 +46,17 @@ def position_size_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "account_size": 10000,
-    "risk_percentage": 2,
-    "entry_price": 50,
-    "stop_loss_price": 47
-}
-
-result = position_size_calculator(inputs)
-print(result)
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "account_size": 10000,
+        "risk_percentage": 2,
+        "entry_price": 50,
+        "stop_loss_price": 47
+    }
+
+    result = position_size_calculator(inputs)
+    print(result)
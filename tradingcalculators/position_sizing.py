@@ -0,0 +1,136 @@
+"""
+Vectorized position sizing for many candidate signals at once.
+
+size_positions() applies the position_size_calculator rule (dollar risk divided by
+the entry-to-stop distance) to arrays of entries and stops, then enforces, in order:
+the per-position notional cap, per-sector risk caps, the total portfolio risk budget
+and lot rounding. Caps scale positions down pro rata, and lot rounding only rounds
+down, so every limit still holds after rounding. The whole call is a fixed number of
+NumPy operations, suitable for use inside a trading loop.
+"""
+import numpy as np
+
+
+def _per_position(values, size, name):
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 0:
+        return np.full(size, float(array))
+    if array.shape != (size,):
+        raise ValueError(f"{name} must be a scalar or have one value per signal.")
+    return array
+
+
+def _non_negative(values):
+    values = np.asarray(values, dtype=np.float64)
+    return bool((np.isfinite(values) & (values >= 0)).all())
+
+
+def size_positions(inputs):
+    """
+    Sizes a batch of trade signals under position, sector and portfolio risk limits.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'account_size' (float): Total size of the trading account.
+        - 'entry_prices' (array): Entry price per signal.
+        - 'stop_loss_prices' (array): Stop loss per signal (below entry for longs, above for shorts).
+        - 'risk_percentage' (float or array): Percentage of the account risked per position.
+        - 'portfolio_risk_percentage' (float, optional): Cap on the combined risk of all
+          positions, as a percentage of the account.
+        - 'sectors' (int array, optional): Sector code (0..n-1) per signal.
+        - 'sector_risk_percentage' (float or array, optional): Risk cap per sector, as a
+          percentage of the account (one value for all sectors or one per sector code).
+        - 'max_notional' (float or array, optional): Maximum position value per signal.
+        - 'lot_sizes' (float or array, optional): Units per tradable lot (default 1).
+
+    Returns:
+    dict: 'position_size' (units, signed: positive long, negative short), 'dollar_risk',
+        'notional', 'error_mask' (signals with invalid prices) arrays and the scalar
+        'total_risk', or an error message.
+    """
+    try:
+        account_size = float(inputs.get('account_size', 0))
+        entry = np.asarray(inputs.get('entry_prices'), dtype=np.float64).reshape(-1)
+        size = entry.size
+        stop = _per_position(inputs.get('stop_loss_prices'), size, "stop_loss_prices")
+        risk_percentage = _per_position(inputs.get('risk_percentage', 0), size, "risk_percentage") / 100
+        lot_sizes = _per_position(inputs.get('lot_sizes', 1), size, "lot_sizes")
+
+        if not (_non_negative(account_size) and _non_negative(risk_percentage)) or not (lot_sizes > 0).all():
+            return {"error": "Account size and risk must be non-negative, and lot sizes positive."}
+
+        # Negative caps and budgets would flip long positions into shorts.
+        max_notional = inputs.get('max_notional')
+        if max_notional is not None:
+            max_notional = _per_position(max_notional, size, "max_notional")
+        sector_cap = inputs.get('sector_risk_percentage')
+        portfolio_risk_percentage = inputs.get('portfolio_risk_percentage')
+        for cap in (max_notional, sector_cap, portfolio_risk_percentage):
+            if cap is not None and not _non_negative(cap):
+                return {"error": "max_notional, sector_risk_percentage and portfolio_risk_percentage "
+                                 "must be non-negative, finite numbers."}
+
+        risk_per_unit = np.abs(entry - stop)
+        error_mask = ~((entry > 0) & (stop > 0) & (risk_per_unit > 0))
+        risk_per_unit = np.where(error_mask, 1.0, risk_per_unit)
+        safe_entry = np.where(error_mask, 1.0, entry)
+
+        units = np.where(error_mask, 0.0, account_size * risk_percentage / risk_per_unit)
+
+        if max_notional is not None:
+            units = np.minimum(units, max_notional / safe_entry)
+
+        sectors = inputs.get('sectors')
+        if sectors is not None and sector_cap is not None:
+            sectors = np.asarray(sectors, dtype=np.int64).reshape(-1)
+            if sectors.shape != (size,) or (sectors < 0).any():
+                return {"error": "sectors must hold one non-negative sector code per signal."}
+            sector_count = int(sectors.max()) + 1 if size else 0
+            sector_cap = np.asarray(sector_cap, dtype=np.float64) / 100 * account_size
+            sector_cap = np.broadcast_to(sector_cap, (sector_count,)) if sector_cap.ndim == 0 else sector_cap
+            if sector_cap.shape[0] < sector_count:
+                return {"error": "sector_risk_percentage needs a value for every sector code."}
+            sector_risk = np.bincount(sectors, weights=units * risk_per_unit, minlength=sector_count)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                scale = np.where(sector_risk > sector_cap[:sector_count], sector_cap[:sector_count] / sector_risk, 1.0)
+            units = units * scale[sectors]
+
+        if portfolio_risk_percentage is not None:
+            budget = account_size * float(portfolio_risk_percentage) / 100
+            total = float(np.dot(units, risk_per_unit))
+            if total > budget:
+                units = units * (budget / total)
+
+        units = np.floor(units / lot_sizes + 1e-9) * lot_sizes
+        dollar_risk = units * risk_per_unit
+
+        return {
+            "position_size": np.where((stop > entry) & ~error_mask, -units, units),
+            "dollar_risk": dollar_risk,
+            "notional": units * safe_entry,
+            "error_mask": error_mask,
+            "total_risk": float(dollar_risk.sum()),
+        }
+
+    except (TypeError, ValueError) as e:
+        return {"error": f"Invalid input: {e}"}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "account_size": 100000,
+        "risk_percentage": 1,
+        "entry_prices": [50, 120, 30, 75],
+        "stop_loss_prices": [47, 114, 32, 72],
+        "portfolio_risk_percentage": 3,
+        "sectors": [0, 0, 1, 1],
+        "sector_risk_percentage": 1.5,
+        "max_notional": 40000,
+        "lot_sizes": [1, 1, 10, 1],
+    }
+
+    result = size_positions(inputs)
+    print(result)
@@ -0,0 +1,296 @@
+"""
+Price-history providers used by the beta calculators.
+
+A provider returns daily closing prices as ``{ticker: pandas.Series}`` (indexed by
+date) for a list of tickers and a yfinance-style period ('5d', '6mo', '1y', 'ytd',
+'max', ...). Three providers are available:
+
+    - YFinanceProvider: downloads all requested tickers with a single ``yf.download`` call.
+    - LocalFileProvider: reads ``<directory>/<TICKER>.csv`` files (Date, Close columns),
+      for fully offline runs.
+    - CachedProvider: wraps another provider with an in-memory cache and an on-disk
+      cache keyed by ticker, period and date. Both honour the TTL and are bounded
+      (max_entries series in memory, max_bytes on disk), evicting the least recently
+      used first.
+
+stock_beta_calculator uses get_default_provider() unless a provider is passed in,
+so a benchmark ticker such as '^GSPC' is downloaded once per run, not once per stock.
+"""
+import os
+import threading
+import time
+from datetime import date
+
+import pandas as pd
+
+from .instrumentation import io_phase
+from .memoize import LRUCache
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tradingcalculators", "prices")
+
+_PERIOD_OFFSETS = {
+    "d": lambda n: pd.DateOffset(days=n),
+    "wk": lambda n: pd.DateOffset(weeks=n),
+    "mo": lambda n: pd.DateOffset(months=n),
+    "y": lambda n: pd.DateOffset(years=n),
+}
+
+
+def _period_start(period, end):
+    """
+    Returns the first date covered by ``period`` when the history ends at ``end``,
+    or None for 'max'.
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(year=end.year, month=1, day=1)
+    for suffix in ("wk", "mo", "d", "y"):
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return end - _PERIOD_OFFSETS[suffix](int(period[:-len(suffix)]))
+    raise ValueError(f"Unsupported period: {period!r}")
+
+
+def _safe_name(ticker):
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in ticker)
+
+
+def _read_close_csv(path):
+    frame = pd.read_csv(path, index_col=0, parse_dates=True)
+    column = "Close" if "Close" in frame.columns else frame.columns[0]
+    series = frame[column].astype(float).dropna()
+    series.index.name = "Date"
+    series.name = "Close"
+    return series.sort_index()
+
+
+def _write_close_csv(series, path):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    series.rename("Close").to_frame().to_csv(tmp_path, index_label="Date")
+    os.replace(tmp_path, path)
+
+
+class PriceHistoryProvider:
+    """
+    Base class for price-history providers.
+    """
+
+    def fetch(self, tickers, period="1y"):
+        """
+        Fetches daily closing prices.
+
+        Parameters:
+        tickers (list): Ticker symbols to fetch.
+        period (str): History length (e.g., '1y').
+
+        Returns:
+        dict: Ticker -> pandas.Series of closes indexed by date. Tickers without data are omitted.
+        """
+        raise NotImplementedError
+
+    def fetch_one(self, ticker, period="1y"):
+        """
+        Fetches one ticker, returning an empty Series when no data is available.
+        """
+        return self.fetch([ticker], period).get(ticker, pd.Series(dtype=float))
+
+
+class YFinanceProvider(PriceHistoryProvider):
+    """
+    Downloads closing prices from Yahoo Finance, all tickers in one request.
+    """
+
+    def fetch(self, tickers, period="1y"):
+        import yfinance as yf
+
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return {}
+
+        with io_phase("yfinance"):
+            closes = yf.download(tickers, period=period, progress=False)['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+
+        history = {}
+        for ticker in tickers:
+            if ticker in closes.columns:
+                series = closes[ticker].dropna()
+                if not series.empty:
+                    history[ticker] = series.rename("Close")
+        return history
+
+
+class LocalFileProvider(PriceHistoryProvider):
+    """
+    Reads closing prices from ``<directory>/<TICKER>.csv`` files with Date and Close
+    columns (the layout written by ``yf.download(...).to_csv()`` and by CachedProvider).
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path_for(self, ticker):
+        return os.path.join(self.directory, f"{_safe_name(ticker)}.csv")
+
+    def fetch(self, tickers, period="1y"):
+        history = {}
+        for ticker in dict.fromkeys(tickers):
+            path = self.path_for(ticker)
+            if not os.path.exists(path):
+                continue
+            series = _read_close_csv(path)
+            if series.empty:
+                continue
+            start = _period_start(period, series.index[-1])
+            if start is not None:
+                series = series[series.index >= start]
+            history[ticker] = series
+        return history
+
+
+class CachedProvider(PriceHistoryProvider):
+    """
+    Caches another provider's results in memory and on disk.
+
+    Parameters:
+    provider (PriceHistoryProvider): Provider used for cache misses.
+    cache_dir (str): Directory for cached CSV files.
+    ttl (float): Seconds before a cached file (or in-memory entry) is considered stale.
+    max_bytes (int): Upper bound on the total size of the cache directory.
+    max_entries (int): Upper bound on the series kept in memory (least recently used
+        are dropped first).
+    """
+
+    def __init__(self, provider, cache_dir=DEFAULT_CACHE_DIR, ttl=12 * 60 * 60, max_bytes=256 * 1024 * 1024,
+                 max_entries=512):
+        self.provider = provider
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._memory = LRUCache(max_entries, ttl)
+        self._lock = threading.Lock()
+
+    def _path(self, ticker, period, as_of):
+        return os.path.join(self.cache_dir, f"{_safe_name(ticker)}__{period}__{as_of.isoformat()}.csv")
+
+    def _load(self, path):
+        """
+        Returns (series, seconds until the file goes stale), or (None, 0).
+        """
+        try:
+            remaining = self.ttl - (time.time() - os.path.getmtime(path))
+            if remaining <= 0:
+                return None, 0
+            series = _read_close_csv(path)
+            # Reads refresh the access time used for LRU eviction.
+            os.utime(path, (time.time(), os.path.getmtime(path)))
+            return series, remaining
+        except (OSError, ValueError, pd.errors.ParserError):
+            return None, 0
+
+    def fetch(self, tickers, period="1y"):
+        as_of = date.today()
+        history = {}
+        misses = []
+        for ticker in dict.fromkeys(tickers):
+            key = (ticker, period, as_of)
+            series = self._memory.get(key, None)
+            if series is None:
+                # Entries loaded from disk expire with their file, not a full ttl later.
+                series, remaining = self._load(self._path(ticker, period, as_of))
+                if series is not None:
+                    self._memory.put(key, series, remaining)
+            if series is None:
+                misses.append(ticker)
+            else:
+                history[ticker] = series
+
+        if misses:
+            fetched = self.provider.fetch(misses, period)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with self._lock:
+                for ticker, series in fetched.items():
+                    self._memory.put((ticker, period, as_of), series)
+                    _write_close_csv(series, self._path(ticker, period, as_of))
+                    history[ticker] = series
+                self.evict()
+        return history
+
+    def evict(self):
+        """
+        Removes stale files, then least recently used files until the cache fits in max_bytes.
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+
+        now = time.time()
+        entries = []
+        total = 0
+        for name in names:
+            if not name.endswith(".csv"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.ttl:
+                self._remove(path)
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """
+        Drops the in-memory cache (on-disk files are kept).
+        """
+        self._memory.clear()
+
+
+_default_provider = None
+_default_lock = threading.Lock()
+
+
+def get_default_provider():
+    """
+    Returns the process-wide provider: a CachedProvider around YFinanceProvider unless
+    set_default_provider() was called. ``TRADINGCALCULATORS_PRICE_DIR`` switches the
+    default to a LocalFileProvider for offline runs, and ``TRADINGCALCULATORS_CACHE_DIR``
+    overrides the cache location.
+    """
+    global _default_provider
+    with _default_lock:
+        if _default_provider is None:
+            price_dir = os.environ.get("TRADINGCALCULATORS_PRICE_DIR")
+            if price_dir:
+                _default_provider = LocalFileProvider(price_dir)
+            else:
+                cache_dir = os.environ.get("TRADINGCALCULATORS_CACHE_DIR", DEFAULT_CACHE_DIR)
+                _default_provider = CachedProvider(YFinanceProvider(), cache_dir=cache_dir)
+        return _default_provider
+
+
+def set_default_provider(provider):
+    """
+    Replaces the process-wide provider (pass None to restore the default).
+    """
+    global _default_provider
+    with _default_lock:
+        _default_provider = provider
@@ -0,0 +1,60 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
+def profit_loss_calculator(inputs):
+    """
+    Calculates the potential profit or loss for a trade based on entry and exit prices.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'entry_price' (float): Price at which the position was opened.
+        - 'exit_price' (float): Price at which the position is expected to be closed.
+        - 'quantity' (float): Number of shares traded (fractional quantities allowed).
+        - 'side' (str, optional): 'long' (default) or 'short'. A short position profits
+          when the exit price is below the entry price.
+
+    Returns:
+    dict: A dictionary with details of the trade including profit or loss.
+    """
+    try:
+        # Extract values from inputs with validation
+        values, errors = validate("profit_loss_calculator", inputs)
+        if errors:
+            if all(error['code'] == 'invalid_choice' for error in errors):
+                return error_response(errors, "Side must be 'long' or 'short'.")
+            return error_response(errors, "All input values must be positive and non-zero.")
+
+        entry_price = values['entry_price']
+        exit_price = values['exit_price']
+        quantity = values['quantity']
+        side = values['side']
+
+        # Calculate profit or loss
+        direction = 1 if side == 'long' else -1
+        profit_loss = (exit_price - entry_price) * quantity * direction
+
+        return {
+            "entry_price": entry_price,
+            "exit_price": exit_price,
+            "quantity": quantity,
+            "side": side,
+            "profit_loss": round(profit_loss, 2)
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "entry_price": 100,
+        "exit_price": 110,
+        "quantity": 50
+    }
+
+    result = profit_loss_calculator(inputs)
+    print(result)
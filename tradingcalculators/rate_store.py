@@ -0,0 +1,182 @@
+"""
+Exchange-rate store used by currency_converter.
+
+RateStore keeps the rates of every currency against one pivot currency (USD by
+default). A single source lookup returns the pivot's whole rate table, so N
+currencies need one fetch rather than N² pair lookups; any pair is derived as a
+cross rate through the pivot. Rates expire after a TTL and are refetched at most
+once per expiry, even when many threads ask at the same time.
+
+A store can be seeded from (and saved to) a JSON snapshot file:
+
+    {"pivot": "USD", "timestamp": 1760000000.0, "rates": {"EUR": 0.92, "INR": 83.1, ...}}
+
+With ``offline=True`` the store never calls its source and serves snapshot rates
+regardless of age, so pricing workers convert with zero network round-trips.
+"""
+import json
+import os
+import threading
+import time
+
+from .instrumentation import io_phase
+
+
+class RateNotAvailable(LookupError):
+    """
+    Raised when no rate is known for a currency and none can be fetched.
+    """
+
+
+class ForexPythonSource:
+    """
+    Fetches rate tables from forex-python (imported on first use).
+    """
+
+    def __init__(self):
+        self._rates = None
+
+    def get_rates(self, pivot):
+        """
+        Returns a dict of currency code -> units of that currency per one unit of ``pivot``.
+        """
+        if self._rates is None:
+            from forex_python.converter import CurrencyRates
+            self._rates = CurrencyRates()
+        with io_phase("forex_python"):
+            return self._rates.get_rates(pivot)
+
+
+class RateStore:
+    """
+    TTL-cached exchange rates with cross-rate derivation through a pivot currency.
+
+    Parameters:
+    source (object): Object with ``get_rates(pivot)``; defaults to ForexPythonSource.
+    pivot (str): Currency all stored rates are quoted against.
+    ttl (float): Seconds before the rate table is refetched.
+    offline (bool): Never call the source; serve whatever rates are loaded.
+    """
+
+    def __init__(self, source=None, pivot="USD", ttl=60 * 60, offline=False):
+        self.source = source if source is not None else ForexPythonSource()
+        self.pivot = pivot.upper()
+        self.ttl = ttl
+        self.offline = offline
+        self.fetch_count = 0
+        self._rates = {}
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self):
+        if self._fetched_at is None:
+            return False
+        return self.offline or time.time() - self._fetched_at <= self.ttl
+
+    def _refresh(self):
+        with self._lock:
+            # Another thread may have refreshed while this one waited for the lock.
+            if self._is_fresh() or self.offline:
+                return
+            rates = {code.upper(): float(rate) for code, rate in self.source.get_rates(self.pivot).items()}
+            rates[self.pivot] = 1.0
+            self._rates = rates
+            self._fetched_at = time.time()
+            self.fetch_count += 1
+
+    def rates(self):
+        """
+        Returns the current pivot rate table, refreshing it if it has expired.
+        """
+        if not self._is_fresh():
+            self._refresh()
+        return self._rates
+
+    def pivot_rate(self, currency):
+        """
+        Returns units of ``currency`` per one unit of the pivot currency.
+        """
+        currency = currency.upper()
+        if currency == self.pivot:
+            return 1.0
+        rate = self.rates().get(currency)
+        if rate is None or rate <= 0:
+            raise RateNotAvailable(f"No exchange rate available for {currency}.")
+        return rate
+
+    def get_rate(self, base_currency, target_currency):
+        """
+        Returns units of ``target_currency`` per one unit of ``base_currency``.
+        """
+        base_currency = base_currency.upper()
+        target_currency = target_currency.upper()
+        if base_currency == target_currency:
+            return 1.0
+        return self.pivot_rate(target_currency) / self.pivot_rate(base_currency)
+
+    def set_rates(self, rates, pivot=None, timestamp=None):
+        """
+        Replaces the rate table, e.g. with rates from an internal pricing feed.
+
+        Parameters:
+        rates (dict): Currency code -> units per one unit of the pivot.
+        pivot (str): Pivot the rates are quoted against (defaults to the store's pivot).
+        timestamp (float): When the rates were observed (defaults to now).
+        """
+        with self._lock:
+            if pivot is not None:
+                self.pivot = pivot.upper()
+            table = {code.upper(): float(rate) for code, rate in rates.items()}
+            table[self.pivot] = 1.0
+            self._rates = table
+            self._fetched_at = time.time() if timestamp is None else float(timestamp)
+
+    def load_snapshot(self, path):
+        """
+        Loads a JSON snapshot written by save_snapshot().
+        """
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self.set_rates(snapshot["rates"], pivot=snapshot.get("pivot"), timestamp=snapshot.get("timestamp"))
+
+    def save_snapshot(self, path):
+        """
+        Writes the current rate table to a JSON snapshot file, fetching it first if needed.
+        """
+        rates = self.rates()
+        snapshot = {"pivot": self.pivot, "timestamp": self._fetched_at, "rates": rates}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_default_rate_store():
+    """
+    Returns the process-wide RateStore. If ``TRADINGCALCULATORS_RATE_SNAPSHOT`` points at
+    a snapshot file, the store is loaded from it and runs offline.
+    """
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            snapshot_path = os.environ.get("TRADINGCALCULATORS_RATE_SNAPSHOT")
+            if snapshot_path:
+                store = RateStore(offline=True)
+                store.load_snapshot(snapshot_path)
+            else:
+                store = RateStore()
+            _default_store = store
+        return _default_store
+
+
+def set_default_rate_store(store):
+    """
+    Replaces the process-wide RateStore (pass None to restore the default).
+    """
+    global _default_store
+    with _default_lock:
+        _default_store = store
@@ -0,0 +1,202 @@
+"""
+Multi-year discounted cashflow model for leveraged rental property.
+
+Where real_estate_investment_calculator gives a single-year net yield, this model
+projects every year of the holding period:
+
+    gross rent       year-1 rent grown at rent_growth, less vacancy
+    expenses         year-1 expenses grown at expense_growth
+    NOI              effective rent - expenses
+    debt service     12 x the mortgage EMI (batch.monthly_emi, as in loan_emi_calculator)
+                     for the months of the year still inside the loan tenure
+    cash flow        NOI - debt service
+    exit             sale at property_value grown at appreciation_rate, less selling
+                     costs and the outstanding loan balance, in the final year
+
+and reports IRR (sip_engine.xirr_matrix over the yearly equity cashflows), year-1
+cash-on-cash return, year-1 and minimum DSCR, and the equity multiple.
+
+real_estate_dcf_batch() runs the model for a whole table of properties at once as
+(properties x years) arrays; real_estate_dcf() is the single-property calculator.
+All rates and percentages are annual percentages.
+"""
+import numpy as np
+
+from .batch import finish_results, monthly_emi
+from .instrumentation import record_exception
+from .results import column_to_list
+from .schema import error_response, validate, validate_columns
+from .sip_engine import xirr_matrix
+
+
+def _loan_balance(loan_amount, monthly_rate, months, emi, paid):
+    """
+    Outstanding principal after ``paid`` scheduled EMIs (0 once the loan is repaid).
+    """
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        growth = (1 + monthly_rate) ** paid
+        balance = np.where(
+            monthly_rate == 0,
+            loan_amount - emi * paid,
+            loan_amount * growth - emi * (growth - 1) / monthly_rate,
+        )
+    return np.where(paid >= months, 0.0, np.maximum(balance, 0.0))
+
+
+def real_estate_dcf_batch(columns, include_cash_flows=False):
+    """
+    Batch DCF model over a table of properties.
+
+    Parameters:
+    columns (mapping): Columns 'property_value', 'annual_rental_income' and
+        'annual_expenses' (year 1), plus optional 'rent_growth', 'expense_growth',
+        'vacancy_rate', 'appreciation_rate', 'holding_years' (default 10),
+        'down_payment' (% of price, default 100: no loan), 'interest_rate',
+        'loan_tenure' (years, default 30), 'closing_costs' (% of price paid at
+        purchase) and 'selling_costs' (% of the sale price).
+    include_cash_flows (bool): Also return 'yearly_cash_flows', a
+        (properties, max holding_years) array of levered cash flows before the sale.
+        Entries past a property's own holding period are NaN.
+
+    Returns:
+    dict: 'equity_invested', 'loan_amount', 'net_operating_income', 'debt_service',
+        'cash_flow' (year 1), 'cash_on_cash', 'dscr', 'min_dscr', 'sale_proceeds',
+        'irr', 'equity_multiple' and 'error_mask' arrays. cash_on_cash, irr and
+        equity_multiple are NaN when no equity is invested.
+    """
+    cols, error_mask, _ = validate_columns("real_estate_dcf", columns)
+    size = error_mask.size
+    property_value = cols["property_value"]
+    holding_years = np.where(error_mask, 1, cols["holding_years"]).astype(np.int64)
+    horizon = int(holding_years.max()) if size else 1
+
+    years = np.arange(1, horizon + 1)
+    in_hold = years <= holding_years[:, None]
+    elapsed = years - 1
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        rent_growth = (1 + cols["rent_growth"][:, None] / 100) ** elapsed
+        expense_growth = (1 + cols["expense_growth"][:, None] / 100) ** elapsed
+        effective_rent = cols["annual_rental_income"][:, None] * rent_growth * (1 - cols["vacancy_rate"][:, None] / 100)
+        noi = effective_rent - cols["annual_expenses"][:, None] * expense_growth
+
+        loan_amount = property_value * (1 - cols["down_payment"] / 100)
+        monthly_rate = cols["interest_rate"] / 100 / 12
+        months = cols["loan_tenure"] * 12
+        emi = np.where(loan_amount > 0, monthly_emi(loan_amount, monthly_rate, months), 0.0)
+        months_in_year = np.clip(months[:, None] - 12 * elapsed, 0, 12)
+        debt_service = emi[:, None] * months_in_year
+        cash_flows = np.where(in_hold, noi - debt_service, 0.0)
+
+        sale_price = property_value * (1 + cols["appreciation_rate"] / 100) ** holding_years
+        payoff = _loan_balance(loan_amount, monthly_rate, months, emi, 12 * holding_years)
+        sale_proceeds = sale_price * (1 - cols["selling_costs"] / 100) - payoff
+        equity = property_value * (cols["down_payment"] + cols["closing_costs"]) / 100
+
+        # Equity cashflows at t = 0 .. horizon; padding after the sale year stays 0.
+        amounts = np.zeros((size, horizon + 1))
+        amounts[:, 0] = -equity
+        amounts[:, 1:] = cash_flows
+        amounts[np.arange(size), holding_years] += sale_proceeds
+        amounts[error_mask] = 0.0
+        times = np.broadcast_to(np.arange(horizon + 1, dtype=np.float64), amounts.shape)
+        has_equity = equity > 0
+        # With no equity invested there is no return to measure (as for cash_on_cash).
+        irr = np.where(has_equity, xirr_matrix(amounts, times) * 100, np.nan)
+        cash_on_cash = np.where(has_equity, cash_flows[:, 0] / equity * 100, np.nan)
+        equity_multiple = np.where(has_equity, amounts[:, 1:].sum(axis=1) / equity, np.nan)
+        dscr_matrix = np.where(in_hold & (debt_service > 0), noi / debt_service, np.nan)
+        dscr = dscr_matrix[:, 0]
+        serviced = ~np.isnan(dscr_matrix).all(axis=1)
+        min_dscr = np.full(size, np.nan)
+        min_dscr[serviced] = np.nanmin(dscr_matrix[serviced], axis=1)
+
+    out = finish_results({
+        "equity_invested": equity,
+        "loan_amount": loan_amount,
+        "net_operating_income": noi[:, 0],
+        "debt_service": debt_service[:, 0],
+        "cash_flow": cash_flows[:, 0],
+        "cash_on_cash": cash_on_cash,
+        "dscr": dscr,
+        "min_dscr": min_dscr,
+        "sale_proceeds": sale_proceeds,
+        "irr": irr,
+        "equity_multiple": equity_multiple,
+    }, error_mask)
+    if include_cash_flows:
+        yearly_cash_flows = np.round(cash_flows, 2)
+        yearly_cash_flows[~in_hold | error_mask[:, None]] = np.nan
+        out["yearly_cash_flows"] = yearly_cash_flows
+    return out
+
+
+def real_estate_dcf(inputs):
+    """
+    Projects the yearly cash flows of one leveraged rental property and its returns.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'property_value' (float): Purchase price of the property.
+        - 'annual_rental_income' (float): Gross rent in the first year.
+        - 'annual_expenses' (float): Operating expenses in the first year.
+        - 'rent_growth' (float, optional): Annual rent growth (percentage).
+        - 'expense_growth' (float, optional): Annual expense growth (percentage).
+        - 'vacancy_rate' (float, optional): Share of rent lost to vacancy (percentage).
+        - 'appreciation_rate' (float, optional): Annual property appreciation (percentage).
+        - 'holding_years' (int, optional): Years until the sale (default 10).
+        - 'down_payment' (float, optional): Equity share of the price (percentage, default 100).
+        - 'interest_rate' (float, optional): Mortgage rate (annual percentage).
+        - 'loan_tenure' (int, optional): Mortgage tenure in years (default 30).
+        - 'closing_costs' (float, optional): Purchase costs (percentage of the price).
+        - 'selling_costs' (float, optional): Sale costs (percentage of the sale price).
+
+    Returns:
+    dict: A dictionary with the year-1 figures, IRR, cash-on-cash return, DSCR, equity
+        multiple and yearly cash flows, or an error message.
+    """
+    try:
+        values, errors = validate("real_estate_dcf", inputs)
+        if errors:
+            return error_response(errors)
+
+        result = real_estate_dcf_batch({field: [value] for field, value in values.items()}, include_cash_flows=True)
+
+        response = dict(values)
+        for field, column in result.items():
+            if field == "error_mask":
+                continue
+            if field == "yearly_cash_flows":
+                response[field] = column_to_list(column[0, :values['holding_years']])
+            else:
+                value = float(column[0])
+                response[field] = None if np.isnan(value) else value
+        return response
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "property_value": 300000,
+        "annual_rental_income": 24000,
+        "annual_expenses": 6000,
+        "rent_growth": 3,
+        "expense_growth": 2.5,
+        "vacancy_rate": 5,
+        "appreciation_rate": 3,
+        "holding_years": 10,
+        "down_payment": 25,
+        "interest_rate": 6.5,
+        "loan_tenure": 30,
+        "closing_costs": 2,
+        "selling_costs": 5,
+    }
+
+    result = real_estate_dcf(inputs)
+    print(result)
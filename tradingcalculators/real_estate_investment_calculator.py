@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def real_estate_investment_calculator(inputs):
     """
     Calculates the annual return on a real estate investment.
@@ -12,12 +16,13 @@ def real_estate_investment_calculator(inputs):
     dict: A dictionary with the calculated return on investment or an error message.
     """
     try:
-        property_value = float(inputs.get('property_value', 0))
-        annual_rental_income = float(inputs.get('annual_rental_income', 0))
-        annual_expenses = float(inputs.get('annual_expenses', 0))
+        values, errors = validate("real_estate_investment_calculator", inputs)
+        if errors:
+            return error_response(errors, "Property value must be positive, and income/expenses cannot be negative.")
 
-        if property_value <= 0 or annual_rental_income < 0 or annual_expenses < 0:
-            return {"error": "Property value must be positive, and income/expenses cannot be negative."}
+        property_value = values['property_value']
+        annual_rental_income = values['annual_rental_income']
+        annual_expenses = values['annual_expenses']
 
         annual_net_income = annual_rental_income - annual_expenses
         roi = (annual_net_income / property_value) * 100
@@ -33,14 +38,16 @@ def real_estate_investment_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "property_value": 300000,
-    "annual_rental_income": 24000,
-    "annual_expenses": 5000
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "property_value": 300000,
+        "annual_rental_income": 24000,
+        "annual_expenses": 5000
+    }
 
-result = real_estate_investment_calculator(inputs)
-print(result)
+    result = real_estate_investment_calculator(inputs)
+    print(result)
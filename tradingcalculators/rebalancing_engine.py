@@ -0,0 +1,133 @@
+"""
+Vectorized rebalancing for many accounts against shared model portfolios.
+
+rebalance_accounts() works on an (accounts x assets) matrix of holdings. Each
+account follows one of a small set of model weight vectors; target values,
+adjustments, minimum-trade filtering and lot rounding are all whole-matrix NumPy
+operations, so the cost grows linearly with the number of accounts.
+"""
+import numpy as np
+
+# Tolerance when checking that model weights sum to 100.
+_WEIGHT_TOLERANCE = 1e-6
+
+
+def holdings_matrix(accounts, assets=None):
+    """
+    Converts per-account allocation dicts into a holdings matrix.
+
+    Parameters:
+    accounts (list): One dict of asset -> current value per account.
+    assets (list): Column order; defaults to every asset seen, in first-seen order.
+
+    Returns:
+    tuple: (holdings matrix of shape (accounts, assets), list of asset names).
+    """
+    if assets is None:
+        assets = list(dict.fromkeys(asset for account in accounts for asset in account))
+    column = {asset: j for j, asset in enumerate(assets)}
+    holdings = np.zeros((len(accounts), len(assets)))
+    for i, account in enumerate(accounts):
+        for asset, value in account.items():
+            holdings[i, column[asset]] = value
+    return holdings, assets
+
+
+def rebalance_accounts(inputs):
+    """
+    Calculates the trades needed to move every account to its model portfolio.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'holdings' (2-D array): Current market value per account (rows) and asset (columns).
+        - 'model_weights' (1-D or 2-D array): Target percentages per asset, one row per model.
+          Each row must be non-negative and sum to 100. Assets with a 0 weight are liquidated.
+        - 'account_models' (1-D int array, optional): Model row used by each account.
+          Required when more than one model is given.
+        - 'prices' (1-D array, optional): Price per unit of each asset. Enables unit output
+          and lot rounding.
+        - 'lot_sizes' (scalar or 1-D array, optional): Units per tradable lot (default 1, i.e.
+          whole units). Buys and partial sells are rounded toward zero to whole lots.
+        - 'min_trade' (scalar or 1-D array, optional): Trades smaller than this value are
+          skipped. Full liquidations are always kept.
+
+    Returns:
+    dict: 'adjustments' (value to buy (+) or sell (-)), 'target_values', 'drift' (current minus
+        target weight, in percentage points), 'units' (when prices are given) and 'error_mask'
+        (accounts with invalid holdings or no value), or an error message.
+    """
+    try:
+        holdings = np.asarray(inputs.get('holdings'), dtype=np.float64)
+        model_weights = np.asarray(inputs.get('model_weights'), dtype=np.float64)
+        account_models = inputs.get('account_models')
+        prices = inputs.get('prices')
+        lot_sizes = inputs.get('lot_sizes', 1)
+        min_trade = inputs.get('min_trade', 0)
+
+        if holdings.ndim != 2:
+            return {"error": "Holdings must be a 2-D array of accounts x assets."}
+        if model_weights.ndim == 1:
+            model_weights = model_weights[None, :]
+        if model_weights.ndim != 2 or model_weights.shape[1] != holdings.shape[1]:
+            return {"error": "Model weights must have one column per asset."}
+        if (model_weights < 0).any() or not np.isfinite(model_weights).all():
+            return {"error": "Model weights must be finite and non-negative."}
+        if (np.abs(model_weights.sum(axis=1) - 100) > _WEIGHT_TOLERANCE).any():
+            return {"error": "Each model's weights must sum to 100."}
+
+        if account_models is None:
+            if model_weights.shape[0] != 1:
+                return {"error": "account_models is required when several models are given."}
+            weights = model_weights[0] / 100
+        else:
+            account_models = np.asarray(account_models, dtype=np.int64)
+            if account_models.shape != (holdings.shape[0],):
+                return {"error": "account_models must have one entry per account."}
+            if (account_models < 0).any() or (account_models >= model_weights.shape[0]).any():
+                return {"error": "account_models refers to a model that does not exist."}
+            weights = (model_weights / 100)[account_models]
+
+        error_mask = ~np.isfinite(holdings).all(axis=1) | (holdings < 0).any(axis=1)
+        holdings = np.where(error_mask[:, None], 0.0, holdings)
+        totals = holdings.sum(axis=1)
+        error_mask |= totals <= 0
+
+        target_values = totals[:, None] * weights
+        adjustments = target_values - holdings
+        liquidate = (weights == 0) & (holdings > 0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            drift = (holdings / totals[:, None] - weights) * 100
+
+        if prices is not None:
+            prices = np.asarray(prices, dtype=np.float64)
+            lot_sizes = np.broadcast_to(np.asarray(lot_sizes, dtype=np.float64), prices.shape)
+            if prices.shape != (holdings.shape[1],) or (prices <= 0).any() or (lot_sizes <= 0).any():
+                return {"error": "Prices and lot sizes must be positive, one per asset."}
+
+            units = adjustments / prices
+            # Round toward zero so no account overshoots its target or sells more than it holds.
+            units = np.trunc(units / lot_sizes) * lot_sizes
+            units = np.where(liquidate, -holdings / prices, units)
+            adjustments = units * prices
+
+        small = np.abs(adjustments) < np.asarray(min_trade, dtype=np.float64)
+        adjustments = np.where(small & ~liquidate, 0.0, adjustments)
+
+        adjustments[error_mask] = np.nan
+        target_values[error_mask] = np.nan
+        drift[error_mask] = np.nan
+        result = {
+            "adjustments": adjustments,
+            "target_values": target_values,
+            "drift": drift,
+        }
+        if prices is not None:
+            result["units"] = np.where(error_mask[:, None], np.nan, adjustments / prices)
+        result["error_mask"] = error_mask
+        return result
+
+    except (TypeError, ValueError):
+        return {"error": "Invalid input: Ensure holdings, weights and prices are numeric arrays."}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
@@ -0,0 +1,314 @@
+"""
+Compact result containers.
+
+Record is a slotted, read-only result row: fields are attributes, and the usual
+read-only mapping protocol (``record["future_value"]``, ``keys()``, ``items()``,
+``get()``, ``to_dict()``) works on it, so code written against result dicts keeps
+working. One Record subclass is generated (and cached) per distinct field tuple.
+
+RecordArray holds a whole batch result as columns (the dict of arrays returned by
+the batch functions). Rows are only materialised as Records when indexed or
+iterated, so a million-row result costs one array per field rather than a million
+dicts, and it can be written straight to columnar formats (structured arrays,
+pandas, Arrow/Parquet).
+"""
+import functools
+import math
+from collections.abc import Mapping
+
+
+class Record:
+    """
+    Base class of the generated slotted result records.
+    """
+    __slots__ = ()
+    _fields = ()
+
+    def __init__(self, *values, **named):
+        if len(values) > len(self._fields):
+            raise ValueError(f"Expected at most {len(self._fields)} values, got {len(values)}.")
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+        for field in self._fields[len(values):]:
+            if field not in named:
+                raise ValueError(f"Missing value for field {field!r}.")
+            object.__setattr__(self, field, named.pop(field))
+        if named:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(named))}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(getattr(self, field) for field in self._fields)
+
+    def items(self):
+        return tuple((field, getattr(self, field)) for field in self._fields)
+
+    def to_dict(self):
+        """
+        Returns the record as a plain dict (e.g., for JSON serialization).
+        """
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (_make_record, (self._fields, self.values()))
+
+    def __repr__(self):
+        body = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({body})"
+
+
+Mapping.register(Record)
+
+
+@functools.lru_cache(maxsize=256)
+def record_type(fields, name="Result"):
+    """
+    Returns the Record subclass with the given field names, creating it on first use.
+
+    Parameters:
+    fields (tuple): Field names (valid Python identifiers).
+    name (str): Class name of the generated type.
+
+    Returns:
+    type: A Record subclass with one slot per field.
+    """
+    fields = tuple(fields)
+    for field in fields:
+        if not field.isidentifier():
+            raise ValueError(f"Field names must be identifiers: {field!r}")
+    return type(name, (Record,), {"__slots__": fields, "_fields": fields})
+
+
+def _make_record(fields, values):
+    return record_type(tuple(fields))(*values)
+
+
+def column_to_list(values):
+    """
+    Converts a result column (list or NumPy array) into a list of JSON-friendly Python
+    values, with NaN as None.
+    """
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    return [None if isinstance(value, float) and math.isnan(value) else value for value in values]
+
+
+def to_record(result):
+    """
+    Converts a calculator result dict into a slotted Record.
+
+    Parameters:
+    result (dict): Result returned by a scalar calculator.
+
+    Returns:
+    Record: A record with the same keys and values.
+    """
+    return record_type(tuple(result))(*result.values())
+
+
+class RecordArray:
+    """
+    Column-backed sequence of result records.
+
+    Parameters:
+    columns (dict): Field name -> array with one entry (or row, for 2-D fields such as
+        'yearly_values') per record. All columns must have the same length.
+    error_mask (array, optional): Boolean array flagging rows the calculator rejected.
+    """
+    __slots__ = ("columns", "error_mask", "_length")
+
+    def __init__(self, columns, error_mask=None):
+        import numpy as np
+
+        self.columns = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(values) for values in self.columns.values()}
+        if error_mask is not None:
+            error_mask = np.asarray(error_mask, dtype=bool)
+            lengths.add(len(error_mask))
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+        self.error_mask = error_mask
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_batch(cls, result):
+        """
+        Wraps the dict of arrays returned by a batch calculator.
+        """
+        columns = {name: values for name, values in result.items() if name != "error_mask"}
+        return cls(columns, result.get("error_mask"))
+
+    @classmethod
+    def concat(cls, parts):
+        """
+        Concatenates RecordArrays with the same fields (e.g., results of consecutive chunks).
+        """
+        import numpy as np
+
+        parts = list(parts)
+        if not parts:
+            return cls({})
+        names = list(parts[0].columns)
+        columns = {}
+        for name in names:
+            pieces = [part.columns[name] for part in parts]
+            if pieces[0].ndim == 2:
+                # Pad ragged 2-D columns (trajectories of different horizons) with NaN.
+                width = max(piece.shape[1] for piece in pieces)
+                pieces = [
+                    np.pad(piece.astype(np.float64), ((0, 0), (0, width - piece.shape[1])), constant_values=np.nan)
+                    for piece in pieces
+                ]
+            columns[name] = np.concatenate(pieces)
+        error_mask = None
+        if all(part.error_mask is not None for part in parts):
+            error_mask = np.concatenate([part.error_mask for part in parts])
+        return cls(columns, error_mask)
+
+    @property
+    def fields(self):
+        """
+        Field names of the rows, including 'error_mask' when present.
+        """
+        names = tuple(self.columns)
+        return names + ("error_mask",) if self.error_mask is not None else names
+
+    def __len__(self):
+        return self._length
+
+    def _row(self, index):
+        values = []
+        for column in self.columns.values():
+            value = column[index]
+            values.append(value.tolist() if hasattr(value, "tolist") else value)
+        if self.error_mask is not None:
+            values.append(bool(self.error_mask[index]))
+        return record_type(self.fields)(*values)
+
+    def __getitem__(self, key):
+        """
+        An int returns one Record, a str returns that column, and a slice, index
+        array or boolean mask returns a new RecordArray.
+        """
+        if isinstance(key, str):
+            if key == "error_mask" and self.error_mask is not None:
+                return self.error_mask
+            return self.columns[key]
+        if isinstance(key, int):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError("RecordArray index out of range")
+            return self._row(key)
+        columns = {name: values[key] for name, values in self.columns.items()}
+        error_mask = self.error_mask[key] if self.error_mask is not None else None
+        return RecordArray(columns, error_mask)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._row(index)
+
+    def valid(self):
+        """
+        Returns the rows that are not flagged in error_mask.
+        """
+        if self.error_mask is None:
+            return self
+        return self[~self.error_mask]
+
+    def to_columns(self):
+        """
+        Returns the columns as a dict of arrays, with 'error_mask' when present.
+        """
+        columns = dict(self.columns)
+        if self.error_mask is not None:
+            columns["error_mask"] = self.error_mask
+        return columns
+
+    def to_structured(self):
+        """
+        Returns a NumPy structured array with one field per column (2-D columns become
+        sub-array fields).
+        """
+        import numpy as np
+
+        columns = self.to_columns()
+        dtype = [(name, values.dtype, values.shape[1:]) for name, values in columns.items()]
+        out = np.empty(self._length, dtype=dtype)
+        for name, values in columns.items():
+            out[name] = values
+        return out
+
+    def to_records(self):
+        """
+        Returns the rows as a list of plain dicts.
+        """
+        return [row.to_dict() for row in self]
+
+    def to_pandas(self):
+        """
+        Returns a pandas DataFrame (2-D columns are stored as one list per row).
+        """
+        import pandas as pd
+
+        return pd.DataFrame({
+            name: list(values) if values.ndim > 1 else values
+            for name, values in self.to_columns().items()
+        })
+
+    def to_arrow(self):
+        """
+        Returns a pyarrow Table (2-D columns become list columns).
+        """
+        import pyarrow as pa
+
+        return pa.table({
+            name: pa.array(values.tolist()) if values.ndim > 1 else pa.array(values)
+            for name, values in self.to_columns().items()
+        })
+
+    def __repr__(self):
+        return f"RecordArray(rows={self._length}, fields={list(self.fields)})"
+
+
+if __name__ == "__main__":
+    # Example usage
+    from .batch import sip_batch
+
+    results = RecordArray.from_batch(sip_batch({
+        "monthly_investment": [1000, 2000, -5],
+        "rate_of_return": 12,
+        "years": [5, 10, 10],
+    }))
+    print(results)
+    print(results[1], results[1]["future_value"])
+    print(results.to_structured())
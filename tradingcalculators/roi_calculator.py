@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def roi_calculator(inputs):
     """
     Calculates the Return on Investment (ROI).
@@ -11,11 +15,12 @@ def roi_calculator(inputs):
     dict: A dictionary with the calculated ROI percentage or an error message.
     """
     try:
-        initial_investment = float(inputs.get('initial_investment', 0))
-        final_value = float(inputs.get('final_value', 0))
+        values, errors = validate("roi_calculator", inputs)
+        if errors:
+            return error_response(errors, "Initial investment must be positive, and final value cannot be negative.")
 
-        if initial_investment <= 0 or final_value < 0:
-            return {"error": "Initial investment must be positive, and final value cannot be negative."}
+        initial_investment = values['initial_investment']
+        final_value = values['final_value']
 
         roi = ((final_value - initial_investment) / initial_investment) * 100
 
@@ -28,13 +33,15 @@ def roi_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "initial_investment": 10000,
-    "final_value": 15000
-}
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "initial_investment": 10000,
+        "final_value": 15000
+    }
 
-result = roi_calculator(inputs)
-print(result)
+    result = roi_calculator(inputs)
+    print(result)
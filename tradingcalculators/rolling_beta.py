@@ -0,0 +1,232 @@
+"""
+Rolling-window and exponentially weighted (EWMA) beta.
+
+RollingBeta and EwmaBeta are incremental estimators: each new (stock, market)
+return pair updates running sums in O(1) instead of recomputing covariance over
+the window. rolling_beta_series() and ewma_beta_series() produce the whole series
+for one or many tickers at once; the rolling version uses windowed differences of
+cumulative sums, so its cost does not depend on the window length.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+
+class RollingBeta:
+    """
+    Beta over the last ``window`` bars, updated in O(1) per bar.
+
+    Parameters:
+    window (int): Number of bars in the window (e.g., 60, 120, 252).
+    min_periods (int): Valid return pairs required inside the window before a beta is
+        reported (defaults to window).
+    """
+
+    # Running sums are rebuilt from the window this often to stop floating-point drift.
+    RESYNC_INTERVAL = 10_000
+
+    def __init__(self, window, min_periods=None):
+        if window < 2:
+            raise ValueError("window must be at least 2.")
+        self.window = window
+        self.min_periods = max(min_periods or window, 2)
+        self._pairs = deque()
+        self._valid = 0
+        self._updates = 0
+        self._reset_sums()
+
+    def _reset_sums(self):
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+        for pair in self._pairs:
+            if pair is not None:
+                self._add(pair[0], pair[1], 1.0)
+
+    def _add(self, x, y, sign):
+        self._sum_x += sign * x
+        self._sum_y += sign * y
+        self._sum_xx += sign * x * x
+        self._sum_xy += sign * x * y
+
+    def update(self, stock_return, market_return):
+        """
+        Adds one bar and returns the current beta (None until min_periods is reached).
+        A bar with a NaN return still advances the window but contributes no observation,
+        matching rolling_beta_series().
+        """
+        if math.isnan(stock_return) or math.isnan(market_return):
+            self._pairs.append(None)
+        else:
+            self._pairs.append((market_return, stock_return))
+            self._add(market_return, stock_return, 1.0)
+            self._valid += 1
+
+        if len(self._pairs) > self.window:
+            pair = self._pairs.popleft()
+            if pair is not None:
+                self._add(pair[0], pair[1], -1.0)
+                self._valid -= 1
+
+        self._updates += 1
+        if self._updates % self.RESYNC_INTERVAL == 0:
+            self._reset_sums()
+        return self.beta
+
+    @property
+    def beta(self):
+        n = self._valid
+        if n < self.min_periods:
+            return None
+        var_x = self._sum_xx - self._sum_x * self._sum_x / n
+        if var_x <= 0:
+            return None
+        return (self._sum_xy - self._sum_x * self._sum_y / n) / var_x
+
+
+class EwmaBeta:
+    """
+    Exponentially weighted beta, updated in O(1) per bar.
+
+    Parameters:
+    halflife (float): Number of observations over which a weight halves.
+    min_periods (int): Observations required before a beta is reported.
+    """
+
+    def __init__(self, halflife, min_periods=2):
+        if halflife <= 0:
+            raise ValueError("halflife must be positive.")
+        self.alpha = 1 - 0.5 ** (1 / halflife)
+        self.min_periods = max(min_periods, 2)
+        self.count = 0
+        self._mean_x = self._mean_y = 0.0
+        self._var_x = self._cov_xy = 0.0
+
+    def update(self, stock_return, market_return):
+        """
+        Adds one observation and returns the current beta (None until min_periods is reached).
+        Pairs containing NaN are ignored.
+        """
+        if math.isnan(stock_return) or math.isnan(market_return):
+            return self.beta
+
+        self.count += 1
+        if self.count == 1:
+            self._mean_x, self._mean_y = market_return, stock_return
+            return self.beta
+
+        a = self.alpha
+        dx = market_return - self._mean_x
+        dy = stock_return - self._mean_y
+        self._mean_x += a * dx
+        self._mean_y += a * dy
+        self._var_x = (1 - a) * (self._var_x + a * dx * dx)
+        self._cov_xy = (1 - a) * (self._cov_xy + a * dx * dy)
+        return self.beta
+
+    @property
+    def beta(self):
+        if self.count < self.min_periods or self._var_x <= 0:
+            return None
+        return self._cov_xy / self._var_x
+
+
+def _as_matrix(stock_returns, market_returns):
+    stock = np.asarray(stock_returns, dtype=np.float64)
+    market = np.asarray(market_returns, dtype=np.float64)
+    squeeze = stock.ndim == 1
+    if squeeze:
+        stock = stock[:, None]
+    if market.shape != (stock.shape[0],):
+        raise ValueError("market_returns must have one value per row of stock_returns.")
+    return stock, market, squeeze
+
+
+def rolling_beta_series(stock_returns, market_returns, window, min_periods=None):
+    """
+    Rolling-window beta for every date, using windowed differences of cumulative sums.
+
+    Parameters:
+    stock_returns (array-like): Returns of shape (dates,) or (dates, tickers); NaN where missing.
+    market_returns (array-like): Market returns of shape (dates,).
+    window (int): Window length in bars (rows).
+    min_periods (int): Paired observations required inside a window (defaults to window).
+
+    Returns:
+    numpy.ndarray: Betas with the shape of stock_returns; NaN until enough data is available.
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2.")
+    stock, market, squeeze = _as_matrix(stock_returns, market_returns)
+    min_periods = max(min_periods or window, 2)
+
+    mask = np.isfinite(stock) & np.isfinite(market)[:, None]
+    # Demeaning is shift-invariant for beta and limits cancellation in long cumulative sums.
+    x = np.where(mask, market[:, None] - np.nanmean(market), 0.0)
+    y = np.where(mask, stock - np.nanmean(np.where(mask, stock, np.nan), axis=0), 0.0)
+
+    def windowed(values):
+        cumulative = np.zeros((values.shape[0] + 1, values.shape[1]))
+        np.cumsum(values, axis=0, out=cumulative[1:])
+        lagged = np.zeros_like(cumulative[1:])
+        lagged[window:] = cumulative[1:-window]
+        return cumulative[1:] - lagged
+
+    n = windowed(mask.astype(np.float64))
+    sum_x = windowed(x)
+    sum_y = windowed(y)
+    sum_xx = windowed(x * x)
+    sum_xy = windowed(x * y)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var_x = sum_xx - sum_x * sum_x / n
+        beta = (sum_xy - sum_x * sum_y / n) / var_x
+    beta[(n < min_periods) | ~(var_x > 0)] = np.nan
+    return beta[:, 0] if squeeze else beta
+
+
+def ewma_beta_series(stock_returns, market_returns, halflife, min_periods=2):
+    """
+    EWMA beta for every date, vectorized across tickers.
+
+    Parameters:
+    stock_returns (array-like): Returns of shape (dates,) or (dates, tickers); NaN where missing.
+    market_returns (array-like): Market returns of shape (dates,).
+    halflife (float): Number of observations over which a weight halves.
+    min_periods (int): Observations required before a beta is reported.
+
+    Returns:
+    numpy.ndarray: Betas with the shape of stock_returns; NaN until enough data is available.
+    """
+    if halflife <= 0:
+        raise ValueError("halflife must be positive.")
+    stock, market, squeeze = _as_matrix(stock_returns, market_returns)
+    a = 1 - 0.5 ** (1 / halflife)
+    tickers = stock.shape[1]
+
+    count = np.zeros(tickers)
+    mean_x = np.zeros(tickers)
+    mean_y = np.zeros(tickers)
+    var_x = np.zeros(tickers)
+    cov_xy = np.zeros(tickers)
+    beta = np.full(stock.shape, np.nan)
+
+    for t in range(stock.shape[0]):
+        y = stock[t]
+        valid = np.isfinite(y) & np.isfinite(market[t])
+        first = valid & (count == 0)
+        later = valid & (count > 0)
+
+        mean_x = np.where(first, market[t], mean_x)
+        mean_y = np.where(first, y, mean_y)
+        dx = np.where(later, market[t] - mean_x, 0.0)
+        dy = np.where(later, y - mean_y, 0.0)
+        mean_x = mean_x + a * dx
+        mean_y = mean_y + a * dy
+        var_x = np.where(later, (1 - a) * (var_x + a * dx * dx), var_x)
+        cov_xy = np.where(later, (1 - a) * (cov_xy + a * dx * dy), cov_xy)
+        count += valid
+
+        ready = (count >= max(min_periods, 2)) & (var_x > 0)
+        beta[t, ready] = cov_xy[ready] / var_x[ready]
+
+    return beta[:, 0] if squeeze else beta
@@ -0,0 +1,182 @@
+"""
+Scenario grids (sensitivity tables) for any registered calculator.
+
+scenario_grid() evaluates a calculator over the Cartesian product of parameter
+axes, e.g. rate_of_return x years x monthly_investment for sip_calculator, and
+returns one N-dimensional array per result field with the axis labels alongside
+(dims/coords, in the order the axes were given).
+
+Calculators with a batch path (see ``BATCH_CALCULATORS``) are evaluated in a single
+broadcast batch call, so a 10^6-cell grid costs a few array operations. Other
+calculators are called once per cell, with the flat cell range split into chunks
+that run across a process pool when 'workers' > 1.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import get_batch_calculator, get_calculator, has_batch
+
+MAX_CELLS = 50_000_000
+
+
+def _grid_columns(axes, shape, start=0, stop=None):
+    """
+    Returns the flattened grid columns for cells start..stop in C order.
+    """
+    size = int(np.prod(shape))
+    stop = size if stop is None else stop
+    indices = np.unravel_index(np.arange(start, stop), shape)
+    return {name: values[index] for (name, values), index in zip(axes.items(), indices)}
+
+
+def _evaluate_chunk(task):
+    """
+    Calls the scalar calculator for one range of cells and collects numeric results.
+    """
+    name, fixed, axes, shape, start, stop = task
+    calculator = get_calculator(name)
+    columns = _grid_columns(axes, shape, start, stop)
+    names = list(columns)
+    rows = zip(*(column.tolist() for column in columns.values()))
+
+    fields = {}
+    error_mask = np.zeros(stop - start, dtype=bool)
+    for i, row in enumerate(rows):
+        inputs = dict(fixed)
+        inputs.update(zip(names, row))
+        result = calculator(inputs)
+        if "error" in result:
+            error_mask[i] = True
+            continue
+        for field, value in result.items():
+            if field in inputs or isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            column = fields.get(field)
+            if column is None:
+                column = fields[field] = np.full(stop - start, np.nan)
+            column[i] = value
+    return fields, error_mask
+
+
+def scenario_grid(inputs):
+    """
+    Evaluates a calculator over every combination of the given parameter values.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'calculator' (str): Registered calculator name (e.g., 'sip_calculator').
+        - 'axes' (dict): Input name -> list of values, one grid dimension per entry.
+        - 'fixed' (dict, optional): Inputs shared by every cell.
+        - 'fields' (list, optional): Result fields to return (default: all numeric results).
+        - 'workers' (int, optional): Processes for calculators without a batch path (default 1).
+        - 'chunk_size' (int, optional): Cells per task for those calculators (default 50,000).
+
+    Returns:
+    dict: 'dims' (axis names), 'coords' (axis name -> values), 'shape', 'values'
+        (field -> N-D array, NaN where the calculator returned an error) and
+        'error_mask' (N-D boolean array), or an error message.
+    """
+    try:
+        name = inputs.get('calculator')
+        axes = inputs.get('axes') or {}
+        fixed = dict(inputs.get('fixed') or {})
+        requested = inputs.get('fields')
+        workers = int(inputs.get('workers', 1))
+        chunk_size = int(inputs.get('chunk_size', 50_000))
+
+        if not axes:
+            return {"error": "At least one axis is required."}
+        if workers <= 0 or chunk_size <= 0:
+            return {"error": "Workers and chunk size must be positive."}
+        try:
+            get_calculator(name)
+        except KeyError:
+            return {"error": f"Unknown calculator: {name}"}
+
+        axes = {axis: np.asarray(list(values)) for axis, values in axes.items()}
+        if any(values.ndim != 1 or values.size == 0 for values in axes.values()):
+            return {"error": "Every axis needs a non-empty list of values."}
+        shape = tuple(values.size for values in axes.values())
+        size = int(np.prod(shape))
+        if size > MAX_CELLS:
+            return {"error": f"Grid has {size} cells; the limit is {MAX_CELLS}."}
+
+        if has_batch(name):
+            columns = dict(fixed)
+            columns.update(_grid_columns(axes, shape))
+            result = get_batch_calculator(name)(columns)
+            error_mask = np.asarray(result.pop("error_mask"))
+            fields = {field: np.asarray(values) for field, values in result.items()
+                      if np.asarray(values).shape[:1] == (size,)}
+        else:
+            tasks = [(name, fixed, axes, shape, start, min(start + chunk_size, size))
+                     for start in range(0, size, chunk_size)]
+            if workers == 1 or len(tasks) == 1:
+                parts = [_evaluate_chunk(task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    parts = list(pool.map(_evaluate_chunk, tasks))
+
+            error_mask = np.concatenate([mask for _, mask in parts])
+            names = list(dict.fromkeys(field for part, _ in parts for field in part))
+            fields = {
+                field: np.concatenate([
+                    part.get(field, np.full(mask.size, np.nan)) for part, mask in parts
+                ])
+                for field in names
+            }
+
+        if requested:
+            missing = [field for field in requested if field not in fields]
+            if missing:
+                return {"error": f"Unknown result fields: {', '.join(missing)}"}
+            fields = {field: fields[field] for field in requested}
+
+        return {
+            "calculator": name,
+            "dims": list(axes),
+            "coords": {axis: values.tolist() for axis, values in axes.items()},
+            "shape": shape,
+            "values": {field: values.reshape(shape + values.shape[1:]) for field, values in fields.items()},
+            "error_mask": error_mask.reshape(shape),
+        }
+
+    except ValueError as e:
+        return {"error": f"Invalid input: {e}"}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+def to_xarray(grid, field=None):
+    """
+    Converts a scenario_grid() result into an xarray DataArray (one field) or Dataset.
+
+    Parameters:
+    grid (dict): Result of scenario_grid().
+    field (str, optional): Result field to convert; all fields when omitted.
+    """
+    import xarray as xr
+
+    def array(values):
+        return xr.DataArray(values, dims=grid["dims"], coords=grid["coords"])
+
+    if field is not None:
+        return array(grid["values"][field]).rename(field)
+    return xr.Dataset({name: array(values) for name, values in grid["values"].items()})
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "calculator": "sip_calculator",
+        "axes": {
+            "rate_of_return": [8, 10, 12, 14],
+            "years": [5, 10, 15, 20],
+        },
+        "fixed": {"monthly_investment": 5000},
+    }
+
+    grid = scenario_grid(inputs)
+    print(grid["dims"], grid["coords"])
+    print(grid["values"]["future_value"])
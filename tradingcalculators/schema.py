@@ -0,0 +1,440 @@
+"""
+Declarative input specs and compiled validators for the calculators.
+
+Each calculator's inputs are described once in SPECS as a tuple of Field objects
+(name, type, default, bounds). At import time every spec is compiled into a plain
+Python function (generated source, one straight-line block per field), so
+validating a dict costs a few comparisons per field with no per-call interpretation
+of the spec. validate_columns() applies the same spec to whole NumPy columns for the
+batch paths.
+
+Errors are structured: a list of ``{"field", "code", "message"}`` dicts, where code is
+one of ERROR_CODES. error_response() turns them into the calculators' usual
+``{"error": ...}`` result, keeping the list under "errors".
+"""
+ERROR_CODES = ("invalid_type", "not_integer", "too_small", "too_large", "invalid_choice")
+
+
+class Field:
+    """
+    One input field of a calculator.
+
+    Parameters:
+    name (str): Key in the inputs dict.
+    kind (str): 'float', 'int', 'str', 'bool', 'list' or 'mapping'.
+    default (object): Value used when the key is missing.
+    ge, gt, le, lt (float): Inclusive/exclusive bounds for numeric fields.
+    choices (tuple): Allowed values for 'str' fields (compared after ``transform``).
+    transform (str): 'upper' or 'lower' applied to 'str' fields.
+    """
+    __slots__ = ("name", "kind", "default", "ge", "gt", "le", "lt", "choices", "transform")
+
+    def __init__(self, name, kind="float", default=0, ge=None, gt=None, le=None, lt=None,
+                 choices=None, transform=None):
+        if kind not in ("float", "int", "str", "bool", "list", "mapping"):
+            raise ValueError(f"Unknown field kind: {kind!r}")
+        self.name = name
+        self.kind = kind
+        self.default = default
+        self.ge = ge
+        self.gt = gt
+        self.le = le
+        self.lt = lt
+        self.choices = tuple(choices) if choices else None
+        self.transform = transform
+
+    @property
+    def numeric(self):
+        return self.kind in ("float", "int")
+
+    def bounds(self):
+        """
+        Yields (operator, limit, code, message) for each configured bound.
+        """
+        if self.ge is not None:
+            yield ">=", self.ge, "too_small", f"{self.name} must be at least {self.ge}."
+        if self.gt is not None:
+            yield ">", self.gt, "too_small", f"{self.name} must be greater than {self.gt}."
+        if self.le is not None:
+            yield "<=", self.le, "too_large", f"{self.name} must be at most {self.le}."
+        if self.lt is not None:
+            yield "<", self.lt, "too_large", f"{self.name} must be less than {self.lt}."
+
+
+def _money(name, default=0):
+    return Field(name, "float", default, ge=0)
+
+
+def _positive(name, default=0):
+    return Field(name, "float", default, gt=0)
+
+
+def _rate(name, default=0):
+    return Field(name, "float", default, ge=0)
+
+
+SPECS = {
+    "annualized_return_calculator": (
+        _positive("initial_investment"),
+        _money("final_value"),
+        _positive("years"),
+    ),
+    "capital_gains_tax_calculator": (
+        _money("purchase_price"),
+        _money("sale_price"),
+        Field("quantity", "int", 0, ge=0),
+        Field("holding_period", "int", 0, ge=0),
+        Field("tax_rate_short", "float", 15, ge=0, le=100),
+        Field("tax_rate_long", "float", 10, ge=0, le=100),
+    ),
+    "currency_converter": (
+        _money("amount"),
+        Field("base_currency", "str", "USD", transform="upper"),
+        Field("target_currency", "str", "INR", transform="upper"),
+    ),
+    "debt_to_income_ratio_calculator": (
+        Field("monthly_debt_payments", "float", 0),
+        _positive("monthly_income"),
+    ),
+    "dividend_yield_calculator": (
+        _money("annual_dividend"),
+        _positive("stock_price"),
+    ),
+    "expected_rate_of_return_calculator": (
+        _positive("initial_investment"),
+        _positive("future_value"),
+        _positive("years"),
+    ),
+    "fixed_deposit_interest_calculator": (
+        _money("principal"),
+        _rate("rate_of_interest"),
+        Field("years", "int", 0, gt=0),
+        Field("compounds_per_year", "int", 1, gt=0),
+    ),
+    "future_value_calculator": (
+        _money("initial_investment"),
+        _rate("rate_of_return"),
+        Field("years", "int", 0, ge=0),
+    ),
+    "inflation_impact_calculator": (
+        _money("current_amount"),
+        _rate("inflation_rate"),
+        Field("years", "int", 0, ge=0),
+    ),
+    "investment_return_calculator": (
+        _money("initial_investment"),
+        _money("annual_contribution"),
+        _rate("rate_of_return"),
+        Field("years", "int", 0, ge=0),
+        Field("include_trajectory", "bool", False),
+    ),
+    "loan_emi_calculator": (
+        _positive("loan_amount"),
+        _rate("interest_rate"),
+        Field("loan_tenure", "int", 0, gt=0),
+    ),
+    "portfolio_rebalancing_calculator": (
+        Field("current_allocations", "mapping", None),
+        Field("target_allocations", "mapping", None),
+    ),
+    "position_size_calculator": (
+        _money("account_size"),
+        _rate("risk_percentage"),
+        _positive("entry_price"),
+        _positive("stop_loss_price"),
+    ),
+    "profit_loss_calculator": (
+        _positive("entry_price"),
+        _positive("exit_price"),
+        _positive("quantity"),
+        Field("side", "str", "long", choices=("long", "short"), transform="lower"),
+    ),
+    "real_estate_investment_calculator": (
+        _positive("property_value"),
+        _money("annual_rental_income"),
+        _money("annual_expenses"),
+    ),
+    "real_estate_dcf": (
+        _positive("property_value"),
+        _money("annual_rental_income"),
+        _money("annual_expenses"),
+        Field("rent_growth", "float", 0, gt=-100),
+        Field("expense_growth", "float", 0, gt=-100),
+        Field("vacancy_rate", "float", 0, ge=0, le=100),
+        Field("appreciation_rate", "float", 0, gt=-100),
+        Field("holding_years", "int", 10, gt=0, le=100),
+        Field("down_payment", "float", 100, ge=0, le=100),
+        _rate("interest_rate"),
+        Field("loan_tenure", "int", 30, gt=0, le=100),
+        Field("closing_costs", "float", 0, ge=0, le=100),
+        Field("selling_costs", "float", 0, ge=0, le=100),
+    ),
+    "sip_engine_calculator": (
+        _money("monthly_investment"),
+        _rate("rate_of_return"),
+        # Bounded: the engine builds one array entry per month.
+        Field("years", "int", 0, ge=0, le=100),
+        _rate("annual_step_up"),
+        Field("skipped_months", "list", None),
+        Field("top_ups", "mapping", None),
+    ),
+    "roi_calculator": (
+        _positive("initial_investment"),
+        _money("final_value"),
+    ),
+    "sip_calculator": (
+        _money("monthly_investment"),
+        _rate("rate_of_return"),
+        Field("years", "int", 0, ge=0),
+    ),
+    "stock_beta_calculator": (
+        Field("stock_ticker", "str", None),
+        Field("market_ticker", "str", None),
+        Field("period", "str", "1y"),
+    ),
+}
+
+# Result fields of each scalar calculator (besides the echoed inputs) and their kinds
+# ('float', 'int', 'str', 'mapping' or 'list'). Tabular outputs use them to write the
+# same columns for every row, whether or not the first rows failed.
+RESULTS = {
+    "annualized_return_calculator": (("annualized_return", "float"),),
+    "capital_gains_tax_calculator": (("capital_gain", "float"), ("tax_due", "float")),
+    "currency_converter": (("exchange_rate", "float"), ("converted_amount", "str")),
+    "debt_to_income_ratio_calculator": (("dti_ratio", "float"),),
+    "dividend_yield_calculator": (("dividend_yield", "float"),),
+    "expected_rate_of_return_calculator": (("rate_of_return", "float"),),
+    "fixed_deposit_interest_calculator": (("maturity_value", "float"),),
+    "future_value_calculator": (("future_value", "float"),),
+    "inflation_impact_calculator": (("future_value_adjusted", "float"), ("purchasing_power_loss", "float")),
+    "investment_return_calculator": (("future_value", "float"),),
+    "loan_emi_calculator": (("loan_tenure_years", "int"), ("monthly_emi", "float")),
+    "portfolio_rebalancing_calculator": (("rebalance_adjustments", "mapping"),),
+    "position_size_calculator": (("dollar_risk", "float"), ("position_size", "int")),
+    "profit_loss_calculator": (("profit_loss", "float"),),
+    "real_estate_dcf": tuple((field, "float") for field in (
+        "equity_invested", "loan_amount", "net_operating_income", "debt_service", "cash_flow", "cash_on_cash",
+        "dscr", "min_dscr", "sale_proceeds", "irr", "equity_multiple",
+    )) + (("yearly_cash_flows", "list"),),
+    "real_estate_investment_calculator": (("annual_net_income", "float"), ("roi", "float")),
+    "roi_calculator": (("roi", "float"),),
+    "sip_calculator": (("future_value", "float"),),
+    "stock_beta_calculator": (("beta", "float"),),
+}
+
+# Result columns of the batch implementations (all float arrays, plus 'error_mask').
+BATCH_RESULTS = {
+    "currency_converter": ("converted_amount", "exchange_rate"),
+    "fixed_deposit_interest_calculator": ("maturity_value",),
+    "future_value_calculator": ("future_value",),
+    "inflation_impact_calculator": ("future_value_adjusted", "purchasing_power_loss"),
+    "investment_return_calculator": ("future_value",),
+    "loan_emi_calculator": ("monthly_emi",),
+    "real_estate_dcf": tuple(field for field, kind in RESULTS["real_estate_dcf"] if kind == "float"),
+    "sip_calculator": ("future_value",),
+}
+
+
+# Accepted spellings of booleans in string inputs (CSV cells, query strings, ...).
+BOOLEAN_STRINGS = {
+    "true": True, "t": True, "yes": True, "y": True, "on": True, "1": True,
+    "false": False, "f": False, "no": False, "n": False, "off": False, "0": False,
+}
+
+
+def parse_bool(value):
+    """
+    Parses a boolean input: bools and numbers as usual, strings by BOOLEAN_STRINGS
+    (case-insensitive). Returns None for anything else.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return BOOLEAN_STRINGS.get(value.strip().lower())
+    if isinstance(value, (int, float)) and value == value:
+        return bool(value)
+    return None
+
+
+def _field_source(index, field):
+    """
+    Returns the generated source lines validating one field.
+    """
+    name = field.name
+    lines = [f"    value = inputs.get({name!r}, _defaults[{index}])"]
+    fail = "        errors.append({{'field': {name!r}, 'code': {code!r}, 'message': {message!r}}})"
+
+    if field.kind in ("float", "int"):
+        lines += [
+            "    try:",
+            "        value = float(value)",
+            "    except (TypeError, ValueError):",
+            fail.format(name=name, code="invalid_type", message=f"{name} must be a number."),
+            "        value = None",
+            "    if value is not None and (value != value or value in (_INF, -_INF)):",
+            fail.format(name=name, code="invalid_type", message=f"{name} must be a finite number."),
+            "        value = None",
+        ]
+        if field.kind == "int":
+            lines += [
+                "    if value is not None:",
+                "        if value.is_integer():",
+                "            value = int(value)",
+                "        else:",
+                "    " + fail.format(name=name, code="not_integer", message=f"{name} must be a whole number."),
+                "            value = None",
+            ]
+        for operator, limit, code, message in field.bounds():
+            lines += [
+                f"    if value is not None and not (value {operator} {limit!r}):",
+                fail.format(name=name, code=code, message=message),
+            ]
+    elif field.kind == "str":
+        lines += [
+            "    if value is not None:",
+            "        value = str(value).strip()",
+        ]
+        if field.transform:
+            lines.append(f"        value = value.{field.transform}()")
+        if field.choices:
+            lines += [
+                f"        if value not in {field.choices!r}:",
+                "    " + fail.format(name=name, code="invalid_choice",
+                                     message=f"{name} must be one of {', '.join(field.choices)}."),
+            ]
+    elif field.kind == "bool":
+        lines += [
+            "    if value is None or (isinstance(value, str) and not value.strip()):",
+            f"        value = _defaults[{index}]",
+            "    value = parse_bool(value)",
+            "    if value is None:",
+            fail.format(name=name, code="invalid_type", message=f"{name} must be true or false."),
+        ]
+    elif field.kind == "list":
+        # A string is read as comma-separated items (e.g. a CSV cell "3,15").
+        lines += [
+            "    if value is None:",
+            "        value = []",
+            "    elif isinstance(value, str):",
+            "        value = [item.strip() for item in value.split(',') if item.strip()]",
+            "    elif hasattr(value, 'items') or not hasattr(value, '__iter__'):",
+            fail.format(name=name, code="invalid_type", message=f"{name} must be a list."),
+            "    else:",
+            "        value = list(value)",
+        ]
+    else:
+        lines += [
+            "    if value is None:",
+            "        value = {}",
+            "    elif not hasattr(value, 'items'):",
+            fail.format(name=name, code="invalid_type", message=f"{name} must be a mapping."),
+        ]
+
+    lines.append(f"    values[{name!r}] = value")
+    return lines
+
+
+def compile_validator(fields):
+    """
+    Generates a validator function for a tuple of Fields.
+
+    Parameters:
+    fields (tuple): Field objects.
+
+    Returns:
+    callable: ``validator(inputs) -> (values, errors)`` where values maps field name to the
+        coerced value (None for invalid numbers) and errors is a list of error dicts.
+    """
+    source = ["def validator(inputs):", "    values = {}", "    errors = []"]
+    for index, field in enumerate(fields):
+        source += _field_source(index, field)
+    source.append("    return values, errors")
+
+    namespace = {"_defaults": tuple(field.default for field in fields), "_INF": float("inf"),
+                 "parse_bool": parse_bool}
+    exec(compile("\n".join(source), "<tradingcalculators.schema>", "exec"), namespace)
+    validator = namespace["validator"]
+    validator.fields = fields
+    return validator
+
+
+VALIDATORS = {name: compile_validator(fields) for name, fields in SPECS.items()}
+
+
+def validate(name, inputs):
+    """
+    Validates and coerces one inputs dict against the spec registered under ``name``.
+
+    Returns:
+    tuple: (values dict, list of error dicts).
+    """
+    return VALIDATORS[name](inputs)
+
+
+def error_response(errors, range_message=None):
+    """
+    Builds a calculator error result from structured errors.
+
+    Parameters:
+    errors (list): Error dicts returned by a validator.
+    range_message (str): Message used when every error is a bound violation. Without it
+        the first error's own message is used.
+
+    Returns:
+    dict: ``{"error": message, "errors": errors}``.
+    """
+    if range_message is None:
+        message = errors[0]["message"]
+    elif any(error["code"] in ("invalid_type", "not_integer") for error in errors):
+        message = "Invalid input: Ensure all inputs are numbers."
+    else:
+        message = range_message
+    return {"error": message, "errors": errors}
+
+
+def validate_columns(name, columns):
+    """
+    Applies the numeric fields of a spec to whole columns.
+
+    Parameters:
+    name (str): Registered spec name.
+    columns (mapping): Column name -> array-like or scalar (see batch.as_columns).
+
+    Returns:
+    tuple: (dict of field -> 1-D float64 array, combined boolean error mask,
+        dict of field -> {code: boolean mask} for the codes that occurred).
+    """
+    import numpy as np
+
+    from .batch import as_columns
+
+    fields = [field for field in SPECS[name] if field.numeric]
+    values, _ = as_columns(columns, {field.name: field.default for field in fields})
+    size = next(iter(values.values())).size if values else 0
+    error_mask = np.zeros(size, dtype=bool)
+    field_errors = {}
+
+    for field in fields:
+        column = values[field.name]
+        masks = {"invalid_type": ~np.isfinite(column)}
+        if field.kind == "int":
+            masks["not_integer"] = ~masks["invalid_type"] & (np.trunc(column) != column)
+        with np.errstate(invalid="ignore"):
+            for operator, limit, code, _ in field.bounds():
+                if operator == ">=":
+                    bad = ~(column >= limit)
+                elif operator == ">":
+                    bad = ~(column > limit)
+                elif operator == "<=":
+                    bad = ~(column <= limit)
+                else:
+                    bad = ~(column < limit)
+                bad &= ~masks["invalid_type"]
+                masks[code] = masks[code] | bad if code in masks else bad
+
+        occurred = {code: mask for code, mask in masks.items() if mask.any()}
+        if occurred:
+            field_errors[field.name] = occurred
+            for mask in occurred.values():
+                error_mask |= mask
+    return values, error_mask, field_errors
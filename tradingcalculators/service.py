@@ -0,0 +1,340 @@
+"""
+Asynchronous HTTP service (ASGI) exposing every registered calculator.
+
+Routes:
+    GET  /calculators          Calculator names and whether each has a batch path.
+    POST /calculators/<name>   Runs a calculator. The JSON body is one of:
+                                 - an object: one call, returns the result object;
+                                 - a list of objects: one call per item, returns a list;
+                                 - {"columns": {...}}: the batch path (column -> list),
+                                   returns result columns plus 'error_mask'.
+    GET  /metrics              Request counts and p50/p99 latency per calculator.
+    GET  /cache                Memoization counters per calculator (when cache_size > 0).
+    GET  /instrumentation      Phase latencies and error counts (see ``instrumentation``);
+                               ?format=prometheus returns the Prometheus text format.
+    GET  /health               Liveness check.
+
+The event loop never blocks on calculators that hit the network
+(NETWORK_CALCULATORS): their calls run in a thread pool, and list bodies fan out
+over it concurrently. Large list bodies and batch bodies (more than offload_rows
+rows) are CPU work and go to a process pool in chunks; small requests are computed
+inline, since a microsecond calculation is cheaper than a hop to another process.
+With cache_size > 0, inline calls to pure calculators go through memoize.memoize(),
+so repeated identical requests skip parsing and computation.
+
+The app is a plain ASGI callable with no framework dependency. Serve it with any
+ASGI server, e.g.:
+
+    uvicorn --factory tradingcalculators.service:create_app
+    tradingcalculators serve --port 8000
+"""
+import asyncio
+import collections
+import json
+import math
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import NETWORK_CALCULATORS, available_calculators, get_batch_calculator, get_calculator, has_batch
+from . import instrumentation
+from .memoize import memoize
+from .results import column_to_list
+
+
+class BadRequest(ValueError):
+    """
+    Raised for request bodies the service cannot process (reported as HTTP 400).
+    """
+
+
+def _run_rows(name, rows):
+    calculator = get_calculator(name)
+    return [calculator(inputs) for inputs in rows]
+
+
+def _run_columns(name, columns):
+    result = get_batch_calculator(name)(columns)
+    return {field: column_to_list(values) for field, values in result.items()}
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """
+    Keeps the most recent request latencies per key and reports percentiles.
+
+    Parameters:
+    samples (int): Latencies kept per key (older ones are dropped).
+    """
+
+    def __init__(self, samples=10_000):
+        self.samples = samples
+        self._latencies = {}
+        self._counts = collections.Counter()
+        self._errors = collections.Counter()
+
+    def record(self, key, seconds, failed=False):
+        window = self._latencies.get(key)
+        if window is None:
+            window = self._latencies[key] = collections.deque(maxlen=self.samples)
+        window.append(seconds)
+        self._counts[key] += 1
+        if failed:
+            self._errors[key] += 1
+
+    def snapshot(self):
+        """
+        Returns key -> {'count', 'errors', 'p50_ms', 'p99_ms', 'max_ms'}.
+        """
+        report = {}
+        for key, window in self._latencies.items():
+            ordered = sorted(window)
+            report[key] = {
+                "count": self._counts[key],
+                "errors": self._errors[key],
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return report
+
+
+class CalculatorService:
+    """
+    ASGI application serving the calculators.
+
+    Parameters:
+    cpu_workers (int): Processes for CPU-heavy requests (default: one per CPU).
+    io_workers (int): Threads for network-backed calculators.
+    offload_rows (int): Requests with more rows than this go to the process pool,
+        split into chunks of this size.
+    max_body_bytes (int): Largest accepted request body.
+    latency_samples (int): Latencies kept per calculator for the percentiles.
+    cache_size (int): Results memoized per pure calculator (0 disables memoization).
+    cache_ttl (float): Seconds a memoized result stays valid (None = until evicted).
+    instrument (bool): Enables ``instrumentation`` for the whole process.
+    """
+
+    def __init__(self, cpu_workers=None, io_workers=16, offload_rows=1_000,
+                 max_body_bytes=64 * 1024 * 1024, latency_samples=10_000, cache_size=0, cache_ttl=None,
+                 instrument=False):
+        if offload_rows <= 0 or io_workers <= 0:
+            raise ValueError("offload_rows and io_workers must be positive.")
+        if instrument:
+            instrumentation.enable()
+        self.cpu_workers = cpu_workers
+        self.io_workers = io_workers
+        self.offload_rows = offload_rows
+        self.max_body_bytes = max_body_bytes
+        self.metrics = LatencyTracker(latency_samples)
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._memoized = {}
+        self._cpu_pool = None
+        self._io_pool = None
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+    @property
+    def cpu_pool(self):
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self._cpu_pool
+
+    @property
+    def io_pool(self):
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="calculator-io")
+        return self._io_pool
+
+    def calculator(self, name):
+        """
+        Returns the calculator used for inline calls, memoized when caching is enabled.
+        """
+        if not self.cache_size or name in NETWORK_CALCULATORS:
+            return get_calculator(name)
+        calculator = self._memoized.get(name)
+        if calculator is None:
+            calculator = self._memoized[name] = memoize(get_calculator(name), self.cache_size, self.cache_ttl)
+        return calculator
+
+    def _submit(self, pool, function, *args):
+        """
+        Submits ``function(*args)`` to ``pool`` and returns an awaitable for its result.
+        The future is tracked until done so shutdown() can cancel it.
+        """
+        future = pool.submit(function, *args)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return asyncio.wrap_future(future)
+
+    def _forget(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def shutdown(self):
+        """
+        Cancels queued work and stops the worker pools (running calls are not waited for).
+        """
+        # Cancelled by hand: Executor.shutdown(cancel_futures=True) needs Python 3.9.
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        for pool in (self._cpu_pool, self._io_pool):
+            if pool is not None:
+                pool.shutdown(wait=False)
+        self._cpu_pool = self._io_pool = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        method = scope["method"]
+        path = scope["path"].rstrip("/") or "/"
+
+        if path == "/health" and method == "GET":
+            return await self._send_json(send, 200, {"status": "ok"})
+        if path == "/metrics" and method == "GET":
+            return await self._send_json(send, 200, self.metrics.snapshot())
+        if path == "/cache" and method == "GET":
+            return await self._send_json(send, 200, {
+                name: calculator.cache_info() for name, calculator in self._memoized.items()
+            })
+        if path == "/instrumentation" and method == "GET":
+            if b"format=prometheus" in scope.get("query_string", b""):
+                return await self._send(send, 200, instrumentation.export("prometheus").encode("utf-8"),
+                                        b"text/plain; version=0.0.4")
+            return await self._send_json(send, 200, instrumentation.export("json"))
+        if path == "/calculators" and method == "GET":
+            return await self._send_json(send, 200, [
+                {"name": name, "batch": has_batch(name)} for name in available_calculators()
+            ])
+
+        prefix = "/calculators/"
+        if not path.startswith(prefix):
+            return await self._send_json(send, 404, {"error": "Not found."})
+        name = path[len(prefix):]
+        if name not in available_calculators():
+            return await self._send_json(send, 404, {"error": f"Unknown calculator: {name}"})
+        if method != "POST":
+            return await self._send_json(send, 405, {"error": "Use POST to run a calculator."})
+
+        start = time.perf_counter()
+        status = 200
+        try:
+            payload = json.loads(await self._read_body(receive) or b"{}")
+            response = await self.calculate(name, payload)
+        except (BadRequest, ValueError) as e:
+            status, response = 400, {"error": f"Invalid request: {e}"}
+        except Exception as e:
+            status, response = 500, {"error": f"An unexpected error occurred: {e}"}
+        self.metrics.record(name, time.perf_counter() - start, failed=status != 200)
+        await self._send_json(send, status, response)
+
+    async def _read_body(self, receive):
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            body = message.get("body", b"")
+            size += len(body)
+            if size > self.max_body_bytes:
+                raise BadRequest("request body too large")
+            chunks.append(body)
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send, status, body, content_type):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _send_json(self, send, status, payload):
+        await self._send(send, status, json.dumps(payload, default=str).encode("utf-8"), b"application/json")
+
+    async def calculate(self, name, payload):
+        """
+        Runs ``name`` for a decoded request body (object, list of objects or columns).
+        """
+        if isinstance(payload, dict) and "columns" in payload:
+            columns = payload["columns"]
+            if not isinstance(columns, dict) or not columns:
+                raise BadRequest("'columns' must be a non-empty object of lists")
+            if has_batch(name):
+                if name in NETWORK_CALCULATORS:
+                    return await self._submit(self.io_pool, _run_columns, name, columns)
+                rows = max((len(values) for values in columns.values() if isinstance(values, list)), default=1)
+                if rows > self.offload_rows:
+                    return await self._submit(self.cpu_pool, _run_columns, name, columns)
+                return _run_columns(name, columns)
+            # No batch path: evaluate row by row and return the results as a list.
+            names = list(columns)
+            payload = [dict(zip(names, row)) for row in zip(*columns.values())]
+
+        if isinstance(payload, dict):
+            if name in NETWORK_CALCULATORS:
+                return await self._submit(self.io_pool, get_calculator(name), payload)
+            return self.calculator(name)(payload)
+
+        if not isinstance(payload, list) or not all(isinstance(item, dict) for item in payload):
+            raise BadRequest("body must be an object, a list of objects or {'columns': {...}}")
+
+        if name in NETWORK_CALCULATORS:
+            calculator = get_calculator(name)
+            return list(await asyncio.gather(*(
+                self._submit(self.io_pool, calculator, inputs) for inputs in payload
+            )))
+        if len(payload) > self.offload_rows:
+            chunks = [payload[i:i + self.offload_rows] for i in range(0, len(payload), self.offload_rows)]
+            parts = await asyncio.gather(*(
+                self._submit(self.cpu_pool, _run_rows, name, chunk) for chunk in chunks
+            ))
+            return [result for part in parts for result in part]
+        calculator = self.calculator(name)
+        return [calculator(inputs) for inputs in payload]
+
+
+def create_app(**options):
+    """
+    Returns a new CalculatorService (see its parameters).
+    """
+    return CalculatorService(**options)
+
+
+def serve(host="127.0.0.1", port=8000, **options):
+    """
+    Serves the calculators with uvicorn (installed with the 'service' extra).
+    """
+    import uvicorn
+
+    uvicorn.run(create_app(**options), host=host, port=port)
+
+
+if __name__ == "__main__":
+    # Example usage
+    serve()
@@ -1,3 +1,7 @@
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+
 def sip_calculator(inputs):
     """
     Calculates the future value of a Systematic Investment Plan (SIP) with regular contributions
@@ -13,21 +17,25 @@ def sip_calculator(inputs):
     dict: A dictionary with details of the SIP including the future value or an error message.
     """
     try:
-        monthly_investment = float(inputs.get('monthly_investment', 0))
-        rate_of_return = float(inputs.get('rate_of_return', 0)) / 100  # Convert to decimal
-        years = int(inputs.get('years', 0))
-        
-        if monthly_investment < 0 or rate_of_return < 0 or years < 0:
-            return {"error": "All input values must be non-negative."}
+        values, errors = validate("sip_calculator", inputs)
+        if errors:
+            return error_response(errors, "All input values must be non-negative.")
+
+        monthly_investment = values['monthly_investment']
+        rate_of_return = values['rate_of_return'] / 100  # Convert to decimal
+        years = values['years']
         
         monthly_rate = rate_of_return / 12
         total_months = years * 12
         
-        future_value = monthly_investment * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
+        if monthly_rate == 0:
+            future_value = monthly_investment * total_months
+        else:
+            future_value = monthly_investment * (((1 + monthly_rate) ** total_months - 1) / monthly_rate) * (1 + monthly_rate)
         
         return {
             "monthly_investment": monthly_investment,
-            "rate_of_return": inputs.get('rate_of_return', 0),
+            "rate_of_return": values['rate_of_return'],
             "years": years,
             "future_value": round(future_value, 2)
         }
@@ -35,13 +43,15 @@ def sip_calculator(inputs):
     except ValueError:
         return {"error": "Invalid input: Ensure all inputs are numbers."}
     except Exception as e:
+        record_exception(e)
         return {"error": f"An unexpected error occurred: {e}"}
 
-# Example usage
-inputs = {
-    "monthly_investment": 2000,
-    "rate_of_return": 12,
-    "years": 10
-}
-result = sip_calculator(inputs)
-print(result)
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "monthly_investment": 2000,
+        "rate_of_return": 12,
+        "years": 10
+    }
+    result = sip_calculator(inputs)
+    print(result)
@@ -0,0 +1,295 @@
+"""
+SIP and cashflow engine with annual step-ups, skipped months, dated contributions
+and a vectorized XIRR solver.
+
+sip_engine_calculator() extends sip_calculator: contributions are still invested at
+the start of each month and compounded monthly, but the monthly amount can step up
+every year, individual months can be skipped and one-off top-ups added.
+dated_contributions_value() values arbitrary dated contributions on a valuation date.
+
+xirr() solves the annualized internal rate of return of one dated cashflow ledger
+(actual/365 day count, as spreadsheet XIRR). xirr_batch() solves many ledgers at
+once: ledgers are padded into an (ledgers x cashflows) matrix and every row takes
+Newton steps together; rows where Newton fails to converge fall back to vectorized
+bisection over a bracketing interval.
+"""
+from datetime import date
+
+import numpy as np
+
+from .capital_gains_lots import to_date
+from .instrumentation import record_exception
+from .schema import error_response, validate
+
+# Bounds on the annual rate searched by the bisection fallback.
+_XIRR_LOW = -0.999999
+_XIRR_HIGH = 100.0
+
+
+def contribution_schedule(monthly_investment, years, annual_step_up=0, skipped_months=(), top_ups=None):
+    """
+    Returns the contribution made at the start of each month.
+
+    Parameters:
+    monthly_investment (float): Amount invested every month in the first year.
+    years (int): Number of years the SIP runs.
+    annual_step_up (float): Percentage increase of the monthly amount every 12 months.
+    skipped_months (iterable): 1-based month numbers with no regular contribution.
+    top_ups (dict): 1-based month number -> extra one-off contribution.
+
+    Returns:
+    numpy.ndarray: Contribution per month, length years * 12.
+    """
+    total_months = int(years) * 12
+    step = np.arange(total_months) // 12
+    contributions = monthly_investment * (1 + annual_step_up / 100) ** step
+    for month in skipped_months:
+        if 1 <= int(month) <= total_months:
+            contributions[int(month) - 1] = 0.0
+    for month, amount in (top_ups or {}).items():
+        if 1 <= int(month) <= total_months:
+            contributions[int(month) - 1] += float(amount)
+    return contributions
+
+
+def _month_number(value):
+    month = float(value)
+    if not month.is_integer():
+        raise ValueError(f"Month numbers must be whole numbers, got {value!r}.")
+    return int(month)
+
+
+def sip_engine_calculator(inputs):
+    """
+    Calculates the future value of a SIP with optional step-ups, skipped months and top-ups.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'monthly_investment' (float): The amount invested every month in the first year.
+        - 'rate_of_return' (float): Expected annual rate of return (in percentage).
+        - 'years' (int): Number of years the SIP is invested.
+        - 'annual_step_up' (float, optional): Yearly increase of the monthly amount (percentage).
+        - 'skipped_months' (list, optional): 1-based month numbers without a contribution
+          (a string is read as comma-separated numbers).
+        - 'top_ups' (dict, optional): 1-based month number -> extra contribution.
+
+    Returns:
+    dict: A dictionary with the total invested, the future value and the gain, or an error message.
+    """
+    try:
+        values, errors = validate("sip_engine_calculator", inputs)
+        if errors:
+            return error_response(errors)
+
+        skipped_months = [_month_number(month) for month in values['skipped_months']]
+        top_ups = {_month_number(month): float(amount) for month, amount in values['top_ups'].items()}
+        contributions = contribution_schedule(
+            values['monthly_investment'], values['years'], values['annual_step_up'], skipped_months, top_ups,
+        )
+        if not np.isfinite(contributions).all() or (contributions < 0).any():
+            return {"error": "Contributions cannot be negative."}
+
+        total_months = contributions.size
+        monthly_rate = values['rate_of_return'] / 100 / 12
+        # A contribution at the start of month m compounds for (total_months - m + 1) months.
+        growth = (1 + monthly_rate) ** np.arange(total_months, 0, -1)
+        future_value = float(contributions @ growth)
+        total_invested = float(contributions.sum())
+
+        return {
+            "monthly_investment": values['monthly_investment'],
+            "rate_of_return": values['rate_of_return'],
+            "years": values['years'],
+            "annual_step_up": values['annual_step_up'],
+            "total_invested": round(total_invested, 2),
+            "future_value": round(future_value, 2),
+            "gain": round(future_value - total_invested, 2)
+        }
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure all inputs are numbers."}
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+def dated_contributions_value(contributions, rate_of_return, valuation_date=None):
+    """
+    Values dated contributions on a valuation date with annual compounding over
+    actual/365 year fractions.
+
+    Parameters:
+    contributions (iterable): (date, amount) pairs; dates may be date objects or ISO strings.
+    rate_of_return (float): Annual rate of return (percentage).
+    valuation_date (date or str): Defaults to today. Later contributions are ignored.
+
+    Returns:
+    dict: 'total_invested' and 'future_value'.
+    """
+    valuation_date = to_date(valuation_date) if valuation_date is not None else date.today()
+    ordinals = []
+    amounts = []
+    for when, amount in contributions:
+        ordinals.append(to_date(when).toordinal())
+        amounts.append(float(amount))
+    ordinals = np.asarray(ordinals, dtype=np.float64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+
+    years_held = (valuation_date.toordinal() - ordinals) / 365.0
+    included = years_held >= 0
+    value = amounts[included] @ (1 + rate_of_return / 100) ** years_held[included]
+    return {
+        "total_invested": round(float(amounts[included].sum()), 2),
+        "future_value": round(float(value), 2),
+    }
+
+
+def _npv_and_derivative(rate, amounts, times):
+    discount = np.exp(-times * np.log1p(rate)[:, None])
+    npv = np.sum(amounts * discount, axis=1)
+    derivative = np.sum(-times * amounts * discount, axis=1) / (1 + rate)
+    return npv, derivative
+
+
+def xirr_matrix(amounts, times, guess=0.1, tolerance=1e-10, max_iterations=50):
+    """
+    Solves XIRR for every row of a padded cashflow matrix.
+
+    Parameters:
+    amounts (2-D array): Cashflows per ledger (negative = invested, positive = received);
+        padding entries must be 0.
+    times (2-D array): Year fraction of each cashflow from the ledger's first date.
+    guess (float): Starting annual rate for Newton's method.
+    tolerance (float): Convergence threshold on the NPV relative to the ledger's gross flows.
+    max_iterations (int): Newton iterations before falling back to bisection.
+
+    Returns:
+    numpy.ndarray: Annual rate per ledger as a decimal (NaN when no sign change exists).
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    ledgers = amounts.shape[0]
+    scale = np.maximum(np.abs(amounts).sum(axis=1), 1e-300)
+
+    solvable = (amounts > 0).any(axis=1) & (amounts < 0).any(axis=1)
+    rate = np.full(ledgers, float(guess))
+    converged = ~solvable
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for _ in range(max_iterations):
+            active = ~converged
+            if not active.any():
+                break
+            npv, derivative = _npv_and_derivative(rate[active], amounts[active], times[active])
+            step = npv / derivative
+            new_rate = rate[active] - step
+            ok = np.isfinite(new_rate) & (new_rate > _XIRR_LOW)
+            rate[active] = np.where(ok, new_rate, rate[active])
+            done = ok & (np.abs(npv) <= tolerance * scale[active])
+            stalled = ~ok
+            index = np.flatnonzero(active)
+            converged[index[done]] = True
+            # Rows where Newton left the domain go straight to bisection.
+            converged[index[stalled]] = True
+            rate[index[stalled]] = np.nan
+
+        check = solvable & np.isfinite(rate)
+        if check.any():
+            npv, _ = _npv_and_derivative(rate[check], amounts[check], times[check])
+            bad = np.abs(npv) > np.sqrt(tolerance) * scale[check]
+            rate[np.flatnonzero(check)[bad]] = np.nan
+
+        fallback = solvable & ~np.isfinite(rate)
+        if fallback.any():
+            rate[fallback] = _bisect(amounts[fallback], times[fallback], tolerance)
+
+    rate[~solvable] = np.nan
+    return rate
+
+
+def _bisect(amounts, times, tolerance, iterations=200):
+    low = np.full(amounts.shape[0], _XIRR_LOW)
+    high = np.full(amounts.shape[0], _XIRR_HIGH)
+    f_low, _ = _npv_and_derivative(low, amounts, times)
+    f_high, _ = _npv_and_derivative(high, amounts, times)
+    bracketed = np.sign(f_low) != np.sign(f_high)
+
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        f_middle, _ = _npv_and_derivative(middle, amounts, times)
+        left = np.sign(f_middle) == np.sign(f_low)
+        low = np.where(left, middle, low)
+        f_low = np.where(left, f_middle, f_low)
+        high = np.where(left, high, middle)
+        if (high - low).max() < tolerance:
+            break
+    return np.where(bracketed, (low + high) / 2, np.nan)
+
+
+def xirr_batch(ledgers, guess=0.1):
+    """
+    Solves XIRR for many cashflow ledgers at once.
+
+    Parameters:
+    ledgers (iterable): Each ledger is an iterable of (date, amount) pairs.
+    guess (float): Starting annual rate (decimal).
+
+    Returns:
+    numpy.ndarray: Annual rate per ledger as a percentage (NaN when there is no solution).
+    """
+    ledgers = [list(ledger) for ledger in ledgers]
+    width = max((len(ledger) for ledger in ledgers), default=0)
+    amounts = np.zeros((len(ledgers), width))
+    times = np.zeros((len(ledgers), width))
+    for i, ledger in enumerate(ledgers):
+        if not ledger:
+            continue
+        ordinals = [to_date(when).toordinal() for when, _ in ledger]
+        first = min(ordinals)
+        times[i, :len(ledger)] = [(ordinal - first) / 365.0 for ordinal in ordinals]
+        amounts[i, :len(ledger)] = [float(amount) for _, amount in ledger]
+    return xirr_matrix(amounts, times, guess=guess) * 100
+
+
+def xirr(inputs):
+    """
+    Calculates the XIRR of one dated cashflow ledger.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'cashflows' (list): (date, amount) pairs; investments negative, withdrawals and
+          the final value positive.
+
+    Returns:
+    dict: A dictionary with the annualized 'xirr' percentage or an error message.
+    """
+    try:
+        cashflows = list(inputs.get('cashflows') or [])
+        amounts = [float(amount) for _, amount in cashflows]
+        if not any(amount > 0 for amount in amounts) or not any(amount < 0 for amount in amounts):
+            return {"error": "Cashflows need at least one negative and one positive amount."}
+
+        rate = xirr_batch([cashflows])[0]
+        if np.isnan(rate):
+            return {"error": "XIRR did not converge for these cashflows."}
+        return {"cashflows": len(cashflows), "xirr": round(float(rate), 4)}
+
+    except ValueError:
+        return {"error": "Invalid input: Ensure dates are ISO dates and amounts are numbers."}
+    except Exception as e:
+        return {"error": f"An unexpected error occurred: {e}"}
+
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "monthly_investment": 2000,
+        "rate_of_return": 12,
+        "years": 10,
+        "annual_step_up": 10,
+        "skipped_months": [13, 14],
+    }
+    print(sip_engine_calculator(inputs))
+
+    cashflows = [("2020-01-01", -10000), ("2021-01-01", -5000), ("2023-06-30", 19000)]
+    print(xirr({"cashflows": cashflows}))
@@ -0,0 +1,65 @@
+import numpy as np
+
+from .beta_engine import regress_on_market, returns_from_prices
+from .instrumentation import record_exception
+from .price_history import get_default_provider
+from .schema import validate
+
+def stock_beta_calculator(inputs):
+    """
+    Calculates the beta of a stock compared to the market index.
+
+    Parameters:
+    inputs (dict): A dictionary with the following keys:
+        - 'stock_ticker' (str): Ticker symbol of the stock.
+        - 'market_ticker' (str): Ticker symbol of the market index (e.g., '^GSPC' for S&P 500).
+        - 'period' (str): Period for historical data (e.g., '1y' for one year).
+        - 'provider' (PriceHistoryProvider, optional): Source of price history. Defaults to
+          the shared cached provider from price_history.get_default_provider().
+
+    Returns:
+    dict: A dictionary with the calculated beta value or an error message.
+    """
+    try:
+        values, _ = validate("stock_beta_calculator", inputs)
+        stock_ticker = values['stock_ticker']
+        market_ticker = values['market_ticker']
+        period = values['period']
+        provider = inputs.get('provider') or get_default_provider()
+
+        # Fetch historical data for both tickers in one request
+        history = provider.fetch([stock_ticker, market_ticker], period)
+        if stock_ticker not in history or market_ticker not in history:
+            return {"error": "Could not fetch sufficient data for calculation."}
+
+        # Align both return series by date before estimating covariance and variance
+        returns = returns_from_prices({"stock": history[stock_ticker], "market": history[market_ticker]})
+        returns = returns.dropna()
+
+        if len(returns) < 2:
+            return {"error": "Could not fetch sufficient data for calculation."}
+
+        beta = regress_on_market(returns["stock"].to_numpy(), returns["market"].to_numpy())["beta"][0]
+        if np.isnan(beta):
+            return {"error": "Market returns have no variance over the selected period."}
+
+        return {
+            "stock_ticker": stock_ticker,
+            "market_ticker": market_ticker,
+            "beta": round(float(beta), 2)
+        }
+
+    except Exception as e:
+        record_exception(e)
+        return {"error": f"An unexpected error occurred: {e}"}
+
+if __name__ == "__main__":
+    # Example usage
+    inputs = {
+        "stock_ticker": "AAPL",
+        "market_ticker": "^GSPC",  # S&P 500
+        "period": "1y"
+    }
+
+    result = stock_beta_calculator(inputs)
+    print(result)